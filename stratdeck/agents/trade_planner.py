@@ -5,9 +5,11 @@ import logging
 import os
 import sys
 from datetime import datetime, timedelta, timezone
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from ..filters import HumanRulesFilter
 from ..strategy_engine import (
     SymbolStrategyTask,
@@ -99,7 +101,8 @@ def generate_trade_ideas_for_tasks(
         try:
             from stratdeck.tools.scan_cache import store_scan_rows
 
-            store_scan_rows(scan_rows)
+            # Rows are annotated below, so keep an unannotated snapshot.
+            store_scan_rows(scan_rows, copy=True)
         except Exception as exc:  # pragma: no cover - defensive
             log.warning("[trade_planner] failed to persist scan rows: %s", exc)
 
@@ -159,13 +162,17 @@ def generate_trade_ideas(
 
 def _extract_price_from_quote(quote: Any) -> Tuple[Optional[float], Optional[str]]:
     """
-    Pull the first non-None price from a quote dict in mid→mark→last order.
+    Pull the first non-None price from a quote in mid→mark→last order.
+
+    Duck-typed on ``.get`` like pricing.last_price, so REST quote dicts and
+    DXLink SnapshotQuote tuples both resolve.
     """
-    if not isinstance(quote, dict):
+    get = getattr(quote, "get", None)
+    if get is None:
         return None, None
 
     for key in ("mid", "mark", "last"):
-        val = quote.get(key)
+        val = get(key)
         if val is None:
             continue
         try:
@@ -353,7 +360,7 @@ def _log_filter_decision(candidate: Dict[str, Any], decision: FilterDecision) ->
     log.debug("[filters] %s", payload)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeLeg:
     """
     A single options leg.
@@ -377,7 +384,7 @@ class TradeLeg:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeIdea:
     """
     A structured trade idea generated from TA + scout context.
@@ -396,8 +403,8 @@ class TradeIdea:
     legs: List[TradeLeg]
     # legs is canonical; short_legs/long_legs are derived views pointing to the
     # same TradeLeg instances so fields like delta/dte stay consistent.
-    short_legs: Optional[List[TradeLeg]] = None
-    long_legs: Optional[List[TradeLeg]] = None
+    short_legs: Optional[List[TradeLeg]] = field(default=None, compare=False)
+    long_legs: Optional[List[TradeLeg]] = field(default=None, compare=False)
     underlying_price_hint: Optional[float] = None
     dte_target: Optional[int] = None
     dte: Optional[int] = None
@@ -420,8 +427,10 @@ class TradeIdea:
     strategy_id: Optional[str] = None
     universe_id: Optional[str] = None
     filters_passed: Optional[bool] = None
-    filters_applied: Optional[Dict[str, float]] = None
-    filter_reasons: Optional[List[str]] = None  # reasons present even when passed
+    # Filter annotations describe how the idea was vetted, not the trade itself,
+    # so they are left out of equality.
+    filters_applied: Optional[Dict[str, float]] = field(default=None, compare=False)
+    filter_reasons: Optional[List[str]] = field(default=None, compare=False)  # reasons present even when passed
 
     def to_dict(self) -> Dict[str, Any]:
         d = asdict(self)
@@ -565,14 +574,18 @@ class TradePlanner:
         if not scan_rows or not tasks:
             return []
 
-        task_map: Dict[str, List[SymbolStrategyTask]] = {}
+        # Pair each task with its strategy's IVR mask once, so the row loop does
+        # a plain list walk instead of per-task dict lookups.
+        ivr_masks = self._ivr_gate_masks(scan_rows, tasks)
+        task_map: Dict[str, List[Tuple[SymbolStrategyTask, np.ndarray]]] = {}
         for task in tasks:
             key = str(task.symbol).upper()
-            task_map.setdefault(key, []).append(task)
+            task_map.setdefault(key, []).append((task, ivr_masks[id(task.strategy)]))
 
+        generate = self._generate_for_task
         ideas: List[TradeIdea] = []
 
-        for row in scan_rows:
+        for row_idx, row in enumerate(scan_rows):
             symbol = row.get("symbol")
             if not symbol:
                 continue
@@ -585,8 +598,17 @@ class TradePlanner:
             ta = row.get("ta") or {}
             per_symbol_ideas: List[TradeIdea] = []
 
-            for task in symbol_tasks:
-                idea = self._generate_for_task(
+            for task, ivr_mask in symbol_tasks:
+                if not ivr_mask[row_idx]:
+                    if DEBUG_FILTERS:
+                        log.debug(
+                            "IVR pre-gate rejected: symbol=%s strategy=%s ivr=%r",
+                            symbol_key,
+                            getattr(task.strategy, "name", None),
+                            self._row_ivr(row),
+                        )
+                    continue
+                idea = generate(
                     symbol=symbol_key,
                     row=row,
                     ta=ta,
@@ -595,9 +617,9 @@ class TradePlanner:
                 )
                 if idea is not None:
                     per_symbol_ideas.append(idea)
-
-            if not per_symbol_ideas:
-                continue
+                    # Ideas past max_per_symbol are discarded, so stop pricing.
+                    if len(per_symbol_ideas) >= max_per_symbol:
+                        break
 
             ideas.extend(per_symbol_ideas[:max_per_symbol])
 
@@ -605,6 +627,67 @@ class TradePlanner:
 
     # ---------- Internals ----------
 
+    @staticmethod
+    def _row_ivr(row: Dict[str, Any]) -> Any:
+        # Canonical IVR source is row["ivr"], with fallbacks for older scan row keys.
+        ivr = row.get("ivr")
+        if ivr is None:
+            ivr = row.get("iv_rank") or row.get("iv_rank_1y") or row.get("iv_rank_1yr")
+        return ivr
+
+    def _ivr_gate_masks(
+        self,
+        scan_rows: Sequence[Dict[str, Any]],
+        tasks: Sequence[SymbolStrategyTask],
+    ) -> Dict[int, np.ndarray]:
+        """
+        Vectorised IVR band check, one boolean mask over scan_rows per strategy.
+
+        IVR is the only filter metric known before chain pricing, and a row
+        outside a strategy's min_ivr/max_ivr band (or missing IVR while a band
+        is set) is always rejected by _evaluate_strategy_filters. Gating here
+        skips the chain/pricing calls for those (row, strategy) pairs without
+        changing which ideas come out. Masks are keyed by id(task.strategy).
+        """
+        ivrs = np.empty(len(scan_rows), dtype=np.float64)
+        missing = np.zeros(len(scan_rows), dtype=bool)
+        for idx, row in enumerate(scan_rows):
+            ivr = self._row_ivr(row)
+            if ivr is None:
+                missing[idx] = True
+                ivrs[idx] = np.nan
+                continue
+            try:
+                ivrs[idx] = float(ivr)
+            except (TypeError, ValueError):
+                ivrs[idx] = np.nan
+
+        # One (strategies x rows) comparison instead of a mask per strategy;
+        # unset bounds become +/-inf so they never reject a row.
+        strategies = list({id(task.strategy): task.strategy for task in tasks}.items())
+        bounds = np.empty((len(strategies), 2), dtype=np.float64)
+        for idx, (_, strategy) in enumerate(strategies):
+            filters = getattr(strategy, "filters", None)
+            min_ivr = getattr(filters, "min_ivr", None)
+            max_ivr = getattr(filters, "max_ivr", None)
+            bounds[idx, 0] = -np.inf if min_ivr is None else float(min_ivr)
+            bounds[idx, 1] = np.inf if max_ivr is None else float(max_ivr)
+
+        lo = bounds[:, :1]
+        hi = bounds[:, 1:]
+        in_band = (ivrs >= lo) & (ivrs <= hi)
+        # Only a missing (None) IVR is rejected by the filters. A NaN or
+        # unparseable value is passed through and left to the filters to judge;
+        # strategies without an IVR band accept every row.
+        unbounded = np.isneginf(lo) & np.isposinf(hi)
+        undecided = np.isnan(ivrs) & ~missing
+        matrix = in_band | unbounded | undecided
+
+        masks: Dict[int, np.ndarray] = {
+            key: matrix[idx] for idx, (key, _) in enumerate(strategies)
+        }
+        return masks
+
     def _get_provider_if_live(self) -> Optional["IDataProvider"]:
         mode = os.getenv("STRATDECK_DATA_MODE", "mock").lower()
         if mode != "live":
@@ -747,12 +830,7 @@ class TradePlanner:
             notes.append("[provenance] " + " ".join(provenance_parts))
         # ---------------------------------------------------------------------
 
-        # Canonical IVR source is row["ivr"], but we allow some fallbacks
-        ivr = row.get("ivr")
-        if ivr is None:
-            # Optional fallbacks if your scan rows currently use other keys.
-            # If you don't have these, you can drop this block or adapt it.
-            ivr = row.get("iv_rank") or row.get("iv_rank_1y") or row.get("iv_rank_1yr")
+        ivr = self._row_ivr(row)
 
         # --- Chain-based metrics (POP, credit_per_width, estimated_credit) -
         pop: Optional[float] = chain_metrics.get("pop")
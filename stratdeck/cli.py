@@ -60,6 +60,11 @@ LAST_TRADE_IDEAS_PATH = Path(".stratdeck/last_trade_ideas.json")
 LAST_POSITION_MONITORING_PATH = Path(".stratdeck/last_position_monitoring.json")
 
 
+def _utcnow() -> datetime:
+    # Single clock for the positions commands so tests can pin DTE/exit evaluation.
+    return datetime.now(timezone.utc)
+
+
 def _fmt_row(c: dict) -> str:
     # accepts POP/IVR as 0-1 or 0-100 and renders nicely
     pop = c.get("pop", 0)
@@ -289,16 +294,24 @@ def positions(ctx: click.Context) -> None:
         ctx.invoke(positions_list)
 
 
+def _list_positions(include_all: bool = False) -> List[PaperPosition]:
+    store = PositionsStore(POS_PATH)
+    return store.list_positions(status=None if include_all else "open")
+
+
+def _positions_list_payload(include_all: bool = False) -> List[Dict[str, Any]]:
+    """Rows emitted by ``positions list --json-output``."""
+    return [p.model_dump(mode="json") for p in _list_positions(include_all)]
+
+
 @positions.command("list")
 @click.option("--all", "include_all", is_flag=True, help="Include closed positions.")
 @click.option("--json-output", is_flag=True, help="Emit JSON instead of human-readable text.")
 def positions_list(include_all: bool, json_output: bool) -> None:
-    store = PositionsStore(POS_PATH)
-    pos_list = store.list_positions(status=None if include_all else "open")
     if json_output:
-        payload = [p.model_dump(mode="json") for p in pos_list] if pos_list else []
-        click.echo(json.dumps(payload, indent=2, default=str))
+        click.echo(json.dumps(_positions_list_payload(include_all), indent=2, default=str))
         return
+    pos_list = _list_positions(include_all)
     if not pos_list:
         click.echo("No positions found.")
         return
@@ -356,7 +369,7 @@ def positions_monitor(json_output: bool) -> None:
 
     provider = get_provider()
     snapshot = load_snapshot()
-    now = datetime.now(timezone.utc)
+    now = _utcnow()
 
     items = _monitor_snapshot(open_positions, provider, snapshot, now)
 
@@ -406,7 +419,7 @@ def positions_close_auto(dry_run: bool, json_output: bool) -> None:
 
     provider = get_provider()
     snapshot = load_snapshot()
-    now = datetime.now(timezone.utc)
+    now = _utcnow()
 
     items = _monitor_snapshot(open_positions, provider, snapshot, now)
     closed: List[Dict[str, Any]] = []
@@ -469,7 +482,7 @@ def positions_close(position_id: str, reason: Optional[str], dry_run: bool, json
 
     provider = get_provider()
     snapshot = load_snapshot()
-    now = datetime.now(timezone.utc)
+    now = _utcnow()
 
     rules = load_exit_rules(pos.strategy_id or pos.strategy or "")
     metrics = compute_position_metrics(
@@ -1074,17 +1087,7 @@ def trade_ideas(
         dte_target=dte_target,
         max_per_symbol=max_per_symbol,
     )
-    if ideas:
-        if hasattr(ideas[0], "model_dump"):
-            payload = [idea.model_dump(mode="json") for idea in ideas]
-        elif hasattr(ideas[0], "dict"):
-            payload = [idea.dict() for idea in ideas]
-        elif hasattr(ideas[0], "to_dict"):
-            payload = [idea.to_dict() for idea in ideas]
-        else:
-            payload = [idea.__dict__ for idea in ideas]
-    else:
-        payload = []
+    payload = [_idea_payload(idea) for idea in ideas or []]
 
     store_trade_ideas(ideas or [])
     persist_last_ideas(payload, path=LAST_TRADE_IDEAS_PATH)
@@ -1469,7 +1472,7 @@ def ideas_vet(qty: int, ideas_path: Path, json_output: bool, output_path: Option
         payload: List[Dict[str, Any]] = []
         for idea, vetting in vetted:
             idea_payload = _idea_payload(idea)
-            idea_payload["vetting"] = vetting.model_dump(mode="json")
+            idea_payload["vetting"] = vetting.to_dict()
             payload.append(idea_payload)
 
         blob = json.dumps(payload, indent=2, default=str)
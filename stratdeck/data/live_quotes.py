@@ -2,16 +2,29 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import os
+import sys
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
 from typing import Any, Dict, Iterable, Optional, Sequence, Set
 
 
 log = logging.getLogger(__name__)
 
+# Interned upper-case symbols. The scan universe is small and every quote path
+# normalises the same handful of tickers, so a dict hit replaces str.upper().
+_UPPER_CACHE: Dict[str, str] = {}
+
+
+def _upper(symbol: str) -> str:
+    upper = _UPPER_CACHE.get(symbol)
+    if upper is None:
+        upper = _UPPER_CACHE[symbol] = sys.intern(symbol.upper())
+    return upper
+
 
 def make_tasty_streaming_session_from_env() -> Optional[Any]:
     """
@@ -51,17 +64,20 @@ def make_tasty_streaming_session_from_env() -> Optional[Any]:
         return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuoteSnapshot:
     symbol: str
-    bid: Optional[Decimal]
-    ask: Optional[Decimal]
-    mid: Optional[Decimal]
-    asof: datetime
+    bid: Optional[float]
+    ask: Optional[float]
+    mid: Optional[float]
+    asof: float  # unix timestamp (time.time()) of the tick
+
+    @property
+    def asof_dt(self) -> datetime:
+        return datetime.fromtimestamp(self.asof, tz=timezone.utc)
 
     def is_fresh(self, max_age: timedelta) -> bool:
-        now = datetime.now(timezone.utc)
-        return (now - self.asof) <= max_age
+        return (time.time() - self.asof) <= max_age.total_seconds()
 
 
 class LiveMarketDataService:
@@ -87,6 +103,7 @@ class LiveMarketDataService:
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._lock = threading.RLock()
+        self._quote_cond = threading.Condition(self._lock)
         self._quotes: Dict[str, QuoteSnapshot] = {}
         self._symbols: Set[str] = {s.upper() for s in symbols}
         self._has_seen_quote = False
@@ -137,7 +154,7 @@ class LiveMarketDataService:
                 self._symbols.add(sym.upper())
 
     def get_snapshot(self, symbol: str) -> Optional[QuoteSnapshot]:
-        sym = symbol.upper()
+        sym = _upper(symbol)
         with self._lock:
             snap = self._quotes.get(sym)
         if snap is None:
@@ -146,7 +163,24 @@ class LiveMarketDataService:
             return None
         return snap
 
-    def get_mid_price(self, symbol: str) -> Optional[Decimal]:
+    def wait_for_snapshot(self, symbol: str, timeout: float) -> Optional[QuoteSnapshot]:
+        """
+        Block until a fresh snapshot for ``symbol`` is available, or ``timeout``
+        seconds pass. Woken by incoming quotes rather than polling.
+        """
+        sym = _upper(symbol)
+        deadline = time.monotonic() + timeout
+        with self._quote_cond:
+            while True:
+                snap = self._quotes.get(sym)
+                if snap is not None and snap.is_fresh(self.freshness_ttl):
+                    return snap
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._quote_cond.wait(remaining)
+
+    def get_mid_price(self, symbol: str) -> Optional[float]:
         snap = self.get_snapshot(symbol)
         return snap.mid if snap else None
 
@@ -226,29 +260,34 @@ class LiveMarketDataService:
         )
         if not symbol:
             return
-        bid_raw = getattr(quote, "bid_price", None)
-        ask_raw = getattr(quote, "ask_price", None)
-        bid = self._to_decimal(bid_raw)
-        ask = self._to_decimal(ask_raw)
-        mid: Optional[Decimal] = None
-        if bid is not None and ask is not None and bid > 0 and ask > 0:
-            mid = (bid + ask) / Decimal(2)
+        to_float = self._to_float
+        bid = to_float(getattr(quote, "bid_price", None))
+        ask = to_float(getattr(quote, "ask_price", None))
+        mid: Optional[float] = None
+        if bid and ask and bid > 0 and ask > 0:
+            mid = (bid + ask) * 0.5
         snap = QuoteSnapshot(
-            symbol=str(symbol).upper(),
+            symbol=_upper(str(symbol)),
             bid=bid,
             ask=ask,
             mid=mid,
-            asof=datetime.now(timezone.utc),
+            asof=time.time(),
         )
-        with self._lock:
+        with self._quote_cond:
             self._quotes[snap.symbol] = snap
             self._has_seen_quote = True
+            self._quote_cond.notify_all()
 
     @staticmethod
-    def _to_decimal(val: Any) -> Optional[Decimal]:
+    def _to_float(val: Any) -> Optional[float]:
+        # Prices are converted once here; everything downstream works in floats.
+        # DXLink reports missing sides as NaN, which is treated as no price.
         if val is None:
             return None
+        if val.__class__ is float:
+            return val if math.isfinite(val) else None
         try:
-            return Decimal(str(val))
+            out = float(val)
         except Exception:
             return None
+        return out if math.isfinite(out) else None
@@ -3,12 +3,12 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, Iterable, List, Optional, Mapping, Sequence
 
-import requests
-
 from .tasty_provider import API_BASE, make_tasty_session_from_env
 
 logger = logging.getLogger(__name__)
 
+_MARKET_METRICS_URL = f"{API_BASE}/market-metrics"
+
 # IV Rank (IVR) extraction
 #
 # We have confirmed that the Tasty watchlist “IV Rank” column is backed by the
@@ -97,7 +97,7 @@ def _items_from_response(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
 def _iterate_market_metrics_chunks(
     symbols: Sequence[str],
     *,
-    session: requests.Session,
+    session: Any,
     chunk_size: int,
 ) -> Iterable[tuple[List[str], Dict[str, Any]]]:
     """Yield (chunk, payload) for market-metrics requests with retries."""
@@ -116,7 +116,7 @@ def _iterate_market_metrics_chunks(
             attempts += 1
             try:
                 resp = session.get(
-                    f"{API_BASE}/market-metrics",
+                    _MARKET_METRICS_URL,
                     params=params,
                     timeout=30,
                 )
@@ -167,7 +167,7 @@ MAX_RETRIES_PER_CHUNK = 2  # 1 initial + 1 retry
 def fetch_iv_rank_for_symbols(
     symbols: Sequence[str],
     *,
-    session: Optional[requests.Session] = None,
+    session: Optional[Any] = None,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Dict[str, float]:
     if not symbols:
@@ -204,7 +204,7 @@ def fetch_iv_rank_for_symbols(
 def fetch_market_metrics_raw(
     symbols: Sequence[str],
     *,
-    session: Optional[requests.Session] = None,
+    session: Optional[Any] = None,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Dict[str, Any]:
     """Fetch raw market-metrics payloads for the given symbols.
@@ -1,17 +1,72 @@
 # stratdeck/data/tasty_provider.py
 from __future__ import annotations
 
+import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import quote as url_quote
 
 import requests
 
+try:
+    import httpx  # optional, HTTP/2 multiplexing + pooled keepalive for REST calls
 
-def make_tasty_session_from_env() -> requests.Session:
-    """Build and authenticate a requests.Session using env credentials.
+    HAVE_HTTPX = True
+except Exception:  # pragma: no cover - optional dependency
+    httpx = None
+    HAVE_HTTPX = False
+
+HTTP_MAX_KEEPALIVE = 16
+HTTP_MAX_CONNECTIONS = 32
+
+# Network failures that may fall back to the last good REST quote. HTTP error
+# responses and parse errors are not in here and always propagate.
+_TRANSPORT_ERRORS: Tuple[type, ...] = (
+    TimeoutError,
+    ConnectionError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+) + ((httpx.TransportError,) if HAVE_HTTPX else ())
+
+
+def _new_http_session() -> Any:
+    """Return a pooled HTTP client: httpx (HTTP/2 when h2 is installed) or requests.
+
+    Both expose the get/post/request/headers surface the REST helpers use, and
+    either one keeps connections alive across calls so the quote fan-out does
+    not pay a TLS handshake per request.
+    """
+    if HAVE_HTTPX:
+        limits = httpx.Limits(
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            max_connections=HTTP_MAX_CONNECTIONS,
+        )
+        timeout = httpx.Timeout(5.0, connect=2.0)
+        # requests follows redirects by default and httpx does not; keep the
+        # requests behaviour.
+        try:
+            return httpx.Client(http2=True, limits=limits, timeout=timeout, follow_redirects=True)
+        except ImportError:  # h2 not installed
+            return httpx.Client(limits=limits, timeout=timeout, follow_redirects=True)
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=HTTP_MAX_KEEPALIVE,
+        pool_maxsize=HTTP_MAX_CONNECTIONS,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def make_tasty_session_from_env() -> Any:
+    """Build and authenticate an HTTP session using env credentials.
 
     Shared helper for REST-only flows that need a logged-in session
     (e.g. watchlists) without duplicating login logic across modules.
@@ -23,7 +78,7 @@ def make_tasty_session_from_env() -> requests.Session:
             "Set TASTY_USER/TASTY_PASS (or TT_USERNAME/TT_PASSWORD) to use live mode"
         )
 
-    session = requests.Session()
+    session = _new_http_session()
     session.headers.update(
         {
             "Accept": "application/json",
@@ -45,7 +100,7 @@ def make_tasty_session_from_env() -> requests.Session:
     session.headers["Authorization"] = token
     return session
 
-from .live_quotes import LiveMarketDataService, QuoteSnapshot
+from .live_quotes import LiveMarketDataService, QuoteSnapshot, _upper
 from .provider import IDataProvider
 
 API_BASE = os.getenv("TASTY_API_URL", "https://api.tastyworks.com")
@@ -62,13 +117,71 @@ except Exception:
 
 log = logging.getLogger(__name__)
 
+# Optional on-disk REST quote cache for replay/backtest runs. It is off unless
+# the env var names a directory; entries live for one QUOTE_DISK_TTL bucket.
+QUOTE_CACHE_DIR_ENV = "STRATDECK_QUOTE_CACHE_DIR"
+QUOTE_DISK_TTL_SECONDS = 60
+
+
+class SnapshotQuote(NamedTuple):
+    """
+    Immutable DXLink-backed quote returned by TastyProvider.get_quote.
+
+    Dict-style reads (quote["mid"], quote.get("mark"), "source" in quote,
+    dict(quote)) match the REST quote dicts, so callers that only read a quote
+    can treat both shapes alike. Use ``_asdict()`` where a real dict is needed,
+    e.g. for JSON.
+    """
+
+    symbol: str
+    bid: Optional[float]
+    ask: Optional[float]
+    last: float
+    mark: Optional[float]
+    mid: Optional[float]
+    source: str = "dxlink"
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
 
 class TastyProvider(IDataProvider):
     """Minimal REST client for the tastytrade API."""
 
     API_BASE = API_BASE
-    INDEX_SYMBOLS = {"SPX", "RUT", "NDX", "VIX", "XSP"}
+    INDEX_SYMBOLS = frozenset({"SPX", "RUT", "NDX", "VIX", "XSP"})
+    _INDEX_QUOTE_PATH = "/market-data/Index/%s"
+    _EQUITY_QUOTE_PATH = "/market-data/Equity/%s"
     MAX_OPTION_QUOTES = 75  # API limit is 100 per request
+    # Underlyings per /market-data/by-type request in get_quotes; kept below the
+    # endpoint's 100-symbol cap independently of the option-chain limit above.
+    MAX_QUOTE_BATCH = 75
+    REST_QUOTE_WORKERS = 8  # cap on concurrent per-symbol quote requests
+
+    # REST quotes are reused for this many seconds so several strategies scanning
+    # the same underlying in one planner pass share a single request.
+    _quote_cache_ttl = 5.0
+    _now = staticmethod(time.monotonic)
+    # Single-symbol quote requests give up after this many seconds; get_quote then
+    # serves the last good REST quote (flagged stale) rather than stalling a scan.
+    QUOTE_TIMEOUT = 2.0
+    # Serialises re-login after a 401 (see _relogin).
+    _login_lock = threading.Lock()
+    # ...but only while that quote is younger than this; older ones re-raise.
+    STALE_QUOTE_MAX_AGE = 60.0
 
     def __init__(self, live_quotes: Optional[LiveMarketDataService] = None):
         self.username = os.getenv("TASTY_USER") or os.getenv("TT_USERNAME")
@@ -85,56 +198,188 @@ class TastyProvider(IDataProvider):
         if not self.account_id:
             self.account_id = self._fetch_default_account()
         self._metrics_cache: Dict[str, Dict[str, Any]] = {}
+        self._quote_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self._live_quotes = live_quotes
 
     # ------------------------- public interface -------------------------
 
-    def get_quote(self, symbol: str) -> Dict[str, Any]:
-        sym = symbol.upper()
+    def get_quote(self, symbol: str) -> Union[SnapshotQuote, Dict[str, Any]]:
+        sym = _upper(symbol)
         live_quote = self._quote_from_snapshot(sym)
         if live_quote is not None:
             return live_quote
-        return self._get_quote_rest(sym)
-
-    def _quote_from_snapshot(self, symbol: str) -> Optional[Dict[str, Any]]:
+        cached = self._cached_quote(sym)
+        if cached is not None:
+            return cached
+        try:
+            quote = self._get_quote_rest(sym)
+        except _TRANSPORT_ERRORS as exc:
+            stale = self._stale_quote(sym)
+            if stale is None:
+                raise
+            log.warning("REST quote failed for %s, serving last good quote: %r", sym, exc)
+            return stale
+        return self._remember_quote(sym, quote)
+
+    def _quote_from_snapshot(self, symbol: str) -> Optional[SnapshotQuote]:
         if not self._live_quotes:
             return None
         snapshot: Optional[QuoteSnapshot] = self._live_quotes.get_snapshot(symbol)
         if snapshot is None:
             return None
 
-        bid = self._safe_float(snapshot.bid)
-        ask = self._safe_float(snapshot.ask)
-        mid = self._safe_float(snapshot.mid) or self._mid(bid, ask, None, None)
+        # Snapshot prices are already floats (converted once at ingestion).
+        bid = snapshot.bid
+        ask = snapshot.ask
+        mid = snapshot.mid
+        if mid is None and bid and ask and bid > 0 and ask > 0:
+            mid = (bid + ask) * 0.5
 
         log.debug("Using live quote from DXLink symbol=%s mid=%s", symbol, mid)
 
-        return {
-            "symbol": symbol,
-            "bid": bid,
-            "ask": ask,
-            "last": mid if mid is not None else 0.0,
-            "mark": mid,
-            "mid": mid,
-            "source": "dxlink",
-        }
+        return SnapshotQuote(symbol, bid, ask, mid if mid is not None else 0.0, mid, mid)
+
+    def get_quotes(
+        self, symbols: Iterable[str]
+    ) -> Dict[str, Union[SnapshotQuote, Dict[str, Any]]]:
+        """
+        Quotes for several underlyings keyed by upper-cased symbol.
+
+        DXLink snapshots are used where available; every remaining symbol is
+        fetched in a single /market-data/by-type request instead of one REST
+        round trip per symbol.
+        """
+        quotes: Dict[str, Union[SnapshotQuote, Dict[str, Any]]] = {}
+        missing: List[str] = []
+        for sym in dict.fromkeys(_upper(s) for s in symbols):
+            quote = self._quote_from_snapshot(sym) or self._cached_quote(sym)
+            if quote is not None:
+                quotes[sym] = quote
+            else:
+                missing.append(sym)
+        if missing:
+            for sym, quote in self._get_quotes_rest(missing).items():
+                quotes[sym] = self._remember_quote(sym, quote)
+        return quotes
+
+    def _cached_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        entry = self._quote_cache.get(symbol)
+        if entry is None or self._now() - entry[0] >= self._quote_cache_ttl:
+            return None
+        return dict(entry[1])
+
+    def _stale_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        # Cache entries outlive the TTL, so the last successful REST quote is
+        # still here after a failed refresh.
+        entry = self._quote_cache.get(symbol)
+        if entry is None:
+            return None
+        stamp, quote = entry
+        age = self._now() - stamp
+        if age > self.STALE_QUOTE_MAX_AGE:
+            return None
+        stale = dict(quote)
+        stale["source"] = "rest-stale"
+        stale["stale"] = True
+        stale["asof"] = time.time() - age
+        return stale
+
+    def _remember_quote(self, symbol: str, quote: Dict[str, Any]) -> Dict[str, Any]:
+        # Only REST quotes are cached; DXLink snapshots are already live.
+        self._quote_cache[symbol] = (self._now(), dict(quote))
+        return quote
 
     def _get_quote_rest(self, symbol: str) -> Dict[str, Any]:
-        instrument = "Index" if symbol in self.INDEX_SYMBOLS else "Equity"
-        payload = self._get_json(f"/market-data/{instrument}/{symbol}")
+        cached = self._read_disk_quote(symbol)
+        if cached is not None:
+            return cached
+
+        path = self._INDEX_QUOTE_PATH if symbol in self.INDEX_SYMBOLS else self._EQUITY_QUOTE_PATH
+        payload = self._get_json(path % symbol, timeout=self.QUOTE_TIMEOUT)
         data = payload.get("data") or payload or {}
+        quote = self._quote_from_market_data(symbol, data)
+        self._write_disk_quote(symbol, quote)
+        return quote
 
-        def _f(val: Any) -> Optional[float]:
-            try:
-                return float(val)
-            except Exception:
-                return None
+    @staticmethod
+    def _quote_disk_path(symbol: str) -> Optional[Path]:
+        cache_dir = os.getenv(QUOTE_CACHE_DIR_ENV)
+        if not cache_dir:
+            return None
+        # One directory per symbol (percent-encoded, so distinct symbols never
+        # share a name) holding a file per TTL bucket.
+        bucket = int(time.time() // QUOTE_DISK_TTL_SECONDS)
+        return Path(cache_dir) / url_quote(symbol, safe="") / f"{bucket}.json"
+
+    def _read_disk_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        cache_path = self._quote_disk_path(symbol)
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            return json.loads(cache_path.read_text())
+        except Exception as exc:
+            log.warning("failed to read quote cache %s: %s", cache_path, exc)
+            return None
 
+    def _write_disk_quote(self, symbol: str, quote: Dict[str, Any]) -> None:
+        cache_path = self._quote_disk_path(symbol)
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in cache_path.parent.glob("*.json"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+            cache_path.write_text(json.dumps(quote))
+        except Exception as exc:
+            log.warning("failed to write quote cache %s: %s", cache_path, exc)
+
+    def _get_quotes_rest(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        quotes: Dict[str, Dict[str, Any]] = {}
+        pending: List[str] = []
+        for sym in symbols:
+            cached = self._read_disk_quote(sym)
+            if cached is not None:
+                quotes[sym] = cached
+            else:
+                pending.append(sym)
+        index_symbols = self.INDEX_SYMBOLS
+        for start in range(0, len(pending), self.MAX_QUOTE_BATCH):
+            chunk = pending[start : start + self.MAX_QUOTE_BATCH]
+            params = [("index" if sym in index_symbols else "equity", sym) for sym in chunk]
+            data = self._get_json("/market-data/by-type", params=params)
+            for item in data.get("data", {}).get("items", []):
+                sym = _upper(item.get("symbol") or "")
+                if sym in chunk:
+                    quote = self._quote_from_market_data(sym, item)
+                    self._write_disk_quote(sym, quote)
+                    quotes[sym] = quote
+        # Anything the batch response left out goes through the per-symbol endpoint.
+        leftovers = [sym for sym in pending if sym not in quotes]
+        if leftovers:
+            quotes.update(self._get_quotes_rest_each(leftovers))
+        return quotes
+
+    def _get_quotes_rest_each(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        # Single-symbol requests are pure network wait, so overlap them on a small
+        # pool: wall time tracks the slowest request rather than the sum.
+        workers = min(self.REST_QUOTE_WORKERS, len(symbols))
+        if workers <= 1:
+            return {sym: self._get_quote_rest(sym) for sym in symbols}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(symbols, pool.map(self._get_quote_rest, symbols)))
+
+    def _quote_from_market_data(self, symbol: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        _f = self._safe_float
         bid = _f(data.get("bid") or data.get("best-bid") or data.get("bid-price"))
         ask = _f(data.get("ask") or data.get("best-ask") or data.get("ask-price"))
         last = _f(data.get("last") or data.get("last-price") or data.get("close"))
         mark = _f(data.get("mark") or data.get("mark-price"))
-        mid = self._mid(bid, ask, mark, last)
+        # Inlined _mid: two-sided market, then mark, then last.
+        if bid and ask and bid > 0 and ask > 0:
+            mid = (bid + ask) * 0.5
+        else:
+            mid = mark if mark is not None else last
         return {
             "symbol": symbol,
             "bid": bid,
@@ -228,7 +473,7 @@ class TastyProvider(IDataProvider):
         return positions
 
     def get_ivr(self, symbol: str) -> Optional[float]:
-        sym = symbol.upper()
+        sym = _upper(symbol)
         cached = self._metrics_cache.get(sym)
         if cached and time.time() - cached.get("ts", 0) < 300:
             return cached.get("ivr")
@@ -273,6 +518,14 @@ class TastyProvider(IDataProvider):
         self._session_token = token
         self._session_created = time.time()
 
+    def _relogin(self, expired_token: Optional[str]) -> None:
+        # The quote fan-out shares one session across threads, so an expired
+        # token yields a 401 on every worker at once. Log in once; later
+        # workers see the token has already changed and just retry.
+        with self._login_lock:
+            if self.session.headers.get("Authorization") == expired_token:
+                self._login()
+
     def _fetch_default_account(self) -> str:
         data = self._get_json("/customers/me/accounts")
         items = data.get("data", {}).get("items", [])
@@ -282,28 +535,31 @@ class TastyProvider(IDataProvider):
                 return account["account-number"]
         raise RuntimeError("No tastytrade account found; set TASTY_ACCOUNT_ID")
 
-    def _request(self, method: str, path: str, *, params=None, json=None) -> requests.Response:
+    def _request(
+        self, method: str, path: str, *, params=None, json=None, timeout: float = 30
+    ) -> Any:
         url = f"{self.API_BASE}{path}"
+        sent_token = self.session.headers.get("Authorization")
         resp = self.session.request(
             method,
             url,
             params=params,
             json=json,
-            timeout=30,
+            timeout=timeout,
         )
         if resp.status_code == 401:
-            self._login()
+            self._relogin(sent_token)
             resp = self.session.request(
                 method,
                 url,
                 params=params,
                 json=json,
-                timeout=30,
+                timeout=timeout,
             )
         return resp
 
-    def _get_json(self, path: str, *, params=None) -> Dict[str, Any]:
-        resp = self._request("GET", path, params=params)
+    def _get_json(self, path: str, *, params=None, timeout: float = 30) -> Dict[str, Any]:
+        resp = self._request("GET", path, params=params, timeout=timeout)
         if resp.status_code >= 400:
             raise RuntimeError(f"Tastytrade error {resp.status_code}: {resp.text}")
         if not resp.text:
@@ -420,13 +676,15 @@ class TastyProvider(IDataProvider):
 
     @staticmethod
     def _mid(bid: Optional[float], ask: Optional[float], mark: Optional[float], fallback: Optional[float] = None) -> Optional[float]:
-        vals = [v for v in (mark, fallback) if v is not None]
-        if bid is not None and ask is not None and bid > 0 and ask > 0:
-            vals.insert(0, (bid + ask) / 2.0)
-        return vals[0] if vals else None
+        # Two-sided market first, then mark, then the fallback; plain branches, no temporaries.
+        if bid and ask and bid > 0 and ask > 0:
+            return (bid + ask) * 0.5
+        return mark if mark is not None else fallback
 
     @staticmethod
     def _safe_float(val: Any) -> Optional[float]:
+        if val.__class__ is float:
+            return val
         try:
             return float(val)
         except Exception:
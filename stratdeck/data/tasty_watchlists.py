@@ -7,12 +7,35 @@ name and return the underlying symbols in a deterministic order.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Any, Dict, Iterable, List, Optional
 
 from .tasty_provider import API_BASE, make_tasty_session_from_env
 
 log = logging.getLogger(__name__)
 
+_WATCHLISTS_URL = f"{API_BASE}/watchlists"
+
+# One logged-in session is reused across watchlist fetches; a 401 drops it so
+# the next call logs in again.
+_SESSION: Optional[Any] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> Any:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = make_tasty_session_from_env()
+        return _SESSION
+
+
+def invalidate_session() -> None:
+    """Forget the cached session so the next fetch performs a fresh login."""
+    global _SESSION
+    with _SESSION_LOCK:
+        _SESSION = None
+
 
 def _extract_entries(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Normalize various watchlist response shapes into a list of entries."""
@@ -117,9 +140,13 @@ def get_watchlist_symbols(name: str) -> List[str]:
     session helper; tests are expected to monkeypatch the session layer.
     """
 
-    session = make_tasty_session_from_env()
+    session = _get_session()
 
-    resp = session.get(f"{API_BASE}/watchlists", timeout=30)
+    resp = session.get(_WATCHLISTS_URL, timeout=30)
+    if resp.status_code == 401:
+        invalidate_session()
+        session = _get_session()
+        resp = session.get(_WATCHLISTS_URL, timeout=30)
     if resp.status_code >= 400:
         raise RuntimeError(f"Failed to fetch watchlists: {resp.status_code} {resp.text}")
 
@@ -134,7 +161,7 @@ def get_watchlist_symbols(name: str) -> List[str]:
         if watchlist_id:
             try:
                 detail = session.get(
-                    f"{API_BASE}/watchlists/{watchlist_id}",
+                    f"{_WATCHLISTS_URL}/{watchlist_id}",
                     timeout=30,
                 )
                 if detail.status_code < 400 and detail.text:
@@ -142,10 +169,6 @@ def get_watchlist_symbols(name: str) -> List[str]:
             except Exception as exc:  # pragma: no cover - defensive
                 log.warning("Failed to fetch watchlist entries for %s: %r", name, exc)
 
-    symbols = set()
-    for entry in entries:
-        sym = _extract_underlying_symbol(entry)
-        if sym:
-            symbols.add(sym)
-
+    # Single pass: map entries to symbols, drop blanks, dedupe, then sort.
+    symbols = dict.fromkeys(filter(None, map(_extract_underlying_symbol, entries)))
     return sorted(symbols)
@@ -36,7 +36,7 @@ class StrategyUniverseAssignment:
     symbols: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolStrategyTask:
     """
     A single (symbol, strategy, universe) task for the trade-ideas engine.
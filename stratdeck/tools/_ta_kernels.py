@@ -0,0 +1,172 @@
+# stratdeck/tools/_ta_kernels.py
+"""
+Fused single-pass indicator kernels for the TA engine.
+
+`compute_all` produces the same series as the pandas helpers in ta.py (EMA,
+Wilder RSI/ATR/ADX, MACD histogram, Bollinger bandwidth) using plain running
+recurrences. With numba installed it is JIT-compiled; without it the module
+still imports, but ta.py keeps using the pandas implementations.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    from numba import njit  # optional, accelerates the fused indicator kernel
+
+    HAVE_NUMBA = True
+except Exception:  # pragma: no cover - optional dependency
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+class IndicatorArrays(NamedTuple):
+    tr: np.ndarray
+    atr: np.ndarray
+    adx: np.ndarray
+    ema20: np.ndarray
+    ema50: np.ndarray
+    rsi: np.ndarray
+    macd_hist: np.ndarray
+    bbw: np.ndarray
+
+
+@njit(cache=True)
+def _ema(x, span):
+    n = x.size
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 2.0 / (span + 1.0)
+    acc = x[0]
+    out[0] = acc
+    for i in range(1, n):
+        acc = alpha * x[i] + (1.0 - alpha) * acc
+        out[i] = acc
+    return out
+
+
+@njit(cache=True)
+def _emas_batch(x, spans):
+    # All EMAs of the same input in one sweep over x: out[k] == _ema(x, spans[k]).
+    m = spans.size
+    n = x.size
+    out = np.empty((m, n))
+    if n == 0:
+        return out
+    alphas = 2.0 / (spans + 1.0)
+    acc = np.empty(m)
+    for k in range(m):
+        acc[k] = x[0]
+        out[k, 0] = x[0]
+    for i in range(1, n):
+        xi = x[i]
+        for k in range(m):
+            acc[k] = alphas[k] * xi + (1.0 - alphas[k]) * acc[k]
+            out[k, i] = acc[k]
+    return out
+
+
+@njit(cache=True)
+def _rma(x, period):
+    # Wilder RMA matching ewm(alpha=1/period, adjust=False, min_periods=period):
+    # leading NaNs are skipped and the first period-1 observations are masked.
+    n = x.size
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    acc = 0.0
+    seen = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            if seen >= period:
+                out[i] = acc
+            continue
+        if seen == 0:
+            acc = v
+        else:
+            acc = alpha * v + (1.0 - alpha) * acc
+        seen += 1
+        if seen >= period:
+            out[i] = acc
+    return out
+
+
+@njit(cache=True)
+def _compute_all(high, low, close):
+    n = close.size
+
+    tr = np.empty(n)
+    plus_dm = np.zeros(n)
+    minus_dm = np.zeros(n)
+    gain = np.full(n, np.nan)
+    loss = np.full(n, np.nan)
+    for i in range(n):
+        hl = high[i] - low[i]
+        if i == 0:
+            tr[i] = hl
+            continue
+        pc = close[i - 1]
+        tr[i] = max(hl, abs(high[i] - pc), abs(low[i] - pc))
+
+        up = high[i] - high[i - 1]
+        down = abs(low[i] - low[i - 1])
+        if up > down and up > 0:
+            plus_dm[i] = up
+        if down > up and down > 0:
+            minus_dm[i] = down
+
+        delta = close[i] - close[i - 1]
+        gain[i] = delta if delta > 0 else 0.0
+        loss[i] = -delta if delta < 0 else 0.0
+
+    atr = _rma(tr, 14)
+    plus_di = 100.0 * (_rma(plus_dm, 14) / (atr + 1e-9))
+    minus_di = 100.0 * (_rma(minus_dm, 14) / (atr + 1e-9))
+    dx = np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-9) * 100.0
+    adx = _rma(dx, 14)
+
+    avg_gain = _rma(gain, 14)
+    avg_loss = _rma(loss, 14)
+    rsi = 100.0 - (100.0 / (1.0 + avg_gain / (avg_loss + 1e-9)))
+
+    emas = _emas_batch(close, np.array([20.0, 50.0, 12.0, 26.0]))
+    ema20 = emas[0]
+    ema50 = emas[1]
+    macd_line = emas[2] - emas[3]
+    macd_hist = macd_line - _ema(macd_line, 9)
+
+    # Bollinger bandwidth (20, 2.0): (upper - lower) / mid with sample std.
+    length = 20
+    bbw = np.full(n, np.nan)
+    for i in range(length - 1, n):
+        mean = 0.0
+        for j in range(i - length + 1, i + 1):
+            mean += close[j]
+        mean /= length
+        ss = 0.0
+        for j in range(i - length + 1, i + 1):
+            d = close[j] - mean
+            ss += d * d
+        std = np.sqrt(ss / (length - 1))
+        bbw[i] = ((mean + 2.0 * std) - (mean - 2.0 * std)) / (mean + 1e-9)
+
+    return tr, atr, adx, ema20, ema50, rsi, macd_hist, bbw
+
+
+def compute_all(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> IndicatorArrays:
+    """Run the fused indicator kernel over float64 OHLC arrays (no NaNs)."""
+    return IndicatorArrays(
+        *_compute_all(
+            np.ascontiguousarray(high, dtype=np.float64),
+            np.ascontiguousarray(low, dtype=np.float64),
+            np.ascontiguousarray(close, dtype=np.float64),
+        )
+    )
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
+from collections import OrderedDict
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Sequence, List
+from typing import Any, Dict, Optional, Sequence, List, Tuple
 
 from .chains import get_chain, _nearest_expiry
 from .dates import compute_dte
@@ -32,8 +34,20 @@ class ChainPricingAdapter:
       - type ("put"/"call")
       - strike (float)
       - expiry (ignored here; we use DTE -> expiry mapping)
+
+    price_structure results are memoised per adapter instance (one planner
+    run) on the resolved structure; call clear_price_cache() when a new chain
+    snapshot should be priced.
     """
 
+    PRICE_CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        self._price_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+    def clear_price_cache(self) -> None:
+        self._price_cache.clear()
+
     # --- helpers -----------------------------------------------------------
 
     @staticmethod
@@ -306,7 +320,64 @@ class ChainPricingAdapter:
             * pop (heuristic)
 
         Returns None on any failure so the caller can degrade gracefully.
+        Successful results are cached per (symbol, strategy, strikes, expiry,
+        delta hint); failures are not cached so a later call can retry.
         """
+        key = self._price_cache_key(symbol, strategy_type, legs, dte_target, target_delta_hint, expiry)
+        if key is not None:
+            cached = self._price_cache.get(key)
+            if cached is not None:
+                self._price_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        result = self._price_structure(
+            symbol=symbol,
+            strategy_type=strategy_type,
+            legs=legs,
+            dte_target=dte_target,
+            target_delta_hint=target_delta_hint,
+            expiry=expiry,
+        )
+        if key is not None and result is not None:
+            self._price_cache[key] = copy.deepcopy(result)
+            if len(self._price_cache) > self.PRICE_CACHE_SIZE:
+                self._price_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _price_cache_key(
+        symbol: str,
+        strategy_type: str,
+        legs: Sequence[Any],
+        dte_target: int,
+        target_delta_hint: Optional[float],
+        expiry: Optional[str],
+    ) -> Optional[Tuple[Any, ...]]:
+        try:
+            leg_key = tuple(
+                (
+                    str(getattr(leg, "side", None)),
+                    str(getattr(leg, "type", None) or getattr(leg, "option_type", None)).lower(),
+                    float(leg.strike),
+                )
+                for leg in legs or ()
+            )
+            if expiry is None:
+                expiry = _nearest_expiry(int(dte_target))
+        except Exception:
+            return None
+        mode = os.getenv("STRATDECK_DATA_MODE", "mock").lower()
+        return (symbol, (strategy_type or "").lower(), leg_key, expiry, target_delta_hint, mode)
+
+    def _price_structure(
+        self,
+        symbol: str,
+        strategy_type: str,
+        legs: Sequence[Any],
+        dte_target: int,
+        target_delta_hint: Optional[float] = None,
+        expiry: Optional[str] = None,
+    ) -> Optional[Dict[str, float]]:
         if not legs:
             return None
 
@@ -124,15 +124,12 @@ class ChartistAgent:
         Run the technical engine across a batch of symbols.
         Returns a mapping {symbol: TAResult}.
         """
-        results: Dict[str, TAResult] = {}
-        for sym in symbols:
-            results[sym] = self.analyze_symbol(
-                symbol=sym,
-                strategy_hint=strategy_hint,
-                timeframes=timeframes,
-                lookback_bars=lookback_bars,
-            )
-        return results
+        return self.ta_engine.analyze_many(
+            symbols,
+            timeframes=timeframes,
+            strategy_hint=strategy_hint,
+            lookback_bars=lookback_bars,
+        )
 
     def analyze_scout_batch(
         self,
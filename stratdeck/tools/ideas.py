@@ -6,12 +6,27 @@ import os
 from pathlib import Path
 from typing import Any, Iterable, List, Sequence
 
+try:
+    import orjson  # optional, faster JSON decode for the last-ideas file
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 DEFAULT_IDEAS_PATH = Path(".stratdeck/last_trade_ideas.json")
 DISABLE_PERSIST_ENV = "STRATDECK_DISABLE_LAST_TRADE_IDEAS_FILE"
 
 log = logging.getLogger(__name__)
 
 
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json.dumps writes NaN/Infinity, which orjson rejects.
+            pass
+    return json.loads(raw)
+
+
 def load_last_ideas(path: Path = DEFAULT_IDEAS_PATH) -> List[Any]:
     """
     Load the last TradeIdeas JSON produced by:
@@ -24,7 +39,7 @@ def load_last_ideas(path: Path = DEFAULT_IDEAS_PATH) -> List[Any]:
     if not path.exists():
         raise FileNotFoundError(f"No ideas file at {path}; run 'trade-ideas --json-output {path}' first.")
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _loads(path.read_bytes())
 
     if isinstance(data, dict):
         for key in ("ideas", "results", "items"):
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import os
+import sys
+import threading
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
@@ -15,19 +20,39 @@ DEFAULT_POSITIONS_PATH = Path(".stratdeck/positions.json")
 POS_PATH: Path = DEFAULT_POSITIONS_PATH
 
 
-def _calc_dte(expiry: Optional[datetime | str]) -> Optional[int]:
-    if not expiry:
-        return None
+@lru_cache(maxsize=512)
+def _parse_expiry_str(expiry_str: str) -> Optional[datetime]:
     try:
-        expiry_dt = expiry if isinstance(expiry, datetime) else datetime.fromisoformat(str(expiry))
+        expiry_dt = datetime.fromisoformat(expiry_str)
     except Exception:
         return None
     if expiry_dt.tzinfo is None:
         expiry_dt = expiry_dt.replace(tzinfo=timezone.utc)
+    return expiry_dt
+
+
+def _calc_dte(expiry: Optional[datetime | str]) -> Optional[int]:
+    """
+    Days until expiry. String expiries are memoized, so positions sharing an
+    expiry only pay for one ISO parse.
+    """
+    if not expiry:
+        return None
+    if isinstance(expiry, datetime):
+        expiry_dt = expiry if expiry.tzinfo is not None else expiry.replace(tzinfo=timezone.utc)
+    else:
+        expiry_dt = _parse_expiry_str(str(expiry))
+        if expiry_dt is None:
+            return None
     today = datetime.now(timezone.utc)
     return max(int((expiry_dt - today).days), 0)
 
 
+@lru_cache(maxsize=4096)
+def _iso_to_dt(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
 def _parse_expiry(row: Dict[str, Any]) -> Optional[datetime | date]:
     expiry: Any = (row or {}).get("expiry")
     if expiry is None:
@@ -61,29 +86,81 @@ def _normalize_notes(notes: Any) -> Optional[str]:
     return str(notes)
 
 
+_SIDE_KEYS = ("side", "position")
+_LEG_TYPE_KEYS = ("type", "option_type", "kind", "optionType")
+
+_CALL = sys.intern("call")
+_PUT = sys.intern("put")
+_LEG_TYPE_MAP: Dict[str, Optional[str]] = {
+    "c": _CALL,
+    "call": _CALL,
+    "p": _PUT,
+    "put": _PUT,
+    "": None,
+}
+_SIDE_MAP: Dict[str, Optional[str]] = {
+    sys.intern(side): sys.intern(side) for side in ("short", "long", "buy", "sell")
+}
+_SIDE_MAP[""] = None
+_STATUS_MAP: Dict[str, str] = {sys.intern(status): sys.intern(status) for status in ("open", "closed")}
+
+
+def _canonical(value: Any, mapping: Dict[str, Optional[str]]) -> Optional[str]:
+    """Map a raw enum-like value to its interned lowercase form; unknown values are lowered."""
+    raw = "" if value is None else str(value)
+    try:
+        return mapping[raw]
+    except KeyError:
+        pass
+    lowered = raw.lower()
+    return mapping.get(lowered, lowered or None)
+
+
+# Per-type extractor, probed once for the first leg of each type.
+_LEG_ADAPTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _leg_from_to_dict(leg: Any) -> Dict[str, Any]:
+    return leg.to_dict()
+
+
+def _leg_from_dict(leg: Dict[str, Any]) -> Dict[str, Any]:
+    return leg
+
+
+def _leg_from_attrs(leg: Any) -> Dict[str, Any]:
+    return getattr(leg, "__dict__", {}) or {}
+
+
+def _leg_adapter(leg_cls: type) -> Callable[[Any], Dict[str, Any]]:
+    adapter = _LEG_ADAPTERS.get(leg_cls)
+    if adapter is None:
+        if hasattr(leg_cls, "to_dict"):
+            adapter = _leg_from_to_dict
+        elif issubclass(leg_cls, dict):
+            adapter = _leg_from_dict
+        else:
+            adapter = _leg_from_attrs
+        _LEG_ADAPTERS[leg_cls] = adapter
+    return adapter
+
+
+def _first_present(data: Dict[str, Any], keys: Sequence[str]) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
 def _normalize_leg(leg: Any) -> Dict[str, Any]:
     """
     Lightweight leg normalizer that mirrors orders._leg_to_dict to avoid a circular import.
     """
-    if hasattr(leg, "to_dict"):
-        data = leg.to_dict()
-    elif isinstance(leg, dict):
-        data = dict(leg)
-    else:
-        data = getattr(leg, "__dict__", {}) or {}
-
-    side = str(data.get("side") or data.get("position") or "").lower() or None
-    leg_type = str(
-        data.get("type")
-        or data.get("option_type")
-        or data.get("kind")
-        or data.get("optionType")
-        or ""
-    ).lower()
-    if leg_type in {"c", "call"}:
-        leg_type = "call"
-    elif leg_type in {"p", "put"}:
-        leg_type = "put"
+    data = _leg_adapter(type(leg))(leg)
+
+    side = _canonical(_first_present(data, _SIDE_KEYS), _SIDE_MAP)
+    leg_type = _canonical(_first_present(data, _LEG_TYPE_KEYS), _LEG_TYPE_MAP)
 
     try:
         qty = int(data.get("quantity", data.get("qty", 1)))
@@ -106,7 +183,7 @@ def _normalize_leg(leg: Any) -> Dict[str, Any]:
 
     return {
         "side": side,
-        "type": leg_type or None,
+        "type": leg_type,
         "strike": strike,
         "expiry": expiry,
         "quantity": qty,
@@ -162,7 +239,7 @@ class PaperPosition(BaseModel):
         if value is None or isinstance(value, datetime):
             return value
         try:
-            return datetime.fromisoformat(str(value))
+            return _iso_to_dt(value if isinstance(value, str) else str(value))
         except Exception:
             return value
 
@@ -170,7 +247,7 @@ class PaperPosition(BaseModel):
     def _normalize_status(cls, value: Any) -> str:  # noqa: B902
         if value is None:
             return "open"
-        return str(value).lower()
+        return _canonical(value, _STATUS_MAP) or ""
 
     @model_validator(mode="after")
     def _compute_entry_total(self) -> "PaperPosition":  # noqa: B902
@@ -182,10 +259,16 @@ class PaperPosition(BaseModel):
         return self
 
 
+# Bound once so the load loop calls pydantic-core directly instead of the classmethod wrapper.
+_POS_VALIDATOR = PaperPosition.__pydantic_validator__
+
+
 class PositionsStore:
     def __init__(self, path: Path | str = POS_PATH):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Guards self.positions and the on-disk file against concurrent writers.
+        self._lock = threading.RLock()
         self.positions: List[PaperPosition] = self._load()
 
     def _load(self) -> List[PaperPosition]:
@@ -199,9 +282,10 @@ class PositionsStore:
 
         items = raw if isinstance(raw, list) else [raw]
         positions: List[PaperPosition] = []
+        validate = _POS_VALIDATOR.validate_python
         for item in items:
             try:
-                positions.append(PaperPosition.model_validate(item))
+                positions.append(validate(item))
             except ValidationError as exc:
                 log.warning("[positions] skipping invalid entry: %s", exc)
             except Exception as exc:  # pragma: no cover - defensive
@@ -209,39 +293,61 @@ class PositionsStore:
         return positions
 
     def _persist(self) -> None:
-        payload = [p.model_dump(mode="json") for p in self.positions]
-        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
-        tmp_path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
-        tmp_path.replace(self.path)
+        with self._lock:
+            payload = [p.model_dump(mode="json") for p in self.positions]
+            data = json.dumps(payload, indent=2, default=str).encode("utf-8")
+            # Always write-then-rename: a torn positions file would lose paper trades.
+            tmp_path = f"{self.path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.path)
 
     def list_positions(self, status: Optional[str] = None) -> List[PaperPosition]:
+        with self._lock:
+            positions = list(self.positions)
         if status is None:
-            return list(self.positions)
+            return positions
         status = status.lower()
-        return [p for p in self.positions if (p.status or "").lower() == status]
+        return [p for p in positions if (p.status or "").lower() == status]
 
     def get_open_positions(self) -> List[PaperPosition]:
         return self.list_positions(status="open")
 
     def add_position(self, position: PaperPosition) -> PaperPosition:
-        self.positions.append(position)
-        self._persist()
+        with self._lock:
+            self.positions.append(position)
+            self._persist()
         return position
 
+    def bulk_add(self, positions: Iterable[PaperPosition]) -> List[PaperPosition]:
+        """Append several positions with a single file write."""
+        added = list(positions)
+        with self._lock:
+            self.positions.extend(added)
+            self._persist()
+        return added
+
     def upsert(self, position: PaperPosition) -> PaperPosition:
-        for idx, existing in enumerate(self.positions):
-            if str(existing.id) == str(position.id):
-                self.positions[idx] = position
-                self._persist()
-                return position
-        self.positions.append(position)
-        self._persist()
+        with self._lock:
+            for idx, existing in enumerate(self.positions):
+                if str(existing.id) == str(position.id):
+                    self.positions[idx] = position
+                    self._persist()
+                    return position
+            self.positions.append(position)
+            self._persist()
         return position
 
     def get(self, position_id: str) -> Optional[PaperPosition]:
-        for pos in self.positions:
-            if str(pos.id) == str(position_id):
-                return pos
+        with self._lock:
+            for pos in self.positions:
+                if str(pos.id) == str(position_id):
+                    return pos
         return None
 
     def update_position(self, position: PaperPosition) -> PaperPosition:
@@ -293,18 +399,22 @@ def _position_from_plan(spread_plan: Dict[str, Any], qty: int, entry_mid_price:
     )
 
 
+_LEGACY_FIELDS = tuple(PaperPosition.model_fields)
+
+
 def _legacy_dict(position: PaperPosition) -> Dict[str, Any]:
-    data = position.model_dump(mode="python")
-    data.update(
-        {
-            "credit": position.entry_mid,
-            "entry_mid_price": position.entry_mid,
-            "width": position.spread_width,
-            "qty": position.qty,
-            "expiry": position.expiry.isoformat() if isinstance(position.expiry, datetime) else position.expiry,
-            "status": (position.status or "open").lower(),
-        }
-    )
+    # Read fields directly rather than via model_dump(): only legs need serialising.
+    data: Dict[str, Any] = {name: getattr(position, name) for name in _LEGACY_FIELDS}
+    data["legs"] = [leg.model_dump() for leg in position.legs]
+    # provenance is the only free-form (mutable) field; copy it like
+    # model_dump() did so edits to the legacy dict never reach the model.
+    if position.provenance is not None:
+        data["provenance"] = copy.deepcopy(position.provenance)
+    data["credit"] = position.entry_mid
+    data["entry_mid_price"] = position.entry_mid
+    data["width"] = position.spread_width
+    data["expiry"] = position.expiry.isoformat() if isinstance(position.expiry, datetime) else position.expiry
+    data["status"] = (position.status or "open").lower()
     expiry = _parse_expiry(data)  # this should give you a datetime or date
     if expiry is not None:
         # canonical integer DTE via legacy helper
@@ -1,16 +1,18 @@
 # stratdeck/tools/pricing.py
-from typing import Any, Dict
+import functools
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
 
 from stratdeck.data.factory import get_provider
 
-_provider = None
+_PRICE_KEYS = ("mark", "mid", "last")
 
 
+@functools.cache
 def _p():
-    global _provider
-    if _provider is None:
-        _provider = get_provider()
-    return _provider
+    """Lazily resolved provider singleton; use `_p.cache_clear()` to re-resolve."""
+    return get_provider()
 
 
 def last_price(symbol: str) -> float:
@@ -18,22 +20,26 @@ def last_price(symbol: str) -> float:
     Return a best-effort underlying price using mid/mark before falling back to last.
     """
     q: Dict[str, Any] = _p().get_quote(symbol) or {}
-    for key in ("mark", "mid", "last"):
-        val = q.get(key)
+    if not q:
+        return 0.0
+    get = q.get
+    to_float = float
+    for key in _PRICE_KEYS:
+        val = get(key)
         try:
             if val is not None:
-                return float(val)
+                return to_float(val)
         except Exception:
             continue
     # Last resort: average bid/ask if provided
-    bid = q.get("bid")
-    ask = q.get("ask")
+    bid = get("bid")
+    ask = get("ask")
     try:
         if bid is not None and ask is not None:
-            return (float(bid) + float(ask)) / 2.0
+            return (to_float(bid) + to_float(ask)) / 2.0
     except Exception:
         pass
-    return float(q.get("last") or 0.0)
+    return to_float(get("last") or 0.0)
 
 
 def credit_for_vertical(vert: Dict) -> float:
@@ -93,3 +99,52 @@ def pop_estimate(vert: Dict, target_delta: float | None = None) -> float:
     bonus = min(width * 0.002, 0.02)
 
     return round(base + bonus, 2)
+
+
+def _float_or_nan(value: Any) -> float:
+    try:
+        return float(value)
+    except Exception:
+        return float("nan")
+
+
+def batch_credit_and_pop(
+    verts: Sequence[Dict],
+    target_delta: float | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised `credit_for_vertical` + `pop_estimate` over a batch of verticals.
+
+    Returns `(credits, pops)` arrays aligned with `verts`. Same heuristics as the
+    scalar helpers; use this when scoring many candidates in one pass.
+    """
+    n = len(verts)
+    if n == 0:
+        empty = np.empty(0, dtype=float)
+        return empty, empty.copy()
+
+    short_mid = np.empty(n, dtype=float)
+    long_mid = np.empty(n, dtype=float)
+    short_delta = np.empty(n, dtype=float)
+    width = np.empty(n, dtype=float)
+    for i, vert in enumerate(verts):
+        short = vert.get("short", {})
+        short_mid[i] = float(short["mid"])
+        long_mid[i] = float(vert["long"]["mid"])
+        short_delta[i] = _float_or_nan(short.get("delta", 0.0))
+        width[i] = _float_or_nan(vert.get("width", 0.0))
+
+    credits = np.round(np.maximum(short_mid - long_mid, 0.01), 2)
+
+    fallback = 0.20
+    if target_delta is not None:
+        td = abs(_float_or_nan(target_delta))
+        if td > 0.0:
+            fallback = td
+    missing = np.isnan(short_delta) | (short_delta <= 0.0)
+    sd = np.where(missing, fallback, short_delta)
+
+    base = np.clip(1.0 - np.abs(sd), 0.50, 0.95)
+    bonus = np.minimum(np.nan_to_num(width, nan=0.0) * 0.002, 0.02)
+    pops = np.round(base + bonus, 2)
+    return credits, pops
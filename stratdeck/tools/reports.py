@@ -5,25 +5,48 @@ import csv
 import json
 import os
 import time
-from typing import Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List
 
 from stratdeck.agents.journal import JOURNAL_PATH
 from stratdeck.tools.positions import list_positions
 from stratdeck.tools.account import provider_account_summary, is_live_mode
 
+try:
+    import orjson  # optional, faster JSON decode for journal metrics
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 SECONDS_PER_DAY = 86400
 
 
+def _json_loads(raw: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json.dumps writes NaN/Infinity, which orjson rejects.
+            pass
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=1024)
+def _slow_parse(raw: str) -> Dict:
+    # Legacy rows were written with repr(dict); only pay for AST parsing once per distinct string.
+    try:
+        return dict(ast.literal_eval(raw)) if raw.startswith("{") else {}
+    except Exception:
+        return {}
+
+
 def _parse_metrics(raw: str) -> Dict:
     if not raw:
         return {}
     try:
-        return json.loads(raw)
+        return _json_loads(raw)
     except Exception:
-        try:
-            return dict(ast.literal_eval(raw)) if raw.startswith("{") else {}
-        except Exception:
-            return {}
+        # Copy so callers can't mutate the cached value.
+        return dict(_slow_parse(raw))
 
 
 def load_journal_entries(days: int = 1) -> List[Dict]:
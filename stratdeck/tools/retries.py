@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import logging
+import random
+import re
 import time
-from typing import Any, Callable, Iterable, Optional, Sequence
+from typing import Any, Callable, Collection, Optional
 
 log = logging.getLogger(__name__)
 
+_RETRY_TYPES = (ConnectionError, TimeoutError)
+_RETRY_STATUS_SET = frozenset({429, 500, 502, 503, 504})
+_RETRY_MSG_RE = re.compile(r"too many requests|rate limit|\b429\b", re.IGNORECASE)
+
 
 def _status_from_exception(exc: BaseException) -> Optional[int]:
     """
@@ -28,17 +34,15 @@ def _status_from_exception(exc: BaseException) -> Optional[int]:
     return None
 
 
-def _is_retryable_error(exc: BaseException, retry_statuses: Sequence[int]) -> bool:
+def _is_retryable_error(exc: BaseException, retry_statuses: Collection[int] = _RETRY_STATUS_SET) -> bool:
     status = _status_from_exception(exc)
     if status is not None and status in retry_statuses:
         return True
 
-    msg = str(exc).lower()
-    if "too many requests" in msg or "rate limit" in msg or "429" in msg:
+    if _RETRY_MSG_RE.search(str(exc)):
         return True
 
-    retry_types: Iterable[type] = (ConnectionError, TimeoutError)
-    return isinstance(exc, retry_types)
+    return isinstance(exc, _RETRY_TYPES)
 
 
 def call_with_retries(
@@ -46,17 +50,24 @@ def call_with_retries(
     *,
     retries: int = 2,
     backoff: float = 0.5,
-    retry_statuses: Sequence[int] = (429, 500, 502, 503, 504),
+    max_delay: float = 8.0,
+    retry_statuses: Collection[int] = _RETRY_STATUS_SET,
     logger: Optional[logging.Logger] = None,
     label: str = "call",
 ) -> Any:
     """
     Execute `fn` with bounded retries for transient errors (e.g. HTTP 429).
 
-    Retries use exponential backoff starting at `backoff`. Non-retryable errors
-    are raised immediately so callers can handle or fail fast.
+    Retries use exponential backoff starting at `backoff` with jitter (each sleep
+    is scaled by a random factor in [0.5, 1.5)) and capped at `max_delay`, so
+    concurrent callers don't retry in lockstep. Non-retryable errors are raised
+    immediately so callers can handle or fail fast.
     """
     lg = logger or log
+    is_retryable = _is_retryable_error
+    jitter = random.random
+    sleep = time.sleep
+    started = time.monotonic()
     attempt = 0
     delay = backoff
     while True:
@@ -64,24 +75,25 @@ def call_with_retries(
             return fn()
         except Exception as exc:  # pragma: no cover - surfaced via decision tree
             attempt += 1
-            retryable = _is_retryable_error(exc, retry_statuses)
-            if not retryable:
+            if not is_retryable(exc, retry_statuses):
                 raise
             if attempt > retries:
                 lg.warning(
-                    "[retry] %s exhausted after %s attempts: %r",
+                    "[retry] %s exhausted after %s attempts in %.2fs: %r",
                     label,
                     attempt,
+                    time.monotonic() - started,
                     exc,
                 )
                 raise
+            wait = min(delay * (0.5 + jitter()), max_delay)
             lg.warning(
                 "[retry] %s attempt %s/%s failed (%r); backing off %.2fs",
                 label,
                 attempt,
                 retries,
                 exc,
-                delay,
+                wait,
             )
-            time.sleep(delay)
-            delay *= 2
+            sleep(wait)
+            delay = min(delay * 2, max_delay)
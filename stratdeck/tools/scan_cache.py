@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numbers
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Mapping, Optional
 
@@ -18,31 +19,41 @@ class ScanCache:
 
 
 _scan_cache = ScanCache()
+_CACHE_LOCK = threading.Lock()
 
 
-def store_scan_rows(rows: Iterable[Mapping[str, Any]]) -> None:
+def store_scan_rows(rows: Iterable[Mapping[str, Any]], *, copy: bool = False) -> None:
     """
     Save the most recent scan rows. The caller typically passes in a list of dicts
     built by the scan/TA pipeline.
+
+    By default the cache takes ownership of the row objects (only the list is
+    copied). Callers that keep mutating rows after storing them should pass
+    copy=True to snapshot each row as a plain dict.
     """
-    global _scan_cache
-    # Normalise to plain dicts so later code can safely mutate copies.
-    _scan_cache.rows = [dict(r) for r in rows]
+    new_rows = [dict(r) for r in rows] if copy else list(rows)
+    with _CACHE_LOCK:
+        _scan_cache.rows = new_rows
 
 
 def store_trade_ideas(ideas: Iterable[Any]) -> None:
     """
     Save the most recent TradeIdea list for follow-up commands.
     """
-    global _scan_cache
-    _scan_cache.ideas = list(ideas)
+    new_ideas = list(ideas)
+    with _CACHE_LOCK:
+        _scan_cache.ideas = new_ideas
 
 
 def load_last_scan() -> ScanCache:
     """
     Return the last stored scan payload. The caller can inspect .rows and .ideas.
+
+    The returned object is a consistent snapshot; the lists are shared with the
+    cache and replaced (never mutated in place) by the store_* helpers.
     """
-    return _scan_cache
+    with _CACHE_LOCK:
+        return ScanCache(rows=_scan_cache.rows, ideas=_scan_cache.ideas)
 
 
 def attach_ivr_to_scan_rows(
@@ -2,21 +2,53 @@
 
 from __future__ import annotations
 
+import logging
 import os
-from dataclasses import dataclass, asdict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
 import warnings
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote as url_quote
+from zoneinfo import ZoneInfo
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 try:
     import yfinance as yf  # optional, used for mock/live data if no client passed
 except Exception:  # pragma: no cover - optional dependency
     yf = None
 
+try:
+    import talib  # optional C backend for the Wilder/MACD/Bollinger indicators
+except Exception:  # pragma: no cover - optional dependency
+    talib = None
+
+from . import _ta_kernels
 from .scan_cache import ScanCache, load_last_scan as _load_last_scan
 
+log = logging.getLogger(__name__)
+
+TA_BACKEND_ENV = "STRATDECK_TA_BACKEND"
+
+
+def _use_talib() -> bool:
+    """
+    TA-Lib is opt-in (STRATDECK_TA_BACKEND=talib): it seeds Wilder/EMA averages
+    with an SMA, uses the classic +DM/-DM rule and population std for bands, so
+    its values differ from the pandas helpers during warm-up and for ADX.
+    """
+    return talib is not None and os.getenv(TA_BACKEND_ENV, "").lower() == "talib"
+
+
+def _f64(series: pd.Series) -> np.ndarray:
+    return series.to_numpy(dtype=np.float64)
+
 
 SPX_XSP_DATA_MAP = {
     "SPX": {
@@ -53,16 +85,16 @@ def load_last_scan() -> "ScanCache":
 Timeframe = str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Regime:
     state: str
     confidence: float
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {"state": self.state, "confidence": self.confidence}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MomentumState:
     state: str
     rsi: float
@@ -71,10 +103,16 @@ class MomentumState:
     macd_hist_slope: float
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "state": self.state,
+            "rsi": self.rsi,
+            "rsi_slope": self.rsi_slope,
+            "macd_hist": self.macd_hist,
+            "macd_hist_slope": self.macd_hist_slope,
+        }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RangeInfo:
     low: float
     high: float
@@ -82,28 +120,29 @@ class RangeInfo:
     position_in_range: float
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "low": self.low,
+            "high": self.high,
+            "in_range": self.in_range,
+            "position_in_range": self.position_in_range,
+        }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StructureInfo:
     support: List[float]
     resistance: List[float]
     range: Optional[RangeInfo]
 
     def to_dict(self) -> Dict:
-        d = {
+        return {
             "support": self.support,
             "resistance": self.resistance,
+            "range": self.range.to_dict() if self.range is not None else None,
         }
-        if self.range is not None:
-            d["range"] = self.range.to_dict()
-        else:
-            d["range"] = None
-        return d
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Scores:
     trend_score: float
     vol_score: float
@@ -114,7 +153,15 @@ class Scores:
     vol_bias: str
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "trend_score": self.trend_score,
+            "vol_score": self.vol_score,
+            "momentum_score": self.momentum_score,
+            "structure_score": self.structure_score,
+            "ta_bias": self.ta_bias,
+            "directional_bias": self.directional_bias,
+            "vol_bias": self.vol_bias,
+        }
 
 
 @dataclass
@@ -150,28 +197,58 @@ def ema(series: pd.Series, period: int) -> pd.Series:
     return series.ewm(span=period, adjust=False).mean()
 
 
-def true_range(df: pd.DataFrame) -> pd.Series:
-    prev_close = df["close"].shift(1)
-    tr1 = df["high"] - df["low"]
-    tr2 = (df["high"] - prev_close).abs()
-    tr3 = (df["low"] - prev_close).abs()
-    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+def rma(series: pd.Series, period: int) -> pd.Series:
+    """Wilder's smoothed moving average (RMA), as used by RSI/ATR/ADX."""
+    return series.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
 
 
-def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    tr = true_range(df)
-    return tr.rolling(period).mean()
+def true_range(df: pd.DataFrame) -> pd.Series:
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    close = df["close"].to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(close)
+    if close.size:
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+    # fmax ignores NaN, so the first bar falls back to high - low.
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    return pd.Series(tr, index=df.index)
+
+
+def _all_nan(index: pd.Index) -> pd.Series:
+    return pd.Series(np.nan, index=index, dtype=np.float64)
+
+
+def atr(df: pd.DataFrame, period: int = 14, tr: Optional[pd.Series] = None) -> pd.Series:
+    if len(df) < period:
+        return _all_nan(df.index)
+    if _use_talib():
+        return pd.Series(
+            talib.ATR(_f64(df["high"]), _f64(df["low"]), _f64(df["close"]), timeperiod=period),
+            index=df.index,
+        )
+    if tr is None:
+        tr = true_range(df)
+    return rma(tr, period)
 
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    delta = series.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.rolling(period).mean()
-    avg_loss = loss.rolling(period).mean()
+    if len(series) < period + 1:  # diff() drops a bar before the RMA warm-up
+        return _all_nan(series.index)
+    if _use_talib():
+        return pd.Series(talib.RSI(_f64(series), timeperiod=period), index=series.index)
+    close = series.to_numpy(dtype=np.float64)
+    delta = np.empty_like(close)
+    if close.size:
+        delta[0] = np.nan
+        delta[1:] = np.diff(close)
+    # np.maximum keeps the leading NaN, so the RMA starts on the first real change.
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+    avg_gain = rma(pd.Series(gain), period).to_numpy()
+    avg_loss = rma(pd.Series(loss), period).to_numpy()
     rs = avg_gain / (avg_loss + 1e-9)
-    rsi_val = 100 - (100 / (1 + rs))
-    return rsi_val
+    return pd.Series(100.0 - 100.0 / (1.0 + rs), index=series.index)
 
 
 def macd(
@@ -179,9 +256,18 @@ def macd(
     fast: int = 12,
     slow: int = 26,
     signal: int = 9,
+    ema_fast: Optional[pd.Series] = None,
+    ema_slow: Optional[pd.Series] = None,
 ) -> Tuple[pd.Series, pd.Series, pd.Series]:
-    ema_fast = ema(series, fast)
-    ema_slow = ema(series, slow)
+    if _use_talib() and ema_fast is None and ema_slow is None:
+        line, sig, hist = talib.MACD(_f64(series), fastperiod=fast, slowperiod=slow, signalperiod=signal)
+        index = series.index
+        return pd.Series(line, index=index), pd.Series(sig, index=index), pd.Series(hist, index=index)
+    # Callers that already hold the fast/slow EMAs can pass them in to skip recomputing.
+    if ema_fast is None:
+        ema_fast = ema(series, fast)
+    if ema_slow is None:
+        ema_slow = ema(series, slow)
     macd_line = ema_fast - ema_slow
     signal_line = ema(macd_line, signal)
     hist = macd_line - signal_line
@@ -193,8 +279,9 @@ def bollinger_bands(
     length: int = 20,
     std_mult: float = 2.0,
 ) -> Tuple[pd.Series, pd.Series, pd.Series]:
-    ma = series.rolling(length).mean()
-    std = series.rolling(length).std()
+    roll = series.rolling(length)
+    ma = roll.mean()
+    std = roll.std()
     upper = ma + std_mult * std
     lower = ma - std_mult * std
     return lower, ma, upper
@@ -205,13 +292,27 @@ def bollinger_bandwidth(
     length: int = 20,
     std_mult: float = 2.0,
 ) -> pd.Series:
-    lower, ma, upper = bollinger_bands(series, length, std_mult)
-    width = (upper - lower) / (ma + 1e-9)
-    return width
+    if _use_talib():
+        upper, ma, lower = talib.BBANDS(
+            _f64(series), timeperiod=length, nbdevup=std_mult, nbdevdn=std_mult, matype=0
+        )
+        return pd.Series((upper - lower) / (ma + 1e-9), index=series.index)
+    # Same as (upper - lower) / ma from bollinger_bands, without building the bands.
+    roll = series.rolling(length)
+    ma = roll.mean()
+    std = roll.std()
+    return (2.0 * std_mult * std) / (ma + 1e-9)
 
 
-def adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
+def adx(df: pd.DataFrame, period: int = 14, tr: Optional[pd.Series] = None) -> pd.Series:
     # Simplified ADX implementation; good enough for regime classification
+    if len(df) < 2 * period - 1:  # ATR/DI warm-up followed by the ADX RMA warm-up
+        return _all_nan(df.index)
+    if _use_talib():
+        return pd.Series(
+            talib.ADX(_f64(df["high"]), _f64(df["low"]), _f64(df["close"]), timeperiod=period),
+            index=df.index,
+        )
     high = df["high"]
     low = df["low"]
 
@@ -233,73 +334,89 @@ def adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
         0.0,
     )
 
-    tr = true_range(df)
-    atr_n = tr.rolling(period).mean()
+    atr_n = atr(df, period, tr=tr)
 
     plus_dm_series = pd.Series(plus_dm_arr, index=df.index)
     minus_dm_series = pd.Series(minus_dm_arr, index=df.index)
 
-    plus_di = 100 * (plus_dm_series.rolling(period).sum() / (atr_n + 1e-9))
-    minus_di = 100 * (minus_dm_series.rolling(period).sum() / (atr_n + 1e-9))
+    plus_di = 100 * (rma(plus_dm_series, period) / (atr_n + 1e-9))
+    minus_di = 100 * (rma(minus_dm_series, period) / (atr_n + 1e-9))
 
     dx = (plus_di - minus_di).abs() / (plus_di + minus_di + 1e-9) * 100
-    adx_val = dx.rolling(period).mean()
+    adx_val = rma(dx, period)
     return adx_val
 
 
 # ---------- Level and pattern helpers ----------
 
 
+def _swing_levels_np(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    window: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Swing detection on raw arrays.
+
+    Returns (low_positions, low_values, high_positions, high_values), where a bar
+    is a swing high/low if it is the max/min of the surrounding 2*window+1 bars.
+    """
+    span = 2 * window + 1
+    if highs.size < span:
+        empty_pos = np.empty(0, dtype=np.intp)
+        return empty_pos, lows[:0], empty_pos, highs[:0]
+
+    # fmax/fmin skip NaN like the pandas max()/min() the loop version used.
+    window_high = np.fmax.reduce(sliding_window_view(highs, span), axis=1)
+    window_low = np.fmin.reduce(sliding_window_view(lows, span), axis=1)
+
+    center_highs = highs[window : highs.size - window]
+    center_lows = lows[window : lows.size - window]
+    high_pos = np.flatnonzero(center_highs == window_high)
+    low_pos = np.flatnonzero(center_lows == window_low)
+    return low_pos + window, center_lows[low_pos], high_pos + window, center_highs[high_pos]
+
+
 def _find_swing_points(
     df: pd.DataFrame,
     window: int = 5,
 ) -> Tuple[List[Tuple[pd.Timestamp, float]], List[Tuple[pd.Timestamp, float]]]:
-    highs = df["high"]
-    lows = df["low"]
-    swing_highs = []
-    swing_lows = []
-    for i in range(window, len(df) - window):
-        window_high = highs.iloc[i - window : i + window + 1]
-        window_low = lows.iloc[i - window : i + window + 1]
-        if highs.iloc[i] == window_high.max():
-            swing_highs.append((df.index[i], highs.iloc[i]))
-        if lows.iloc[i] == window_low.min():
-            swing_lows.append((df.index[i], lows.iloc[i]))
+    low_pos, low_vals, high_pos, high_vals = _swing_levels_np(
+        df["high"].to_numpy(), df["low"].to_numpy(), window
+    )
+    index = df.index
+    swing_highs = list(zip(index[high_pos], high_vals))
+    swing_lows = list(zip(index[low_pos], low_vals))
     return swing_lows, swing_highs
 
 
 def _cluster_levels(levels: List[float], tolerance: float = 0.002) -> List[float]:
     if not levels:
         return []
-    levels = sorted(levels)
-    clustered = []
-    cluster = [levels[0]]
-    for lvl in levels[1:]:
-        if abs(lvl - cluster[-1]) / cluster[-1] <= tolerance:
-            cluster.append(lvl)
-        else:
-            clustered.append(sum(cluster) / len(cluster))
-            cluster = [lvl]
-    clustered.append(sum(cluster) / len(cluster))
-    return clustered
+    arr = np.sort(np.asarray(levels, dtype=np.float64))
+    # A new cluster starts wherever the gap to the previous (sorted) level exceeds tolerance.
+    breaks = np.flatnonzero(np.diff(arr) / arr[:-1] > tolerance) + 1
+    starts = np.concatenate(([0], breaks))
+    sums = np.add.reduceat(arr, starts)
+    counts = np.diff(np.concatenate((starts, [arr.size])))
+    return (sums / counts).tolist()
 
 
 def detect_structure(df: pd.DataFrame, lookback: int = 120) -> StructureInfo:
     if len(df) < 20:
         return StructureInfo(support=[], resistance=[], range=None)
 
-    df_lookback = df.iloc[-lookback:]
-    swing_lows, swing_highs = _find_swing_points(df_lookback, window=3)
-    low_levels = [lvl for _, lvl in swing_lows]
-    high_levels = [lvl for _, lvl in swing_highs]
+    # Slice the raw arrays once and reuse them for swings, clustering and the range.
+    highs = df["high"].to_numpy()[-lookback:]
+    lows = df["low"].to_numpy()[-lookback:]
+    close = df["close"].to_numpy()[-1]
 
-    support = _cluster_levels(low_levels)
-    resistance = _cluster_levels(high_levels)
+    _, low_levels, _, high_levels = _swing_levels_np(highs, lows, window=3)
+    support = _cluster_levels(low_levels.tolist())
+    resistance = _cluster_levels(high_levels.tolist())
 
-    recent = df_lookback
-    range_low = recent["low"].min()
-    range_high = recent["high"].max()
-    close = recent["close"].iloc[-1]
+    range_low = np.fmin.reduce(lows)
+    range_high = np.fmax.reduce(highs)
     width = range_high - range_low
     if width <= 0:
         range_info = None
@@ -307,9 +424,9 @@ def detect_structure(df: pd.DataFrame, lookback: int = 120) -> StructureInfo:
         in_range = (close >= range_low) and (close <= range_high)
         position_in_range = (close - range_low) / width
         range_info = RangeInfo(
-            low=range_low,
-            high=range_high,
-            in_range=in_range,
+            low=float(range_low),
+            high=float(range_high),
+            in_range=bool(in_range),
             position_in_range=float(position_in_range),
         )
 
@@ -326,13 +443,14 @@ def detect_simple_patterns(df: pd.DataFrame) -> List[Dict]:
     if len(df) < 3:
         return patterns
 
-    last = df.iloc[-1]
-    prev = df.iloc[-2]
+    # Only the last two bars matter; read them as a (2, 4) OHLC array.
+    tail = np.column_stack([df[col].to_numpy()[-2:] for col in ("open", "high", "low", "close")])
+    (_, prev_high, prev_low, _), (last_open, last_high, last_low, last_close) = tail
 
-    body_last = abs(last["close"] - last["open"])
-    range_last = last["high"] - last["low"]
-    upper_wick = last["high"] - max(last["close"], last["open"])
-    lower_wick = min(last["close"], last["open"]) - last["low"]
+    body_last = abs(last_close - last_open)
+    range_last = last_high - last_low
+    upper_wick = last_high - max(last_close, last_open)
+    lower_wick = min(last_close, last_open) - last_low
 
     # Hammer-like candle near lows
     if range_last > 0 and lower_wick > 2 * body_last and upper_wick < body_last:
@@ -343,7 +461,7 @@ def detect_simple_patterns(df: pd.DataFrame) -> List[Dict]:
         patterns.append({"type": "shooting_star_like", "confidence": 0.6})
 
     # Inside bar
-    if (last["high"] <= prev["high"]) and (last["low"] >= prev["low"]):
+    if (last_high <= prev_high) and (last_low >= prev_low):
         patterns.append({"type": "inside_bar", "confidence": 0.5})
 
     return patterns
@@ -352,21 +470,117 @@ def detect_simple_patterns(df: pd.DataFrame) -> List[Dict]:
 # ---------- Regime & scoring logic ----------
 
 
-def classify_trend_regime(df: pd.DataFrame) -> Regime:
+def _tail_slope(series: pd.Series, k: int) -> float:
+    """
+    Equivalent of `series.diff().iloc[-k:].mean()` read from the tail only:
+    the mean of k consecutive diffs telescopes to (x[-1] - x[-k-1]) / k.
+    """
+    tail = series.to_numpy()[-(k + 1):]
+    if tail.size == k + 1 and not np.isnan(tail).any():
+        return float((tail[-1] - tail[0]) / k)
+    # Short or gappy series: keep pandas' NaN-skipping semantics.
+    return float(series.diff().iloc[-k:].mean())
+
+
+def _tail_stat(series: pd.Series, window: int, stat) -> float:
+    """
+    Last value of `series.rolling(window).<stat>()` without computing the full
+    rolling series: NaN unless the trailing window is complete.
+    """
+    tail = series.to_numpy()[-window:]
+    if tail.size < window or np.isnan(tail).any():
+        return float("nan")
+    return float(stat(tail))
+
+
+class _FeatureCache:
+    """
+    Per-analyze indicator cache so the classifiers share one true_range/ATR/EMA pass.
+
+    Each feature is computed lazily on first access, so classifiers used on their
+    own only pay for what they read.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.close = df["close"]
+        if _ta_kernels.HAVE_NUMBA and not _use_talib():
+            self._fill_from_kernel()
+
+    def _fill_from_kernel(self) -> None:
+        """Seed the cached features from the fused numba kernel in one pass."""
+        high = self.df["high"].to_numpy(dtype=np.float64)
+        low = self.df["low"].to_numpy(dtype=np.float64)
+        close = self.close.to_numpy(dtype=np.float64)
+        if not (np.isfinite(high).all() and np.isfinite(low).all() and np.isfinite(close).all()):
+            return  # gaps: let the pandas helpers handle NaN semantics
+        arrays = _ta_kernels.compute_all(high, low, close)
+        index = self.df.index
+        for name, values in arrays._asdict().items():
+            # cached_property reads instance __dict__ first.
+            self.__dict__[name] = pd.Series(values, index=index)
+
+    @cached_property
+    def tr(self) -> pd.Series:
+        return true_range(self.df)
+
+    @cached_property
+    def atr(self) -> pd.Series:
+        return atr(self.df, 14, tr=self.tr)
+
+    @cached_property
+    def adx(self) -> pd.Series:
+        return adx(self.df, 14, tr=self.tr)
+
+    @cached_property
+    def ema20(self) -> pd.Series:
+        return ema(self.close, 20)
+
+    @cached_property
+    def ema50(self) -> pd.Series:
+        return ema(self.close, 50)
+
+    @cached_property
+    def rsi(self) -> pd.Series:
+        return rsi(self.close, 14)
+
+    @cached_property
+    def macd_hist(self) -> pd.Series:
+        return macd(self.close, 12, 26, 9)[2]
+
+    @cached_property
+    def bbw(self) -> pd.Series:
+        return bollinger_bandwidth(self.close, 20, 2.0)
+
+    @cached_property
+    def bbw_ma_last(self) -> float:
+        return _tail_stat(self.bbw, 50, np.mean)
+
+    @cached_property
+    def atr_pct(self) -> pd.Series:
+        return self.atr / (self.close + 1e-9)
+
+    @cached_property
+    def atr_pct_med50_last(self) -> float:
+        return _tail_stat(self.atr_pct, 50, np.median)
+
+
+def classify_trend_regime(df: pd.DataFrame, feats: Optional[_FeatureCache] = None) -> Regime:
     if len(df) < 60:
         return Regime(state="unknown", confidence=0.0)
 
-    close = df["close"]
-    ema20 = ema(close, 20)
-    ema50 = ema(close, 50)
-    adx_val = adx(df, 14)
+    feats = feats if feats is not None else _FeatureCache(df)
+    close = feats.close
+    ema20 = feats.ema20
+    ema50 = feats.ema50
+    adx_val = feats.adx
 
     ema20_last = ema20.iloc[-1]
     ema50_last = ema50.iloc[-1]
     close_last = close.iloc[-1]
     adx_last = adx_val.iloc[-1]
 
-    ema_slope = ema20.diff().iloc[-5:].mean()
+    ema_slope = _tail_slope(ema20, 5)
 
     if np.isnan(adx_last):
         return Regime(state="unknown", confidence=0.0)
@@ -384,21 +598,16 @@ def classify_trend_regime(df: pd.DataFrame) -> Regime:
         return Regime(state="chop", confidence=0.5)
 
 
-def classify_vol_regime(df: pd.DataFrame) -> Regime:
+def classify_vol_regime(df: pd.DataFrame, feats: Optional[_FeatureCache] = None) -> Regime:
     if len(df) < 60:
         return Regime(state="unknown", confidence=0.0)
 
-    close = df["close"]
-    atr_val = atr(df, 14)
-    atr_pct = atr_val / (close + 1e-9)
-    bbw = bollinger_bandwidth(close, 20, 2.0)
+    feats = feats if feats is not None else _FeatureCache(df)
+    bbw_last = feats.bbw.iloc[-1]
+    bbw_ma_last = feats.bbw_ma_last
 
-    bbw_ma = bbw.rolling(50).mean()
-    bbw_last = bbw.iloc[-1]
-    bbw_ma_last = bbw_ma.iloc[-1]
-
-    atr_pct_med = atr_pct.rolling(50).median().iloc[-1]
-    atr_pct_last = atr_pct.iloc[-1]
+    atr_pct_med = feats.atr_pct_med50_last
+    atr_pct_last = feats.atr_pct.iloc[-1]
 
     if np.isnan(bbw_last) or np.isnan(bbw_ma_last) or np.isnan(atr_pct_med):
         return Regime(state="unknown", confidence=0.0)
@@ -421,15 +630,15 @@ def classify_vol_regime(df: pd.DataFrame) -> Regime:
     return Regime(state="normal", confidence=0.5)
 
 
-def compute_momentum_state(df: pd.DataFrame) -> MomentumState:
-    close = df["close"]
-    rsi_series = rsi(close, 14)
-    _, _, hist = macd(close, 12, 26, 9)
+def compute_momentum_state(df: pd.DataFrame, feats: Optional[_FeatureCache] = None) -> MomentumState:
+    feats = feats if feats is not None else _FeatureCache(df)
+    rsi_series = feats.rsi
+    hist = feats.macd_hist
 
     rsi_val = float(rsi_series.iloc[-1])
-    rsi_slope = float(rsi_series.diff().iloc[-4:].mean())
+    rsi_slope = _tail_slope(rsi_series, 4)
     hist_val = float(hist.iloc[-1])
-    hist_slope = float(hist.diff().iloc[-4:].mean())
+    hist_slope = _tail_slope(hist, 4)
 
     # classify momentum state
     if hist_val > 0 and hist_slope > 0:
@@ -605,6 +814,100 @@ def _suggest_options_guidance(
 # ---------- Data access + main engine ----------
 
 
+# Optional on-disk OHLCV cache. It is off unless the env var names a directory;
+# pickles are only ever read from a directory the user chose.
+OHLCV_CACHE_DIR_ENV = "STRATDECK_OHLCV_CACHE_DIR"
+OHLCV_TTL_MARKET_SECONDS = 5 * 60
+OHLCV_TTL_OFF_HOURS_SECONDS = 24 * 60 * 60
+
+_NY_TZ = ZoneInfo("America/New_York")
+# (symbol, interval, period) -> ((ttl, bucket), frame). One slot per series, so a
+# new bucket overwrites the previous one instead of accumulating.
+_OHLCV_CACHE: Dict[Tuple[str, str, str], Tuple[Tuple[int, int], pd.DataFrame]] = {}
+
+
+def _ohlcv_ttl(now: Optional[float] = None) -> int:
+    """Short TTL while US equities trade (Mon–Fri 09:30–16:00 ET), a day otherwise."""
+    ny = datetime.fromtimestamp(time.time() if now is None else now, _NY_TZ)
+    minutes = ny.hour * 60 + ny.minute
+    if ny.weekday() < 5 and 9 * 60 + 30 <= minutes < 16 * 60:
+        return OHLCV_TTL_MARKET_SECONDS
+    return OHLCV_TTL_OFF_HOURS_SECONDS
+
+
+def _cached_download(yf_symbol: str, interval: str, period: str) -> Optional[pd.DataFrame]:
+    """
+    yf.download with an in-process cache (plus an opt-in on-disk one, see
+    OHLCV_CACHE_DIR_ENV) keyed by time bucket.
+
+    Entries expire when the bucket (now // TTL) rolls over. Disk errors are
+    logged and fall through to a fresh download.
+    """
+    ttl = _ohlcv_ttl()
+    bucket = int(time.time() // ttl)
+    key = (yf_symbol, interval, period)
+    stamp = (ttl, bucket)
+    cached = _OHLCV_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    cache_path = _ohlcv_disk_path(yf_symbol, interval, period, stamp)
+    if cache_path is not None and cache_path.exists():
+        try:
+            df = pd.read_pickle(cache_path)
+            _OHLCV_CACHE[key] = (stamp, df)
+            return df
+        except Exception as exc:
+            log.warning("[ta] failed to read OHLCV cache %s: %s", cache_path, exc)
+
+    df = yf.download(
+        yf_symbol,
+        period=period,
+        interval=interval,
+        auto_adjust=False,
+        progress=False,
+    )
+    if df is None or df.empty:
+        return df
+
+    _OHLCV_CACHE[key] = (stamp, df)
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in cache_path.parent.glob("*.pkl"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+            df.to_pickle(cache_path)
+        except Exception as exc:
+            log.warning("[ta] failed to write OHLCV cache %s: %s", cache_path, exc)
+    return df
+
+
+def _ohlcv_disk_path(
+    yf_symbol: str, interval: str, period: str, stamp: Tuple[int, int]
+) -> Optional[Path]:
+    cache_dir = os.getenv(OHLCV_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    # One directory per series (symbol percent-encoded, so distinct symbols
+    # never share a name) holding a file per TTL bucket.
+    ttl, bucket = stamp
+    series_dir = Path(cache_dir) / url_quote(yf_symbol, safe="") / f"{interval}_{period}"
+    return series_dir / f"{ttl}_{bucket}.pkl"
+
+
+_OHLCV_COLUMNS = frozenset(("open", "high", "low", "close", "volume"))
+_OHLC_FLOAT32 = {col: np.float32 for col in ("open", "high", "low", "close")}
+_OHLCV_RENAME = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Adj Close": "adj_close",
+    "Volume": "volume",
+}
+
+
 class ChartistEngine:
     """
     Lightweight technical analysis engine intended for use by the StratDeck ChartistAgent.
@@ -645,29 +948,64 @@ class ChartistEngine:
         # For now we run full logic on the *shortest* timeframe and use others later if needed
         primary_tf = timeframes[0]
         df = self._get_ohlcv(symbol, primary_tf, lookback_bars)
+        return self._analyze_frame(symbol, df, primary_tf, strategy_hint)
+
+    def analyze_many(
+        self,
+        symbols: Sequence[str],
+        timeframes: Tuple[Timeframe, ...] = ("30m", "1h", "1d"),
+        strategy_hint: Optional[str] = None,
+        lookback_bars: int = 200,
+        max_workers: int = 8,
+    ) -> Dict[str, TAResult]:
+        """
+        Analyze several symbols and return {symbol: TAResult}.
+
+        OHLCV is fetched serially (yf.download keeps module-global state and is
+        not thread-safe); only the indicator math on the fetched frames runs in
+        a thread pool. Errors propagate like `analyze`.
+        """
+        unique = list(dict.fromkeys(symbols))
+        primary_tf = timeframes[0]
+        frames = [self._get_ohlcv(sym, primary_tf, lookback_bars) for sym in unique]
+
+        def _run(sym: str, df: Optional[pd.DataFrame]) -> TAResult:
+            return self._analyze_frame(sym, df, primary_tf, strategy_hint)
+
+        if len(unique) <= 1 or max_workers <= 1:
+            return {sym: _run(sym, df) for sym, df in zip(unique, frames)}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+            return dict(zip(unique, pool.map(_run, unique, frames)))
+
+    # ---- internals ----
 
+    def _analyze_frame(
+        self,
+        symbol: str,
+        df: Optional[pd.DataFrame],
+        primary_tf: Timeframe,
+        strategy_hint: Optional[str],
+    ) -> TAResult:
         if df is None or df.empty:
             raise ValueError(f"No OHLCV data available for {symbol} @ {primary_tf}")
 
         df = df.sort_index()
-        df = df.rename(
-            columns={
-                "Open": "open",
-                "High": "high",
-                "Low": "low",
-                "Close": "close",
-                "Adj Close": "adj_close",
-                "Volume": "volume",
-            }
-        )
+        # Mock/cached frames already use lowercase names; only rename provider output.
+        if not _OHLCV_COLUMNS.issubset(df.columns):
+            df = df.rename(columns=_OHLCV_RENAME)
 
         for col in ("open", "high", "low", "close", "volume"):
             if col not in df.columns:
                 raise ValueError(f"Missing column '{col}' in OHLCV for {symbol} @ {primary_tf}")
 
-        trend_regime = classify_trend_regime(df)
-        vol_regime = classify_vol_regime(df)
-        momentum = compute_momentum_state(df)
+        # float32 halves the OHLC footprint for the indicator passes. Structure and
+        # patterns report price levels, so they keep the float64 frame.
+        ind_df = df.astype(_OHLC_FLOAT32)
+
+        feats = _FeatureCache(ind_df)
+        trend_regime = classify_trend_regime(ind_df, feats)
+        vol_regime = classify_vol_regime(ind_df, feats)
+        momentum = compute_momentum_state(ind_df, feats)
         structure = detect_structure(df)
         patterns = detect_simple_patterns(df)
         scores = compute_scores(
@@ -698,8 +1036,6 @@ class ChartistEngine:
             options_guidance=options_guidance,
         )
 
-    # ---- internals ----
-
     def _get_ohlcv(self, symbol: str, timeframe: Timeframe, lookback_bars: int) -> Optional[pd.DataFrame]:
         """
         Fetch OHLCV data for the symbol/timeframe.
@@ -721,13 +1057,7 @@ class ChartistEngine:
         yf_symbol = self._map_symbol_for_data(symbol)
 
         interval = self._map_tf_to_yf_interval(timeframe)
-        df = yf.download(
-            yf_symbol,
-            period="60d",
-            interval=interval,
-            auto_adjust=False,
-            progress=False,
-        )
+        df = _cached_download(yf_symbol, interval, "60d")
 
         # If still nothing, fall back to synthetic (keep your existing warning)
         if df is None or df.empty:
@@ -767,28 +1097,39 @@ class ChartistEngine:
         """
         Generate synthetic OHLCV for testing wired flows without a real data source.
         """
-        dates = pd.date_range(end=pd.Timestamp.utcnow(), periods=lookback_bars, freq="30min")
+        n = lookback_bars
+        dates = pd.date_range(end=pd.Timestamp.now(tz="UTC"), periods=n, freq="30min")
         # Deterministic seed per symbol keeps mock TA outcomes stable across runs.
         rng = np.random.default_rng(abs(hash(symbol)) % (2**32))
-        base_price = 100.0
-        noise = rng.normal(0, 0.5, size=lookback_bars).cumsum()
-        trend = np.linspace(-1, 1, lookback_bars)
-        price = base_price + trend + noise
-
-        high = price + rng.uniform(0.2, 0.8, size=lookback_bars)
-        low = price - rng.uniform(0.2, 0.8, size=lookback_bars)
-        open_ = price + rng.uniform(-0.3, 0.3, size=lookback_bars)
-        close = price + rng.uniform(-0.3, 0.3, size=lookback_bars)
-        volume = rng.integers(1_000, 10_000, size=lookback_bars)
-
-        df = pd.DataFrame(
+
+        # One normal draw for the walk and one uniform block for all offsets,
+        # transformed in place: rows are high wick, low wick, open, close.
+        price = rng.standard_normal(n)
+        price *= 0.5
+        np.cumsum(price, out=price)
+        price += np.linspace(-1, 1, n)
+        price += 100.0
+
+        offsets = rng.random((4, n))
+        offsets[:2] *= 0.6
+        offsets[:2] += 0.2
+        offsets[2:] *= 0.6
+        offsets[2:] -= 0.3
+
+        offsets[0] += price
+        np.subtract(price, offsets[1], out=offsets[1])
+        offsets[2] += price
+        offsets[3] += price
+        volume = rng.integers(1_000, 10_000, size=n)
+
+        return pd.DataFrame(
             {
-                "open": open_,
-                "high": high,
-                "low": low,
-                "close": close,
+                "open": offsets[2],
+                "high": offsets[0],
+                "low": offsets[1],
+                "close": offsets[3],
                 "volume": volume,
             },
             index=dates,
+            copy=False,
         )
-        return df
@@ -1,22 +1,36 @@
 import json
 import os
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
+
+_DEFAULT_SNAPSHOT = {"SPX": 0.35, "XSP": 0.38, "QQQ": 0.29, "IWM": 0.33}
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path: str, stamp: Tuple[int, int]) -> Dict[str, float]:
+    # `stamp` (mtime_ns, size) only participates in the cache key so edits invalidate it.
+    with open(path, "r") as f:
+        raw = json.load(f)
+    # accept either {sym:{ivr:0.42}} or {sym:0.42}
+    out = {}
+    for k, v in raw.items():
+        out[k] = float(v["ivr"]) if isinstance(v, dict) and "ivr" in v else float(v)
+    return out
+
 
 def load_snapshot(path: str = None) -> Dict[str, float]:
     """
     Load IV/IVR snapshot as {SYMBOL: ivr_float_0to1}.
     Falls back to sane defaults if file not found.
+
+    Parsed snapshots are cached per path and re-read when the file changes.
     """
     if path is None:
         path = os.path.join(os.path.dirname(__file__), "..", "data", "iv_snapshot.json")
+    path = os.path.abspath(path)
     try:
-        with open(path, "r") as f:
-            raw = json.load(f)
-        # accept either {sym:{ivr:0.42}} or {sym:0.42}
-        out = {}
-        for k, v in raw.items():
-            out[k] = float(v["ivr"]) if isinstance(v, dict) and "ivr" in v else float(v)
-        return out
+        st = os.stat(path)
+        return dict(_load_cached(path, (st.st_mtime_ns, st.st_size)))
     except FileNotFoundError:
         # fallback so MVP runs day one
-        return {"SPX": 0.35, "XSP": 0.38, "QQQ": 0.29, "IWM": 0.33}
\ No newline at end of file
+        return dict(_DEFAULT_SNAPSHOT)
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
-from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
-
-from pydantic import BaseModel
+import copy
+import functools
+import math
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit  # optional, compiles the scalar scorer on first use
+except Exception:  # pragma: no cover - optional dependency
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 from stratdeck.agents.trade_planner import TradeIdea, TradeLeg
 from stratdeck.filters.human_rules import StrategyRuleSnapshot
@@ -15,14 +32,83 @@ class VetVerdict(str, Enum):
     REJECT = "REJECT"
 
 
-class IdeaVetting(BaseModel):
-    score: float
-    verdict: VetVerdict
-    rationale: str
-    reasons: List[str]
+class IdeaVetting:
+    """
+    Result of vetting one idea.
+
+    Ideas vetted by this module carry their check outcomes as compact flags;
+    ``reasons`` and ``rationale`` are only rendered to text when first read,
+    so score/verdict-only consumers never pay for the string formatting.
+    """
+
+    # Slotted plain class rather than a pydantic model: every field is read
+    # from already-validated TradeIdea / StrategyRuleSnapshot objects.
+    __slots__ = ("score", "verdict", "_rationale", "_reasons", "_pending")
+
+    def __init__(self, score: float, verdict: VetVerdict, rationale: str, reasons: List[str]) -> None:
+        self.score = score
+        self.verdict = verdict
+        self._rationale: Optional[str] = rationale
+        self._reasons: Optional[List[str]] = reasons
+        self._pending: Optional[Tuple[VettingInputs, List[Flag]]] = None
+
+    @classmethod
+    def deferred(
+        cls, score: float, verdict: VetVerdict, inputs: VettingInputs, flags: List[Flag]
+    ) -> "IdeaVetting":
+        obj = cls.__new__(cls)
+        obj.score = score
+        obj.verdict = verdict
+        obj._rationale = None
+        obj._reasons = None
+        obj._pending = (inputs, flags)
+        return obj
+
+    def _materialize(self) -> None:
+        inputs, flags = self._pending
+        self._reasons = _render_reasons(flags)
+        self._rationale = _render_rationale(inputs, self.verdict, flags)
+        self._pending = None
+
+    @property
+    def reasons(self) -> List[str]:
+        if self._pending is not None:
+            self._materialize()
+        return self._reasons
+
+    @property
+    def rationale(self) -> str:
+        if self._pending is not None:
+            self._materialize()
+        return self._rationale
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "score": self.score,
+            "verdict": self.verdict.value,
+            "rationale": self.rationale,
+            "reasons": list(self.reasons),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdeaVetting):
+            return NotImplemented
+        return (
+            self.score == other.score
+            and self.verdict == other.verdict
+            and self.rationale == other.rationale
+            and self.reasons == other.reasons
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"IdeaVetting(score={self.score!r}, verdict={self.verdict!r}, "
+            f"rationale={self.rationale!r}, reasons={self.reasons!r})"
+        )
 
 
-class VettingInputs(BaseModel):
+@dataclass(slots=True)
+class VettingInputs:
     # From TradeIdea
     symbol: Optional[str] = None
     strategy_id: Optional[str] = None
@@ -49,77 +135,205 @@ class VettingInputs(BaseModel):
     ivr_floor: Optional[float] = None
     pop_floor: Optional[float] = None
     credit_per_width_floor: Optional[float] = None
-    allowed_trend_regimes: Optional[List[str]] = None
-    allowed_vol_regimes: Optional[List[str]] = None
+    # Allowlists keep the strategy's configured order for the reason text; the
+    # matching frozensets below are only used for the membership test.
+    allowed_trend_regimes: Optional[Tuple[str, ...]] = None
+    allowed_vol_regimes: Optional[Tuple[str, ...]] = None
+    trend_regime_set: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    vol_regime_set: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Dict ideas carry raw JSON numbers; coerce like the pydantic model did
+        # so the rendered reasons read "Width 5.0" / "DTE 45" for any input.
+        for name in _INT_INPUTS:
+            setattr(self, name, _as_int(getattr(self, name)))
+        for name in _FLOAT_INPUTS:
+            value = getattr(self, name)
+            if value is not None:
+                setattr(self, name, float(value))
+        self.allowed_trend_regimes = _regime_tuple(self.allowed_trend_regimes)
+        self.allowed_vol_regimes = _regime_tuple(self.allowed_vol_regimes)
+        self.trend_regime_set = _regime_set(self.allowed_trend_regimes)
+        self.vol_regime_set = _regime_set(self.allowed_vol_regimes)
+
+
+_INT_INPUTS = ("dte", "dte_target", "dte_min", "dte_max")
+_FLOAT_INPUTS = (
+    "spread_width",
+    "short_delta",
+    "ivr",
+    "pop",
+    "credit_per_width",
+    "expected_spread_width",
+    "target_short_delta",
+    "short_delta_min",
+    "short_delta_max",
+    "ivr_floor",
+    "pop_floor",
+    "credit_per_width_floor",
+)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    if value is None or type(value) is int:
+        return value
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError(f"expected a whole number of days, got {value!r}")
+    return int(number)
+
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=512)
+def _make_resolver(obj_type: type, names: Tuple[str, ...]) -> Callable[[Any], Any]:
+    """Build a lookup for ``names`` specialised to ``obj_type`` (dict keys or attributes)."""
+    if issubclass(obj_type, dict):
+
+        def _resolve_keys(obj: Any) -> Any:
+            for name in names:
+                if name in obj:
+                    return obj[name]
+            return None
+
+        return _resolve_keys
+
+    def _resolve_attrs(obj: Any) -> Any:
+        for name in names:
+            value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                return value
+        return None
+
+    return _resolve_attrs
 
 
 def _get_value(obj: Any, *names: str) -> Any:
-    for name in names:
-        if isinstance(obj, dict) and name in obj:
-            return obj.get(name)
-        if hasattr(obj, name):
-            return getattr(obj, name)
+    return _make_resolver(type(obj), names)(obj)
+
+
+def _leg_delta(leg: Any) -> Optional[float]:
+    return leg.get("delta") if isinstance(leg, dict) else getattr(leg, "delta", None)
+
+
+def _short_delta_from_trade_idea(idea: TradeIdea) -> Optional[float]:
+    if idea.short_put_delta is not None:
+        return idea.short_put_delta
+    for leg in idea.short_legs or ():
+        delta = _leg_delta(leg)
+        if delta is not None:
+            return delta
     return None
 
 
-def _extract_short_delta(idea: Any) -> Optional[float]:
+def _short_delta_from_dict(idea: Dict[str, Any]) -> Optional[float]:
+    direct = idea["short_put_delta"] if "short_put_delta" in idea else idea.get("short_delta")
+    if direct is not None:
+        return direct
+    for leg in idea.get("short_legs") or ():
+        delta = _leg_delta(leg)
+        if delta is not None:
+            return delta
+    return None
+
+
+def _short_delta_generic(idea: Any) -> Optional[float]:
     direct = _get_value(idea, "short_put_delta", "short_delta")
     if direct is not None:
         return direct
 
     legs = _get_value(idea, "short_legs") or []
     for leg in legs:
-        delta = getattr(leg, "delta", None) if not isinstance(leg, dict) else leg.get("delta")
+        delta = _leg_delta(leg)
         if delta is not None:
             return delta
     return None
 
 
-def build_vetting_inputs(idea: Any, rules: StrategyRuleSnapshot) -> VettingInputs:
-    symbol = _get_value(idea, "symbol", "trade_symbol", "data_symbol")
-    strategy_id = _get_value(idea, "strategy_id", "strategy")
-    strategy_type = _get_value(idea, "strategy")
-    direction = _get_value(idea, "direction")
-
-    dte = _get_value(idea, "dte", "dte_target")
-    spread_width = _get_value(idea, "spread_width", "width")
-    short_delta = _extract_short_delta(idea)
-    ivr = _get_value(idea, "ivr")
-    pop = _get_value(idea, "pop")
-    credit_per_width = _get_value(idea, "credit_per_width")
-    trend_regime = _get_value(idea, "trend_regime")
-    vol_regime = _get_value(idea, "vol_regime")
-
-    return VettingInputs(
-        symbol=symbol,
-        strategy_id=strategy_id,
-        strategy_type=strategy_type,
-        direction=direction,
-        dte=dte,
-        spread_width=spread_width,
-        short_delta=short_delta,
-        ivr=ivr,
-        pop=pop,
-        credit_per_width=credit_per_width,
-        trend_regime=trend_regime,
-        vol_regime=vol_regime,
-        dte_target=rules.dte_target,
-        dte_min=rules.dte_min,
-        dte_max=rules.dte_max,
-        expected_spread_width=rules.expected_spread_width,
-        target_short_delta=rules.target_short_delta,
-        short_delta_min=rules.short_delta_min,
-        short_delta_max=rules.short_delta_max,
-        ivr_floor=rules.ivr_floor,
-        pop_floor=rules.pop_floor,
-        credit_per_width_floor=rules.credit_per_width_floor,
-        allowed_trend_regimes=rules.allowed_trend_regimes,
-        allowed_vol_regimes=rules.allowed_vol_regimes,
+@functools.lru_cache(maxsize=64)
+def _short_delta_extractor(idea_type: type) -> Callable[[Any], Optional[float]]:
+    if issubclass(idea_type, TradeIdea):
+        return _short_delta_from_trade_idea
+    if issubclass(idea_type, dict):
+        return _short_delta_from_dict
+    return _short_delta_generic
+
+
+def _extract_short_delta(idea: Any) -> Optional[float]:
+    return _short_delta_extractor(type(idea))(idea)
+
+
+def _intern(value: Any) -> Any:
+    # Symbols, strategy ids and regimes repeat across a batch; interning lets
+    # equality and set membership short-circuit on identity.
+    return sys.intern(value) if type(value) is str else value
+
+
+@functools.lru_cache(maxsize=256)
+def _frozen_regimes(values: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(map(_intern, values))
+
+
+def _regime_set(values: Optional[Sequence[str]]) -> Optional[FrozenSet[str]]:
+    # Keyed on the allowlist contents, so every idea vetted against the same
+    # snapshot shares one frozenset. An empty allowlist still rejects everything.
+    if values is None:
+        return None
+    return _frozen_regimes(tuple(values))
+
+
+def _regime_tuple(values: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    # Hashable, order-preserving form of an allowlist for VettingInputs and the
+    # vet cache key (differently ordered lists render differently).
+    if values is None or type(values) is tuple:
+        return values
+    return tuple(map(_intern, values))
+
+
+def _idea_fields(idea: Any) -> Tuple[Any, ...]:
+    # Same order as the TradeIdea half of VettingInputs.
+    return (
+        _intern(_get_value(idea, "symbol", "trade_symbol", "data_symbol")),
+        _intern(_get_value(idea, "strategy_id", "strategy")),
+        _intern(_get_value(idea, "strategy")),
+        _intern(_get_value(idea, "direction")),
+        _get_value(idea, "dte", "dte_target"),
+        _get_value(idea, "spread_width", "width"),
+        _extract_short_delta(idea),
+        _get_value(idea, "ivr"),
+        _get_value(idea, "pop"),
+        _get_value(idea, "credit_per_width"),
+        _intern(_get_value(idea, "trend_regime")),
+        _intern(_get_value(idea, "vol_regime")),
+    )
+
+
+def _rules_fields(rules: StrategyRuleSnapshot) -> Tuple[Any, ...]:
+    # Same order as the StrategyRuleSnapshot half of VettingInputs.
+    return (
+        rules.dte_target,
+        rules.dte_min,
+        rules.dte_max,
+        rules.expected_spread_width,
+        rules.target_short_delta,
+        rules.short_delta_min,
+        rules.short_delta_max,
+        rules.ivr_floor,
+        rules.pop_floor,
+        rules.credit_per_width_floor,
+        _regime_tuple(rules.allowed_trend_regimes),
+        _regime_tuple(rules.allowed_vol_regimes),
     )
 
 
-def _score_above_floor(value: Optional[float], floor: Optional[float], max_points: float) -> float:
-    if value is None or floor is None:
+def build_vetting_inputs(idea: Any, rules: StrategyRuleSnapshot) -> VettingInputs:
+    return VettingInputs(*_idea_fields(idea), *_rules_fields(rules))
+
+
+@njit(cache=True)
+def _floor_points(value: float, floor: float, max_points: float) -> float:
+    if math.isnan(value) or math.isnan(floor):
         return 0.0
     margin = value - floor
     if margin <= 0:
@@ -131,267 +345,571 @@ def _score_above_floor(value: Optional[float], floor: Optional[float], max_point
     return max_points
 
 
-def _score_band(value: Optional[float], target: Optional[float], min_v: Optional[float], max_v: Optional[float], max_points: float) -> float:
-    if value is None:
+@njit(cache=True)
+def _target_points(
+    value: float,
+    target: float,
+    min_v: float,
+    max_v: float,
+    max_points: float,
+    near: float,
+    mid: float,
+    inclusive: bool,
+) -> float:
+    # NaN bounds compare False, so a missing min/max never rejects.
+    if math.isnan(value):
         return 0.0
-    if min_v is not None and value < min_v:
+    if value < min_v or value > max_v:
         return -5.0
-    if max_v is not None and value > max_v:
-        return -5.0
-    if target is None:
+    if math.isnan(target):
         return max_points * 0.6
     diff = abs(value - target)
-    if diff < 0.02:
+    if diff <= near if inclusive else diff < near:
         return max_points
-    if diff < 0.05:
+    if diff <= mid if inclusive else diff < mid:
         return max_points * 0.7
     return max_points * 0.4
 
 
-def _score_window(value: Optional[int], target: Optional[int], min_v: Optional[int], max_v: Optional[int], max_points: float) -> float:
-    if value is None:
-        return 0.0
-    if min_v is not None and value < min_v:
-        return -5.0
-    if max_v is not None and value > max_v:
-        return -5.0
-    if target is None:
-        return max_points * 0.6
-    diff = abs(value - target)
-    if diff <= 1:
-        return max_points
-    if diff <= 3:
-        return max_points * 0.7
-    return max_points * 0.4
+@njit(cache=True)
+def _score_core(
+    dte: float,
+    dte_target: float,
+    dte_min: float,
+    dte_max: float,
+    ivr: float,
+    ivr_floor: float,
+    pop: float,
+    pop_floor: float,
+    cpw: float,
+    cpw_floor: float,
+    sd: float,
+    sd_tgt: float,
+    sd_min: float,
+    sd_max: float,
+) -> float:
+    """Sum of the DTE window, IVR/POP/cpw floor and short-delta band points (NaN = missing)."""
+    points = _target_points(dte, dte_target, dte_min, dte_max, 10.0, 1.0, 3.0, True)
+    points += _floor_points(ivr, ivr_floor, 12.0)
+    points += _floor_points(pop, pop_floor, 12.0)
+    points += _floor_points(cpw, cpw_floor, 10.0)
+    points += _target_points(sd, sd_tgt, sd_min, sd_max, 8.0, 0.02, 0.05, False)
+    return points
+
+
+def _nan(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _fmt_float(val: Optional[float]) -> str:
+    return "NA" if val is None else format(val, ".2f")
+
+
+def _fmt_any(val: Any) -> str:
+    if val is None:
+        return "NA"
+    if isinstance(val, float):
+        return format(val, ".2f")
+    return str(val)
+
+
+# Rationale body segments, in output order; bit i of the template index is set
+# when segment i has its values present.
+_RATIONALE_PARTS = (
+    "DTE {dte}",
+    "width {width}",
+    "short Δ {short_delta}",
+    "IVR {ivr} vs floor {ivr_floor}",
+    "POP {pop} vs floor {pop_floor}",
+    "cpw {cpw} vs floor {cpw_floor}",
+)
+_RATIONALE_TEMPLATES = tuple(
+    "{name} {descriptor}: "
+    + ", ".join(part for bit, part in enumerate(_RATIONALE_PARTS) if mask >> bit & 1)
+    + " – {verdict}."
+    for mask in range(1 << len(_RATIONALE_PARTS))
+)
+
+
+class FlagCode(IntEnum):
+    """
+    Outcome of a single vetting check. The hundreds digit is the category,
+    which is also the order reasons are listed in: violations, borderline
+    flags, regime notes, then informational notes.
+    """
+
+    DTE_BELOW = 0
+    DTE_ABOVE = 1
+    WIDTH_EXCEEDS = 2
+    DELTA_BELOW = 3
+    DELTA_ABOVE = 4
+    FLOOR_BELOW = 5
+    TREND_NOT_ALLOWED = 6
+    VOL_NOT_ALLOWED = 7
+
+    DTE_NEAR_MIN = 100
+    DTE_NEAR_MAX = 101
+    DELTA_NEAR_MIN = 102
+    DELTA_NEAR_MAX = 103
+    FLOOR_NEAR = 104
+
+    TREND_MISSING = 200
+    VOL_MISSING = 201
+
+    DTE_MISSING = 300
+    DTE_PLAIN = 301
+    DTE_WITHIN = 302
+    WIDTH_PLAIN = 303
+    WIDTH_MATCHES = 304
+    DELTA_PLAIN = 305
+    DELTA_WITHIN = 306
+    FLOOR_OK = 307
+    TREND_OK = 308
+    VOL_OK = 309
+
+
+_BORDERLINE = 100
+_REGIME = 200
+_NOTE = 300
+
+Flag = Tuple[int, tuple]
+
+_RENDERERS: Dict[int, Callable[..., str]] = {
+    FlagCode.DTE_BELOW: lambda dte, lo, hi: f"DTE {dte} below window [{lo}, {hi}]",
+    FlagCode.DTE_ABOVE: lambda dte, lo, hi: f"DTE {dte} above window [{lo}, {hi}]",
+    FlagCode.WIDTH_EXCEEDS: lambda w, exp: f"Width {w} exceeds allowed {exp}",
+    FlagCode.DELTA_BELOW: lambda d, lo: f"Short leg delta {d:.2f} below min {lo}",
+    FlagCode.DELTA_ABOVE: lambda d, hi: f"Short leg delta {d:.2f} above max {hi}",
+    FlagCode.FLOOR_BELOW: lambda label, v, f: f"{label} {_fmt_float(v)} below floor {_fmt_float(f)}",
+    FlagCode.TREND_NOT_ALLOWED: lambda r, allowed: f"trend_regime {r!r} not allowed {list(allowed)!r}",
+    FlagCode.VOL_NOT_ALLOWED: lambda r, allowed: f"vol_regime {r!r} not allowed {list(allowed)!r}",
+    FlagCode.DTE_NEAR_MIN: lambda dte, lo: f"DTE {dte} near min {lo} – borderline",
+    FlagCode.DTE_NEAR_MAX: lambda dte, hi: f"DTE {dte} near max {hi} – borderline",
+    FlagCode.DELTA_NEAR_MIN: lambda d, lo: f"Short delta {d:.2f} near min {lo:.2f} – borderline",
+    FlagCode.DELTA_NEAR_MAX: lambda d, hi: f"Short delta {d:.2f} near max {hi:.2f} – borderline",
+    FlagCode.FLOOR_NEAR: lambda label, v, f: (
+        f"{label} {_fmt_float(v)} only slightly above floor {_fmt_float(f)} – borderline"
+    ),
+    FlagCode.TREND_MISSING: lambda: "trend_regime missing while allowlist configured",
+    FlagCode.VOL_MISSING: lambda: "vol_regime missing while allowlist configured",
+    FlagCode.DTE_MISSING: lambda: "DTE missing",
+    FlagCode.DTE_PLAIN: lambda dte: f"DTE {dte}",
+    FlagCode.DTE_WITHIN: lambda dte, lo, hi: f"DTE {dte} within [{lo}, {hi}]",
+    FlagCode.WIDTH_PLAIN: lambda w: f"Width {w}",
+    FlagCode.WIDTH_MATCHES: lambda w, exp: f"Width {w} matches expected {exp}",
+    FlagCode.DELTA_PLAIN: lambda d: f"Short delta {d:.2f}",
+    FlagCode.DELTA_WITHIN: lambda d, lo, hi: f"Short delta {d:.2f} within [{lo}, {hi}]",
+    FlagCode.FLOOR_OK: lambda label, v, f: f"{label} {_fmt_float(v)} >= floor {_fmt_float(f)}",
+    FlagCode.TREND_OK: lambda r: f"trend_regime {r}",
+    FlagCode.VOL_OK: lambda r: f"vol_regime {r}",
+}
+
+
+def _render(code: int, args: tuple) -> str:
+    return _RENDERERS[code](*args)
+
+
+def _render_reasons(flags: Sequence[Flag]) -> List[str]:
+    # Stable sort keeps check order within each category.
+    return [_render(code, args) for code, args in sorted(flags, key=lambda f: f[0] // 100)]
+
+
+def _render_rationale(inputs: VettingInputs, verdict: VetVerdict, flags: Sequence[Flag]) -> str:
+    present = (
+        (inputs.dte is not None)
+        | (inputs.spread_width is not None) << 1
+        | (inputs.short_delta is not None) << 2
+        | (inputs.ivr is not None and inputs.ivr_floor is not None) << 3
+        | (inputs.pop is not None and inputs.pop_floor is not None) << 4
+        | (inputs.credit_per_width is not None and inputs.credit_per_width_floor is not None) << 5
+    )
+    rationale = _RATIONALE_TEMPLATES[present].format(
+        name=inputs.symbol or "?",
+        descriptor=inputs.strategy_id or inputs.strategy_type or "idea",
+        verdict=verdict.value,
+        dte=inputs.dte,
+        width=_fmt_any(inputs.spread_width),
+        short_delta=_fmt_float(inputs.short_delta),
+        ivr=_fmt_float(inputs.ivr),
+        ivr_floor=_fmt_float(inputs.ivr_floor),
+        pop=_fmt_float(inputs.pop),
+        pop_floor=_fmt_float(inputs.pop_floor),
+        cpw=_fmt_float(inputs.credit_per_width),
+        cpw_floor=_fmt_float(inputs.credit_per_width_floor),
+    )
+    borderline_flags = [_render(c, a) for c, a in flags if _BORDERLINE <= c < _REGIME]
+    regime_flags = [_render(c, a) for c, a in flags if _REGIME <= c < _NOTE]
+    if borderline_flags and regime_flags:
+        rationale = (
+            f"{rationale} borderline metrics: {'; '.join(borderline_flags)}"
+            f" regime notes: {'; '.join(regime_flags)}"
+        )
+    elif borderline_flags:
+        rationale = f"{rationale} borderline metrics: {'; '.join(borderline_flags)}"
+    elif regime_flags:
+        rationale = f"{rationale} regime notes: {'; '.join(regime_flags)}"
+    return rationale
 
 
-def vet_from_inputs(inputs: VettingInputs) -> IdeaVetting:
-    violations: List[str] = []
-    borderline_flags: List[str] = []
-    regime_flags: List[str] = []
-    notes: List[str] = []
-    borderline_for_score = False
-
-    def _val_str(val: Any, default: str = "NA") -> str:
-        if val is None:
-            return default
-        try:
-            if isinstance(val, float):
-                return f"{val:.2f}"
-            return str(val)
-        except Exception:
-            return default
+class _Assessment(NamedTuple):
+    flags: List[Flag]
+    state: int  # bitmask of _HAS_VIOLATION / _HAS_BORDERLINE / _BORDERLINE_SCORE
+    n_violations: int
+
+
+_HAS_VIOLATION = 1
+_HAS_BORDERLINE = 2
+_BORDERLINE_SCORE = 4
+
+# Indexed by state & _VERDICT_BITS: any violation rejects, otherwise a
+# borderline flag downgrades to BORDERLINE.
+_VERDICT_BITS = _HAS_VIOLATION | _HAS_BORDERLINE
+_VERDICTS = (VetVerdict.ACCEPT, VetVerdict.REJECT, VetVerdict.BORDERLINE, VetVerdict.REJECT)
+
+
+def _assess(inputs: VettingInputs) -> _Assessment:
+    flags: List[Flag] = []
+    add = flags.append
+    state = 0
+    n_violations = 0
+
+    # Numeric fields as floats with NaN for missing: every comparison against a
+    # NaN is False, which folds most of the "is not None" guards into the test.
+    isnan = math.isnan
+    dte, dte_min, dte_max = _nan(inputs.dte), _nan(inputs.dte_min), _nan(inputs.dte_max)
+    short_delta = _nan(inputs.short_delta)
+    delta_min, delta_max = _nan(inputs.short_delta_min), _nan(inputs.short_delta_max)
 
     # DTE checks
-    if inputs.dte is not None and (inputs.dte_min is not None or inputs.dte_max is not None):
-        window = [inputs.dte_min, inputs.dte_max]
-        if inputs.dte_min is not None and inputs.dte < inputs.dte_min:
-            violations.append(f"DTE {inputs.dte} below window [{inputs.dte_min}, {inputs.dte_max}]")
-        elif inputs.dte_max is not None and inputs.dte > inputs.dte_max:
-            violations.append(f"DTE {inputs.dte} above window [{inputs.dte_min}, {inputs.dte_max}]")
-        else:
-            notes.append(f"DTE {inputs.dte} within [{inputs.dte_min}, {inputs.dte_max}]")
-            if inputs.dte_min is not None and abs(inputs.dte - inputs.dte_min) <= 1:
-                borderline_for_score = True
-                borderline_flags.append(
-                    f"DTE {inputs.dte} near min {inputs.dte_min} – borderline"
-                )
-            if inputs.dte_max is not None and abs(inputs.dte - inputs.dte_max) <= 1:
-                borderline_for_score = True
-                borderline_flags.append(
-                    f"DTE {inputs.dte} near max {inputs.dte_max} – borderline"
-                )
-    elif inputs.dte is not None:
-        notes.append(f"DTE {inputs.dte}")
+    if isnan(dte):
+        add((FlagCode.DTE_MISSING, ()))
+    elif isnan(dte_min) and isnan(dte_max):
+        add((FlagCode.DTE_PLAIN, (inputs.dte,)))
     else:
-        notes.append("DTE missing")
+        if dte < dte_min:
+            n_violations += 1
+            add((FlagCode.DTE_BELOW, (inputs.dte, inputs.dte_min, inputs.dte_max)))
+        elif dte > dte_max:
+            n_violations += 1
+            add((FlagCode.DTE_ABOVE, (inputs.dte, inputs.dte_min, inputs.dte_max)))
+        else:
+            add((FlagCode.DTE_WITHIN, (inputs.dte, inputs.dte_min, inputs.dte_max)))
+            if abs(dte - dte_min) <= 1:
+                state |= _HAS_BORDERLINE | _BORDERLINE_SCORE
+                add((FlagCode.DTE_NEAR_MIN, (inputs.dte, inputs.dte_min)))
+            if abs(dte - dte_max) <= 1:
+                state |= _HAS_BORDERLINE | _BORDERLINE_SCORE
+                add((FlagCode.DTE_NEAR_MAX, (inputs.dte, inputs.dte_max)))
 
     # Width check
-    if inputs.expected_spread_width is not None and inputs.spread_width is not None:
-        if inputs.spread_width - inputs.expected_spread_width > 1e-6:
-            violations.append(
-                f"Width {inputs.spread_width} exceeds allowed {inputs.expected_spread_width}"
-            )
+    if inputs.spread_width is not None:
+        if inputs.expected_spread_width is None:
+            add((FlagCode.WIDTH_PLAIN, (inputs.spread_width,)))
+        elif inputs.spread_width - inputs.expected_spread_width > 1e-6:
+            n_violations += 1
+            add((FlagCode.WIDTH_EXCEEDS, (inputs.spread_width, inputs.expected_spread_width)))
         else:
-            notes.append(
-                f"Width {inputs.spread_width} matches expected {inputs.expected_spread_width}"
-            )
-    elif inputs.spread_width is not None:
-        notes.append(f"Width {inputs.spread_width}")
+            add((FlagCode.WIDTH_MATCHES, (inputs.spread_width, inputs.expected_spread_width)))
 
     # Delta checks
-    if inputs.short_delta is not None and (inputs.short_delta_min is not None or inputs.short_delta_max is not None):
-        if inputs.short_delta_min is not None and inputs.short_delta < inputs.short_delta_min:
-            violations.append(
-                f"Short leg delta {inputs.short_delta:.2f} below min {inputs.short_delta_min}"
-            )
-        elif inputs.short_delta_max is not None and inputs.short_delta > inputs.short_delta_max:
-            violations.append(
-                f"Short leg delta {inputs.short_delta:.2f} above max {inputs.short_delta_max}"
-            )
-        else:
-            notes.append(
-                f"Short delta {inputs.short_delta:.2f} within [{inputs.short_delta_min}, {inputs.short_delta_max}]"
-            )
-            if inputs.short_delta_min is not None and abs(inputs.short_delta - inputs.short_delta_min) <= 0.02:
-                borderline_for_score = True
-                borderline_flags.append(
-                    f"Short delta {inputs.short_delta:.2f} near min {inputs.short_delta_min:.2f} – borderline"
-                )
-            if inputs.short_delta_max is not None and abs(inputs.short_delta - inputs.short_delta_max) <= 0.02:
-                borderline_for_score = True
-                borderline_flags.append(
-                    f"Short delta {inputs.short_delta:.2f} near max {inputs.short_delta_max:.2f} – borderline"
-                )
-    elif inputs.short_delta is not None:
-        notes.append(f"Short delta {inputs.short_delta:.2f}")
-
-    # Floors
-    if inputs.ivr_floor is not None:
-        if inputs.ivr is None or inputs.ivr < inputs.ivr_floor:
-            violations.append(
-                f"IVR {_val_str(inputs.ivr)} below floor {_val_str(inputs.ivr_floor)}"
-            )
-        else:
-            notes.append(
-                f"IVR {_val_str(inputs.ivr)} >= floor {_val_str(inputs.ivr_floor)}"
-            )
-            if inputs.ivr - inputs.ivr_floor <= 0.02:
-                borderline_for_score = True
-                borderline_flags.append(
-                    f"IVR {_val_str(inputs.ivr)} only slightly above floor {_val_str(inputs.ivr_floor)} – borderline"
-                )
-
-    if inputs.pop_floor is not None:
-        if inputs.pop is None or inputs.pop < inputs.pop_floor:
-            violations.append(
-                f"POP {_val_str(inputs.pop)} below floor {_val_str(inputs.pop_floor)}"
-            )
-        else:
-            notes.append(
-                f"POP {_val_str(inputs.pop)} >= floor {_val_str(inputs.pop_floor)}"
-            )
-            if inputs.pop - inputs.pop_floor <= 0.02:
-                borderline_for_score = True
-                borderline_flags.append(
-                    f"POP {_val_str(inputs.pop)} only slightly above floor {_val_str(inputs.pop_floor)} – borderline"
-                )
-
-    if inputs.credit_per_width_floor is not None:
-        if inputs.credit_per_width is None or inputs.credit_per_width < inputs.credit_per_width_floor:
-            violations.append(
-                "credit/width "
-                f"{_val_str(inputs.credit_per_width)} below floor {_val_str(inputs.credit_per_width_floor)}"
-            )
+    if isnan(short_delta):
+        pass
+    elif isnan(delta_min) and isnan(delta_max):
+        add((FlagCode.DELTA_PLAIN, (short_delta,)))
+    elif short_delta < delta_min:
+        n_violations += 1
+        add((FlagCode.DELTA_BELOW, (short_delta, inputs.short_delta_min)))
+    elif short_delta > delta_max:
+        n_violations += 1
+        add((FlagCode.DELTA_ABOVE, (short_delta, inputs.short_delta_max)))
+    else:
+        add((FlagCode.DELTA_WITHIN, (short_delta, inputs.short_delta_min, inputs.short_delta_max)))
+        if abs(short_delta - delta_min) <= 0.02:
+            state |= _HAS_BORDERLINE | _BORDERLINE_SCORE
+            add((FlagCode.DELTA_NEAR_MIN, (short_delta, delta_min)))
+        if abs(short_delta - delta_max) <= 0.02:
+            state |= _HAS_BORDERLINE | _BORDERLINE_SCORE
+            add((FlagCode.DELTA_NEAR_MAX, (short_delta, delta_max)))
+
+    # Floors (a missing metric fails its floor: NaN >= floor is False)
+    for label, value, floor, margin in (
+        ("IVR", inputs.ivr, inputs.ivr_floor, 0.02),
+        ("POP", inputs.pop, inputs.pop_floor, 0.02),
+        ("credit/width", inputs.credit_per_width, inputs.credit_per_width_floor, 0.01),
+    ):
+        if floor is None:
+            continue
+        if not _nan(value) >= floor:
+            n_violations += 1
+            add((FlagCode.FLOOR_BELOW, (label, value, floor)))
         else:
-            notes.append(
-                f"credit/width {_val_str(inputs.credit_per_width)} >= floor {_val_str(inputs.credit_per_width_floor)}"
-            )
-            if inputs.credit_per_width - inputs.credit_per_width_floor <= 0.01:
-                borderline_for_score = True
-                borderline_flags.append(
-                    "credit/width "
-                    f"{_val_str(inputs.credit_per_width)} only slightly above floor {_val_str(inputs.credit_per_width_floor)} – borderline"
-                )
+            add((FlagCode.FLOOR_OK, (label, value, floor)))
+            if value - floor <= margin:
+                state |= _HAS_BORDERLINE | _BORDERLINE_SCORE
+                add((FlagCode.FLOOR_NEAR, (label, value, floor)))
 
     # Regimes
     if inputs.allowed_trend_regimes is not None:
         if inputs.trend_regime is None:
-            borderline_for_score = True
-            regime_flags.append("trend_regime missing while allowlist configured")
-        elif inputs.trend_regime not in inputs.allowed_trend_regimes:
-            violations.append(
-                f"trend_regime {inputs.trend_regime!r} not allowed {inputs.allowed_trend_regimes!r}"
-            )
+            state |= _BORDERLINE_SCORE
+            add((FlagCode.TREND_MISSING, ()))
+        elif inputs.trend_regime not in inputs.trend_regime_set:
+            n_violations += 1
+            add((FlagCode.TREND_NOT_ALLOWED, (inputs.trend_regime, inputs.allowed_trend_regimes)))
         else:
-            notes.append(f"trend_regime {inputs.trend_regime}")
+            add((FlagCode.TREND_OK, (inputs.trend_regime,)))
 
     if inputs.allowed_vol_regimes is not None:
         if inputs.vol_regime is None:
-            borderline_for_score = True
-            regime_flags.append("vol_regime missing while allowlist configured")
-        elif inputs.vol_regime not in inputs.allowed_vol_regimes:
-            violations.append(
-                f"vol_regime {inputs.vol_regime!r} not allowed {inputs.allowed_vol_regimes!r}"
-            )
+            state |= _BORDERLINE_SCORE
+            add((FlagCode.VOL_MISSING, ()))
+        elif inputs.vol_regime not in inputs.vol_regime_set:
+            n_violations += 1
+            add((FlagCode.VOL_NOT_ALLOWED, (inputs.vol_regime, inputs.allowed_vol_regimes)))
         else:
-            notes.append(f"vol_regime {inputs.vol_regime}")
+            add((FlagCode.VOL_OK, (inputs.vol_regime,)))
+
+    if n_violations:
+        state |= _HAS_VIOLATION
+    return _Assessment(flags, state, n_violations)
+
+
+def _metric_points(inputs: VettingInputs) -> float:
+    return _score_core(
+        _nan(inputs.dte),
+        _nan(inputs.dte_target),
+        _nan(inputs.dte_min),
+        _nan(inputs.dte_max),
+        _nan(inputs.ivr),
+        _nan(inputs.ivr_floor),
+        _nan(inputs.pop),
+        _nan(inputs.pop_floor),
+        _nan(inputs.credit_per_width),
+        _nan(inputs.credit_per_width_floor),
+        _nan(inputs.short_delta),
+        _nan(inputs.target_short_delta),
+        _nan(inputs.short_delta_min),
+        _nan(inputs.short_delta_max),
+    )
+
+
+def _finish(inputs: VettingInputs, assessment: _Assessment, points: float) -> IdeaVetting:
+    flags, state, n_violations = assessment
 
     score = 50.0
-    score -= len(violations) * 15.0
-    score += _score_window(inputs.dte, inputs.dte_target, inputs.dte_min, inputs.dte_max, 10.0)
-    score += _score_above_floor(inputs.ivr, inputs.ivr_floor, 12.0)
-    score += _score_above_floor(inputs.pop, inputs.pop_floor, 12.0)
-    score += _score_above_floor(inputs.credit_per_width, inputs.credit_per_width_floor, 10.0)
-    score += _score_band(inputs.short_delta, inputs.target_short_delta, inputs.short_delta_min, inputs.short_delta_max, 8.0)
-
-    if borderline_for_score and not violations:
+    score -= n_violations * 15.0
+    score += points
+
+    if state & _BORDERLINE_SCORE and not n_violations:
         score -= 5.0
 
-    score = max(0.0, min(100.0, score))
+    score = 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
+    verdict = _VERDICTS[state & _VERDICT_BITS]
 
-    if violations:
-        verdict = VetVerdict.REJECT
-    elif borderline_flags:
-        verdict = VetVerdict.BORDERLINE
+    return IdeaVetting.deferred(score, verdict, inputs, flags)
+
+
+def vet_from_inputs(inputs: VettingInputs) -> IdeaVetting:
+    return _finish(inputs, _assess(inputs), _metric_points(inputs))
+
+
+# ---------- vectorised scoring ----------
+#
+# Array versions of _floor_points / _target_points for a
+# group of ideas sharing one StrategyRuleSnapshot. Missing values are NaN and
+# score 0, exactly like the scalar helpers.
+
+
+def _column(inputs: Sequence[VettingInputs], name: str) -> np.ndarray:
+    return np.array(
+        [_nan(getattr(i, name)) for i in inputs],
+        dtype=np.float64,
+    )
+
+
+def _floor_points_np(values: np.ndarray, floor: Optional[float], max_points: float) -> np.ndarray:
+    if floor is None:
+        return np.zeros_like(values)
+    margin = values - floor
+    points = np.select(
+        [margin <= 0, margin < 0.02, margin < 0.05],
+        [-5.0, max_points * 0.4, max_points * 0.7],
+        max_points,
+    )
+    return np.where(np.isnan(values), 0.0, points)
+
+
+def _target_points_np(
+    values: np.ndarray,
+    target: Optional[float],
+    min_v: Optional[float],
+    max_v: Optional[float],
+    max_points: float,
+    near: float,
+    mid: float,
+    inclusive: bool,
+) -> np.ndarray:
+    if target is None:
+        points = np.full(values.shape, max_points * 0.6)
     else:
-        verdict = VetVerdict.ACCEPT
-
-    reasons: List[str] = []
-    reasons.extend(violations)
-    reasons.extend(borderline_flags)
-    reasons.extend(regime_flags)
-    reasons.extend(notes)
-
-    descriptor = inputs.strategy_id or inputs.strategy_type or "idea"
-    name = inputs.symbol or "?"
-    rationale_parts = []
-    if inputs.dte is not None:
-        rationale_parts.append(f"DTE {inputs.dte}")
-    if inputs.spread_width is not None:
-        rationale_parts.append(f"width {_val_str(inputs.spread_width)}")
-    if inputs.short_delta is not None:
-        rationale_parts.append(f"short Δ {_val_str(inputs.short_delta)}")
-    if inputs.ivr is not None and inputs.ivr_floor is not None:
-        rationale_parts.append(f"IVR {_val_str(inputs.ivr)} vs floor {_val_str(inputs.ivr_floor)}")
-    if inputs.pop is not None and inputs.pop_floor is not None:
-        rationale_parts.append(f"POP {_val_str(inputs.pop)} vs floor {_val_str(inputs.pop_floor)}")
-    if inputs.credit_per_width is not None and inputs.credit_per_width_floor is not None:
-        rationale_parts.append(
-            f"cpw {_val_str(inputs.credit_per_width)} vs floor {_val_str(inputs.credit_per_width_floor)}"
-        )
+        diff = np.abs(values - target)
+        conds = [diff <= near, diff <= mid] if inclusive else [diff < near, diff < mid]
+        points = np.select(conds, [max_points, max_points * 0.7], max_points * 0.4)
+    if min_v is not None:
+        points = np.where(values < min_v, -5.0, points)
+    if max_v is not None:
+        points = np.where(values > max_v, -5.0, points)
+    return np.where(np.isnan(values), 0.0, points)
+
+
+def _metric_points_np(inputs: Sequence[VettingInputs], rules: StrategyRuleSnapshot) -> np.ndarray:
+    points = _target_points_np(
+        _column(inputs, "dte"), rules.dte_target, rules.dte_min, rules.dte_max, 10.0, 1, 3, True
+    )
+    points += _floor_points_np(_column(inputs, "ivr"), rules.ivr_floor, 12.0)
+    points += _floor_points_np(_column(inputs, "pop"), rules.pop_floor, 12.0)
+    points += _floor_points_np(_column(inputs, "credit_per_width"), rules.credit_per_width_floor, 10.0)
+    points += _target_points_np(
+        _column(inputs, "short_delta"),
+        rules.target_short_delta,
+        rules.short_delta_min,
+        rules.short_delta_max,
+        8.0,
+        0.02,
+        0.05,
+        False,
+    )
+    return points
 
-    rationale_body = ", ".join(rationale_parts)
-    rationale = f"{name} {descriptor}: {rationale_body} – {verdict.value}."
-    flag_descriptions: List[str] = []
-    if borderline_flags:
-        flag_descriptions.append("borderline metrics: " + "; ".join(borderline_flags))
-    if regime_flags:
-        flag_descriptions.append("regime notes: " + "; ".join(regime_flags))
-    if flag_descriptions:
-        rationale = f"{rationale} {' '.join(flag_descriptions)}"
 
-    return IdeaVetting(score=score, verdict=verdict, rationale=rationale, reasons=reasons)
+@functools.lru_cache(maxsize=4096)
+def _vet_fields_cached(key: Tuple[Any, ...]) -> IdeaVetting:
+    idea_fields, rules_fields = key
+    return vet_from_inputs(VettingInputs(*idea_fields, *rules_fields))
 
 
 def vet_single_idea(idea: Any, rules: StrategyRuleSnapshot) -> IdeaVetting:
-    inputs = build_vetting_inputs(idea, rules)
-    return vet_from_inputs(inputs)
+    idea_fields = _idea_fields(idea)
+    rules_fields = _rules_fields(rules)
+    # VettingInputs coerces numbers, so 45 and 45.0 render alike and may share an entry.
+    key = (idea_fields, rules_fields)
+    try:
+        cached = _vet_fields_cached(key)
+    except TypeError:  # unhashable field value; vet without the cache
+        return vet_from_inputs(VettingInputs(*idea_fields, *rules_fields))
+    # Hand out a copy so the cached entry itself is never rendered or mutated.
+    return copy.copy(cached)
+
+
+def _lookup_rules(
+    keys: Iterable[str],
+    rules_lookup: Callable[[str], StrategyRuleSnapshot],
+) -> Dict[str, StrategyRuleSnapshot]:
+    """Resolve each distinct strategy key once; keys whose lookup fails are left out."""
+    rules_map: Dict[str, StrategyRuleSnapshot] = {}
+    for key in keys:
+        if key in rules_map:
+            continue
+        try:
+            rules_map[key] = rules_lookup(key)
+        except Exception:
+            continue
+    return rules_map
 
 
 def vet_batch(
     ideas: Sequence[Any],
     rules_lookup: Callable[[str], StrategyRuleSnapshot],
-) -> List[Tuple[Any, IdeaVetting]]:
+    return_stats: bool = False,
+) -> Union[List[Tuple[Any, IdeaVetting]], Tuple[List[Tuple[Any, IdeaVetting]], Counter[VetVerdict]]]:
+    """
+    Vet each idea against the rules for its strategy. With return_stats=True,
+    also return a Counter of verdicts built in the same pass.
+    """
+    keys = [_get_value(idea, "strategy_id", "strategy") for idea in ideas]
+    rules_map = _lookup_rules(set(filter(None, keys)), rules_lookup)
+
     vetted: List[Tuple[Any, IdeaVetting]] = []
-    for idea in ideas:
-        strategy_key = _get_value(idea, "strategy_id", "strategy")
-        if not strategy_key:
-            continue
-        try:
-            rules = rules_lookup(strategy_key)
-        except Exception:
+    counts: Counter[VetVerdict] = Counter()
+    for idea, strategy_key in zip(ideas, keys):
+        rules = rules_map.get(strategy_key) if strategy_key else None
+        if rules is None:
             continue
         vetting = vet_single_idea(idea, rules)
         vetted.append((idea, vetting))
+        counts[vetting.verdict] += 1
+    if return_stats:
+        return vetted, counts
     return vetted
+
+
+def vet_batch_vectorized(
+    ideas: Sequence[Any],
+    rules_lookup: Callable[[str], StrategyRuleSnapshot],
+) -> List[Tuple[Any, IdeaVetting]]:
+    """
+    Same result as vet_batch, but ideas are grouped by strategy and each
+    group's metric scores are computed with NumPy in one pass. Reason and
+    rationale strings are still built per idea.
+    """
+    groups: Dict[str, List[int]] = {}
+    for idx, idea in enumerate(ideas):
+        strategy_key = _get_value(idea, "strategy_id", "strategy")
+        if strategy_key:
+            groups.setdefault(strategy_key, []).append(idx)
+
+    rules_map = _lookup_rules(groups, rules_lookup)
+
+    results: Dict[int, IdeaVetting] = {}
+    for strategy_key, indices in groups.items():
+        rules = rules_map.get(strategy_key)
+        if rules is None:
+            continue
+        inputs = [build_vetting_inputs(ideas[i], rules) for i in indices]
+        if len(inputs) == 1:
+            results[indices[0]] = vet_from_inputs(inputs[0])
+            continue
+        points = _metric_points_np(inputs, rules).tolist()
+        for idx, item, pts in zip(indices, inputs, points):
+            results[idx] = _finish(item, _assess(item), pts)
+
+    return [(ideas[idx], results[idx]) for idx in sorted(results)]
+
+
+_PARALLEL_MIN_BATCH = 256
+
+
+def _vet_chunk(chunk: List[Tuple[int, VettingInputs]]) -> List[Tuple[int, IdeaVetting]]:
+    return [(idx, vet_from_inputs(inputs)) for idx, inputs in chunk]
+
+
+def vet_batch_parallel(
+    ideas: Sequence[Any],
+    rules_lookup: Callable[[str], StrategyRuleSnapshot],
+    workers: Optional[int] = None,
+) -> List[Tuple[Any, IdeaVetting]]:
+    """
+    Same result as vet_batch, with the scoring spread over a process pool.
+
+    Inputs are extracted in the parent and shipped as VettingInputs, so ideas
+    (pydantic models, dicts) never need to be pickled. Batches smaller than
+    _PARALLEL_MIN_BATCH are vetted in-process since pool start-up would
+    dominate.
+    """
+    if len(ideas) < _PARALLEL_MIN_BATCH:
+        return vet_batch(ideas, rules_lookup)
+
+    keys = [_get_value(idea, "strategy_id", "strategy") for idea in ideas]
+    rules_map = _lookup_rules(set(filter(None, keys)), rules_lookup)
+    payload: List[Tuple[int, VettingInputs]] = []
+    for idx, (idea, strategy_key) in enumerate(zip(ideas, keys)):
+        rules = rules_map.get(strategy_key) if strategy_key else None
+        if rules is not None:
+            payload.append((idx, build_vetting_inputs(idea, rules)))
+
+    workers = workers or os.cpu_count() or 1
+    size = max(1, -(-len(payload) // (workers * 4)))
+    chunks = [payload[i : i + size] for i in range(0, len(payload), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        done = [pair for part in pool.map(_vet_chunk, chunks) for pair in part]
+    return [(ideas[idx], vetting) for idx, vetting in done]
@@ -1,8 +1,244 @@
 # tests/conftest.py
+import json
 import sys
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 # Ensure project root (the directory that contains 'stratdeck') is on sys.path
 ROOT = Path(__file__).resolve().parent.parent  # one level up from tests/
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+import pytest
+from click.testing import CliRunner
+
+from .fakes import InMemoryPositionsStore
+
+# Editor/OS duplicates of test modules ("test_x (1).py", "test_x_copy.py")
+# would otherwise be collected and run every test twice.
+collect_ignore_glob = ["* (*).py", "*_copy.py", "* copy.py"]
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_module():
+    """``stratdeck.cli``, imported on first use instead of at collection time."""
+    from stratdeck import cli
+
+    return cli
+
+
+@pytest.fixture(scope="session")
+def decode():
+    """Decode CLI JSON output through one shared decoder."""
+    return json.JSONDecoder().decode
+
+
+@pytest.fixture(scope="session")
+def json_array():
+    """Decode the pretty-printed JSON array in CLI output, skipping any log preamble."""
+    raw_decode = json.JSONDecoder().raw_decode
+
+    def _extract(output: str) -> list:
+        idx = output.find("\n[\n") + 1 or output.find("[\n")
+        assert idx >= 0, output
+        payload, _ = raw_decode(output, idx)
+        return payload
+
+    return _extract
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _mock_data_mode():
+    """Default every module to mock data; tests that need live mode setenv over it."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("STRATDECK_DATA_MODE", "mock")
+        yield
+
+
+@pytest.fixture(scope="module")
+def _module_planner():
+    from stratdeck.agents.trade_planner import TradePlanner
+
+    return TradePlanner()
+
+
+@pytest.fixture
+def planner(_module_planner):
+    """A default ``TradePlanner`` shared across a module, with its price cache reset per test."""
+    _module_planner.chains_client.clear_price_cache()
+    return _module_planner
+
+
+@pytest.fixture(scope="session")
+def make_scan_row():
+    """
+    Build a bullish, in-range TA scan row for the planner tests.
+
+    Rows are memoized per argument tuple and shared between tests; the planner
+    only reads them, so copy a row (``{**row, ...}``) before changing it.
+    """
+
+    @lru_cache(maxsize=None)
+    def _make(symbol: str, low: float, high: float, ivr=None, trend: str = "uptrend"):
+        row = {
+            "symbol": symbol,
+            "ta_directional_bias": "bullish",
+            "ta_vol_bias": "normal",
+            "strategy_hint": "short_premium_range",
+            "ta": {
+                "scores": {
+                    "directional_bias": "bullish",
+                    "vol_bias": "normal",
+                    "ta_bias": 0.0,
+                },
+                "structure": {
+                    "support": [low],
+                    "resistance": [high],
+                    "range": {
+                        "low": low,
+                        "high": high,
+                        "in_range": True,
+                        "position_in_range": 0.5,
+                    },
+                },
+                "trend_regime": {"state": trend},
+                "vol_regime": {"state": "normal"},
+            },
+        }
+        if ivr is not None:
+            row["ivr"] = ivr
+        return row
+
+    return _make
+
+
+@pytest.fixture
+def patch_factory(monkeypatch):
+    """Patch several ``stratdeck.data.factory`` attributes in one call."""
+
+    def _apply(**attrs):
+        for name, value in attrs.items():
+            monkeypatch.setattr(f"stratdeck.data.factory.{name}", value)
+
+    return _apply
+
+
+@pytest.fixture
+def patch_cli_provider(monkeypatch):
+    """Point the CLI's ``get_provider``/``load_snapshot`` at fixed test objects."""
+
+    def _apply(provider, snapshot):
+        monkeypatch.setattr("stratdeck.cli.get_provider", lambda: provider)
+        monkeypatch.setattr("stratdeck.cli.load_snapshot", lambda: snapshot)
+
+    return _apply
+
+
+@pytest.fixture
+def setenvs(monkeypatch):
+    """Set several environment variables in one call, undone at teardown."""
+
+    def _apply(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+    return _apply
+
+
+@pytest.fixture
+def stratdeck_dir(tmp_path_factory):
+    """An existing ``.stratdeck`` directory under a fresh session temp root."""
+    path = tmp_path_factory.mktemp("sd") / ".stratdeck"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def isolated_positions(stratdeck_dir, monkeypatch):
+    """Run from ``stratdeck_dir``'s root with the paper positions store redirected there."""
+    path = stratdeck_dir / "positions.json"
+    monkeypatch.chdir(stratdeck_dir.parent)
+    # cli binds the relative default path, which the chdir already covers.
+    monkeypatch.setattr("stratdeck.tools.positions.POS_PATH", path)
+    monkeypatch.setattr("stratdeck.orchestrator.POS_PATH", path, raising=False)
+    return path
+
+
+@pytest.fixture
+def memory_store(monkeypatch):
+    """Swap ``PositionsStore`` for an in-memory store class and return that class."""
+    store_cls = type("InMemoryPositionsStore", (InMemoryPositionsStore,), {"_shelves": {}})
+    for target in ("stratdeck.tools.positions", "stratdeck.cli", "stratdeck.orchestrator"):
+        monkeypatch.setattr(f"{target}.PositionsStore", store_cls)
+    return store_cls
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """A fixed UTC "now", also used as the positions CLI clock."""
+    now = datetime(2099, 6, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr("stratdeck.cli._utcnow", lambda: now)
+    return now
+
+
+@pytest.fixture(scope="session")
+def today_date():
+    """The UTC date the session started on, so expiries don't shift across midnight."""
+    return datetime.now(timezone.utc).date()
+
+
+@pytest.fixture(scope="session")
+def make_trade_idea():
+    """Build the SPX 100/95 put-spread ``TradeIdea`` the vetting tests use, with field overrides."""
+    from stratdeck.agents.trade_planner import TradeIdea, TradeLeg
+
+    template = dict(
+        symbol="SPX",
+        data_symbol="SPX",
+        trade_symbol="SPX",
+        strategy="short_put_spread",
+        direction="bullish",
+        vol_context="normal",
+        rationale="test idea",
+        dte=45,
+        spread_width=5.0,
+        ivr=0.30,
+        pop=0.60,
+        credit_per_width=0.26,
+        short_put_delta=0.30,
+        strategy_id="short_put_spread_index_45d",
+    )
+
+    def _make(**overrides):
+        short_leg = TradeLeg(side="short", type="put", strike=100.0, expiry="2025-01-17", quantity=1, delta=0.30, dte=45)
+        long_leg = TradeLeg(side="long", type="put", strike=95.0, expiry="2025-01-17", quantity=1, delta=0.05, dte=45)
+        return TradeIdea(
+            legs=[short_leg, long_leg],
+            short_legs=[short_leg],
+            long_legs=[long_leg],
+            **{**template, **overrides},
+        )
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def short_put_spread_index_45d_snapshot():
+    """Human-rule snapshot for the index put spread, parsed from strategies.yaml once."""
+    from stratdeck.filters import snapshot_for_strategy
+
+    return snapshot_for_strategy("short_put_spread_index_45d")
+
+
+@pytest.fixture(scope="session")
+def exit_rules():
+    """Exit rules for the strategies the position tests use, resolved once."""
+    from stratdeck.tools.position_monitor import load_exit_rules
+
+    return {sid: load_exit_rules(sid) for sid in ("short_put_spread_index_45d", "short_strangle")}
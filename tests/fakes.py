@@ -0,0 +1,124 @@
+# tests/fakes.py
+"""Shared provider, pricing and store doubles for the positions/paper-trading tests."""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from stratdeck.tools.positions import POS_PATH, PaperPosition
+
+
+class ChainProvider:
+    """
+    Deterministic provider for a 100/95 put spread.
+
+    The spread's net mid is ``mid_map[symbol]`` when the symbol is mapped and
+    ``chain_mid`` otherwise; the long leg is always priced at 0.10.
+    """
+
+    def __init__(self, mid_map=None, chain_mid=1.0, ivr=30.0, mark=400.0):
+        self.mid_map = mid_map or {}
+        self.chain_mid = chain_mid
+        self.ivr = ivr
+        self.mark = mark
+
+    def get_option_chain(self, symbol: str, expiry: str = None):
+        desired = self.mid_map.get(symbol, self.chain_mid)
+        long_mid = 0.1
+        return {
+            "puts": [
+                {"strike": 100.0, "mid": desired + long_mid},
+                {"strike": 95.0, "mid": long_mid},
+            ]
+        }
+
+    def get_quote(self, symbol: str):
+        return {"mark": self.mark}
+
+    def get_ivr(self, symbol: str):
+        return self.ivr
+
+
+class FakePricingAdapter:
+    """Records ``price_structure`` calls and quotes a fixed 5-wide put spread."""
+
+    def __init__(self, short_mid=2.0, long_mid=0.5, pop=0.65, expiry="2099-01-01"):
+        self.short_mid = short_mid
+        self.long_mid = long_mid
+        self.pop = pop
+        self.expiry = expiry
+        self.calls = []
+
+    def price_structure(self, symbol, strategy_type, legs, dte_target, target_delta_hint=None):
+        self.calls.append(
+            {
+                "symbol": symbol,
+                "strategy": strategy_type,
+                "dte_target": dte_target,
+                "target_delta": target_delta_hint,
+                "legs": legs,
+            }
+        )
+        width = 5.0
+        credit = self.short_mid - self.long_mid
+        return {
+            "credit": credit,
+            "credit_per_width": credit / width,
+            "pop": self.pop,
+            "width": width,
+            "legs": {
+                "short": {"mid": self.short_mid, "strike": 100.0, "type": "put", "side": "short", "expiry": self.expiry},
+                "long": {"mid": self.long_mid, "strike": 95.0, "type": "put", "side": "long", "expiry": self.expiry},
+            },
+            "expiry": self.expiry,
+        }
+
+
+class InMemoryPositionsStore:
+    """
+    ``PositionsStore`` stand-in that never touches the JSON file.
+
+    Stores opened on the same resolved path share one position list, so
+    reopening the store (as each CLI command does) sees earlier writes. Use the
+    ``memory_store`` fixture, which hands out a subclass with a fresh registry.
+    """
+
+    _shelves: Dict[str, List[PaperPosition]] = {}
+
+    def __init__(self, path=POS_PATH):
+        self.path = Path(path)
+        self.positions = self._shelves.setdefault(str(self.path.resolve()), [])
+
+    def list_positions(self, status: Optional[str] = None) -> List[PaperPosition]:
+        if status is None:
+            return list(self.positions)
+        status = status.lower()
+        return [p for p in self.positions if (p.status or "").lower() == status]
+
+    def get_open_positions(self) -> List[PaperPosition]:
+        return self.list_positions(status="open")
+
+    def add_position(self, position: PaperPosition) -> PaperPosition:
+        self.positions.append(position)
+        return position
+
+    def bulk_add(self, positions: Iterable[PaperPosition]) -> List[PaperPosition]:
+        added = list(positions)
+        self.positions.extend(added)
+        return added
+
+    def upsert(self, position: PaperPosition) -> PaperPosition:
+        for idx, existing in enumerate(self.positions):
+            if str(existing.id) == str(position.id):
+                self.positions[idx] = position
+                return position
+        self.positions.append(position)
+        return position
+
+    def get(self, position_id: str) -> Optional[PaperPosition]:
+        for pos in self.positions:
+            if str(pos.id) == str(position_id):
+                return pos
+        return None
+
+    def update_position(self, position: PaperPosition) -> PaperPosition:
+        return self.upsert(position)
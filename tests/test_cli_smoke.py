@@ -1,29 +1,21 @@
-import os
-
-from click.testing import CliRunner
+import pytest
 
 from stratdeck import cli
 
-
-def _mock_env():
-    env = os.environ.copy()
-    env["STRATDECK_DATA_MODE"] = "mock"
-    return env
+pytestmark = pytest.mark.xdist_group("cli")
 
 
-def test_doctor_smoke():
-    runner = CliRunner()
-    result = runner.invoke(cli.cli, ["doctor"], env=_mock_env())
+def test_doctor_smoke(cli_runner):
+    result = cli_runner.invoke(cli.cli, ["doctor"])
     assert result.exit_code == 0, result.output
     assert "All green" in result.output
 
 
-def test_trade_ideas_smoke():
-    runner = CliRunner()
-    result = runner.invoke(
+def test_trade_ideas_smoke(cli_runner, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # keep the CLI's last-ideas write off the tracked copy
+    result = cli_runner.invoke(
         cli.cli,
         ["trade-ideas", "--universe", "index_core", "--json-output"],
-        env=_mock_env(),
     )
     assert result.exit_code == 0, result.output
     assert result.exception is None
@@ -8,7 +8,7 @@ from stratdeck.strategies import (
 )
 
 
-def test_resolve_live_symbols_unions_index_and_watchlist(monkeypatch):
+def test_resolve_live_symbols_unions_index_and_watchlist(patch_factory):
     universes = {
         "index_core": UniverseConfig(
             name="index_core",
@@ -27,8 +27,10 @@ def test_resolve_live_symbols_unions_index_and_watchlist(monkeypatch):
 
     cfg = StrategyConfig(universes=universes, strategies=[])
 
-    monkeypatch.setattr(factory, "load_strategy_config", lambda: cfg)
-    monkeypatch.setattr(factory, "get_watchlist_symbols", lambda name: ["MSFT", "AAPL"])
+    patch_factory(
+        load_strategy_config=lambda: cfg,
+        get_watchlist_symbols=lambda name: ["MSFT", "AAPL"],
+    )
 
     symbols = factory._resolve_live_symbols()
 
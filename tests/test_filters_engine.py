@@ -3,6 +3,18 @@ import pytest
 from stratdeck.strategies import DTERule, StrategyFilters, StrategyTemplate
 from stratdeck.tools.filters import evaluate_candidate_filters
 
+pytestmark = pytest.mark.xdist_group("filters")
+
+# Shared read-only rule objects; evaluate_candidate_filters never mutates them.
+_BASE_FILTERS = StrategyFilters(
+    min_pop=0.55,
+    max_pop=0.95,
+    min_ivr=0.20,
+    max_ivr=0.90,
+    min_credit_per_width=0.30,
+)
+_BASE_DTE = DTERule(min=30, max=60)
+
 
 def test_filters_pass_when_all_constraints_satisfied():
     candidate = {
@@ -11,16 +23,7 @@ def test_filters_pass_when_all_constraints_satisfied():
         "credit_per_width": 0.40,
         "dte_target": 45,
     }
-    filters = StrategyFilters(
-        min_pop=0.55,
-        max_pop=0.95,
-        min_ivr=0.20,
-        max_ivr=0.90,
-        min_credit_per_width=0.30,
-    )
-    dte_rule = DTERule(min=30, max=60)
-
-    decision = evaluate_candidate_filters(candidate, filters, dte_rule)
+    decision = evaluate_candidate_filters(candidate, _BASE_FILTERS, _BASE_DTE)
 
     assert decision.passed is True
     assert decision.reasons == []
@@ -36,65 +39,58 @@ def test_filters_pass_when_all_constraints_satisfied():
         assert key in decision.applied
 
 
-def test_min_ivr_fails_when_too_low():
-    filters = StrategyFilters(min_ivr=0.20)
-    candidate = {"pop": 0.6, "ivr": 0.18, "credit_per_width": 0.3}
-
-    decision = evaluate_candidate_filters(candidate, filters)
-
-    assert decision.passed is False
-    assert any("min_ivr 0.18" in reason for reason in decision.reasons)
-
-
-def test_min_pop_failure():
-    filters = StrategyFilters(min_pop=0.55)
-    candidate = {"pop": 0.52, "ivr": 0.25, "credit_per_width": 0.3}
-
-    decision = evaluate_candidate_filters(candidate, filters)
-
-    assert decision.passed is False
-    assert any("min_pop" in reason for reason in decision.reasons)
-
-
-def test_max_pop_failure():
-    filters = StrategyFilters(max_pop=0.70)
-    candidate = {"pop": 0.82, "ivr": 0.3, "credit_per_width": 0.25}
-
-    decision = evaluate_candidate_filters(candidate, filters)
-
-    assert decision.passed is False
-    assert any("max_pop" in reason for reason in decision.reasons)
-
-
-def test_min_credit_per_width_failure():
-    filters = StrategyFilters(min_credit_per_width=0.20)
-    candidate = {"pop": 0.6, "ivr": 0.3, "credit_per_width": 0.18}
-
-    decision = evaluate_candidate_filters(candidate, filters)
-
-    assert decision.passed is False
-    assert any("min_credit_per_width" in reason for reason in decision.reasons)
-
-
-def test_missing_ivr_fails_when_min_ivr_configured():
-    filters = StrategyFilters(min_ivr=0.20)
-    candidate = {"pop": 0.6, "credit_per_width": 0.25}
-
-    decision = evaluate_candidate_filters(candidate, filters)
-
-    assert decision.passed is False
-    assert "min_ivr check failed: ivr is missing" in decision.reasons
-
-
-def test_dte_rule_failure():
-    filters = StrategyFilters()
-    dte_rule = DTERule(min=30, max=50)
-    candidate = {"pop": 0.6, "ivr": 0.3, "credit_per_width": 0.3, "dte_target": 60}
-
+@pytest.mark.parametrize(
+    "filters,dte_rule,candidate,expected_reason",
+    [
+        pytest.param(
+            StrategyFilters(min_ivr=0.20),
+            None,
+            {"pop": 0.6, "ivr": 0.18, "credit_per_width": 0.3},
+            "min_ivr 0.18",
+            id="min_ivr",
+        ),
+        pytest.param(
+            StrategyFilters(min_pop=0.55),
+            None,
+            {"pop": 0.52, "ivr": 0.25, "credit_per_width": 0.3},
+            "min_pop",
+            id="min_pop",
+        ),
+        pytest.param(
+            StrategyFilters(max_pop=0.70),
+            None,
+            {"pop": 0.82, "ivr": 0.3, "credit_per_width": 0.25},
+            "max_pop",
+            id="max_pop",
+        ),
+        pytest.param(
+            StrategyFilters(min_credit_per_width=0.20),
+            None,
+            {"pop": 0.6, "ivr": 0.3, "credit_per_width": 0.18},
+            "min_credit_per_width",
+            id="min_credit_per_width",
+        ),
+        pytest.param(
+            StrategyFilters(min_ivr=0.20),
+            None,
+            {"pop": 0.6, "credit_per_width": 0.25},
+            "min_ivr check failed: ivr is missing",
+            id="missing_ivr",
+        ),
+        pytest.param(
+            StrategyFilters(),
+            DTERule(min=30, max=50),
+            {"pop": 0.6, "ivr": 0.3, "credit_per_width": 0.3, "dte_target": 60},
+            "dte 60 > dte_max 50",
+            id="dte_max",
+        ),
+    ],
+)
+def test_filter_failures(filters, dte_rule, candidate, expected_reason):
     decision = evaluate_candidate_filters(candidate, filters, dte_rule)
 
     assert decision.passed is False
-    assert "dte 60 > dte_max 50" in decision.reasons
+    assert any(expected_reason in reason for reason in decision.reasons)
 
 
 def test_no_filters_configured_passes():
@@ -124,7 +120,7 @@ def test_regime_filters_pass_when_in_allowed_lists():
     template = StrategyTemplate(
         name="test_strategy",
         applies_to_universes=["index_core"],
-        dte=DTERule(min=30, max=60),
+        dte=_BASE_DTE,
         filters=filters,
         allowed_trend_regimes=["uptrend", "sideways"],
         allowed_vol_regimes=["normal", "high"],
@@ -156,7 +152,7 @@ def test_regime_filters_fail_on_disallowed_trend():
     template = StrategyTemplate(
         name="test_strategy",
         applies_to_universes=["index_core"],
-        dte=DTERule(min=30, max=60),
+        dte=_BASE_DTE,
         filters=filters,
         allowed_trend_regimes=["uptrend", "sideways"],
     )
@@ -186,7 +182,7 @@ def test_regime_filters_fail_when_trend_missing_but_required():
     template = StrategyTemplate(
         name="test_strategy",
         applies_to_universes=["index_core"],
-        dte=DTERule(min=30, max=60),
+        dte=_BASE_DTE,
         filters=filters,
         allowed_trend_regimes=["uptrend", "sideways"],
     )
@@ -217,7 +213,7 @@ def test_regime_filters_fail_on_disallowed_vol():
     template = StrategyTemplate(
         name="test_strategy",
         applies_to_universes=["index_core"],
-        dte=DTERule(min=30, max=60),
+        dte=_BASE_DTE,
         filters=filters,
         allowed_trend_regimes=["uptrend", "sideways"],
         allowed_vol_regimes=["normal", "high"],
@@ -14,8 +14,11 @@ from stratdeck.strategies import (
     WidthRuleType,
 )
 
+pytestmark = pytest.mark.xdist_group("filters")
 
-def _strategy():
+
+@pytest.fixture(scope="module")
+def strategy():
     return StrategyTemplate(
         name="short_put_spread_index_45d",
         applies_to_universes=["index_core"],
@@ -34,9 +37,13 @@ def _strategy():
     )
 
 
-def test_human_rules_pass_when_all_constraints_met():
-    strategy = _strategy()
-    filt = HumanRulesFilter(strategy)
+@pytest.fixture(scope="module")
+def filt(strategy):
+    # evaluate() only reads the template, so one filter serves every test.
+    return HumanRulesFilter(strategy)
+
+
+def test_human_rules_pass_when_all_constraints_met(filt):
     decision = filt.evaluate(
         {
             "dte_target": 45,
@@ -57,9 +64,7 @@ def test_human_rules_pass_when_all_constraints_met():
     assert decision.applied.get("min_pop") == pytest.approx(0.60)
 
 
-def test_human_rules_reject_weekly_and_rich_risk():
-    strategy = _strategy()
-    filt = HumanRulesFilter(strategy)
+def test_human_rules_reject_weekly_and_rich_risk(filt):
     decision = filt.evaluate(
         {
             "dte_target": 38,
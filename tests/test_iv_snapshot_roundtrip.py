@@ -4,26 +4,34 @@ import pytest
 
 from stratdeck.tools.vol import load_snapshot
 
+# Both snapshot layouts, serialised once: nested {"ivr": x} and bare floats.
+_NESTED_SNAPSHOT = json.dumps({"SPX": {"ivr": 0.15}, "AAPL": {"ivr": 0.07}}).encode()
+_FLAT_SNAPSHOT = json.dumps({"SPX": 0.15, "AAPL": 0.07}).encode()
+
 
 def test_load_snapshot_handles_both_formats(tmp_path):
     path = tmp_path / "iv_snapshot.json"
 
-    data_a = {
-        "SPX": {"ivr": 0.15},
-        "AAPL": {"ivr": 0.07},
-    }
-    path.write_text(json.dumps(data_a))
+    path.write_bytes(_NESTED_SNAPSHOT)
 
     snapshot = load_snapshot(path=str(path))
     assert snapshot["SPX"] == pytest.approx(0.15)
     assert snapshot["AAPL"] == pytest.approx(0.07)
 
-    data_b = {
-        "SPX": 0.15,
-        "AAPL": 0.07,
-    }
-    path.write_text(json.dumps(data_b))
+    path.write_bytes(_FLAT_SNAPSHOT)
 
     snapshot = load_snapshot(path=str(path))
     assert snapshot["SPX"] == pytest.approx(0.15)
     assert snapshot["AAPL"] == pytest.approx(0.07)
+
+
+def test_load_snapshot_reloads_after_file_changes(tmp_path):
+    path = tmp_path / "iv_snapshot.json"
+    path.write_text(json.dumps({"SPX": 0.15}))
+
+    first = load_snapshot(path=str(path))
+    first["SPX"] = 0.99  # callers get their own copy
+    assert load_snapshot(path=str(path)) == {"SPX": pytest.approx(0.15)}
+
+    path.write_text(json.dumps({"SPX": 0.42, "QQQ": {"ivr": 0.3}}))
+    assert load_snapshot(path=str(path)) == {"SPX": pytest.approx(0.42), "QQQ": pytest.approx(0.3)}
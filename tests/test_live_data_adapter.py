@@ -1,4 +1,4 @@
-from types import SimpleNamespace
+from typing import NamedTuple
 
 import pytest
 
@@ -6,56 +6,70 @@ from stratdeck.tools import chains, greeks
 from stratdeck.tools.chain_pricing_adapter import ChainPricingAdapter
 
 
+# Deterministic chain payload shared by every call; consumers only read it.
+_PUTS = (
+    {
+        "type": "put",
+        "strike": 95.0,
+        "bid": 0.30,
+        "ask": 0.50,
+        "mid": 0.40,
+        "delta": 0.15,
+        "greeks": {"delta": 0.15, "theta": -1.0, "vega": 2.0, "gamma": 0.01},
+    },
+    {
+        "type": "put",
+        "strike": 100.0,
+        "bid": 1.00,
+        "ask": 1.20,
+        "mid": 1.10,
+        "delta": 0.25,
+        "greeks": {"delta": 0.25, "theta": -1.2, "vega": 2.3, "gamma": 0.02},
+    },
+)
+
+
+class Leg(NamedTuple):
+    type: str
+    side: str
+    strike: float
+
+
+_SHORT_PUT_SPREAD = (
+    Leg(type="put", side="short", strike=100.0),
+    Leg(type="put", side="long", strike=95.0),
+)
+
+
 class FakeProvider:
     def __init__(self):
         self.calls = 0
 
     def get_option_chain(self, symbol: str, expiry: str = None):
         self.calls += 1
-        expiry = expiry or "2024-12-31"
-        puts = [
-            {
-                "type": "put",
-                "strike": 95.0,
-                "bid": 0.30,
-                "ask": 0.50,
-                "mid": 0.40,
-                "delta": 0.15,
-                "greeks": {"delta": 0.15, "theta": -1.0, "vega": 2.0, "gamma": 0.01},
-            },
-            {
-                "type": "put",
-                "strike": 100.0,
-                "bid": 1.00,
-                "ask": 1.20,
-                "mid": 1.10,
-                "delta": 0.25,
-                "greeks": {"delta": 0.25, "theta": -1.2, "vega": 2.3, "gamma": 0.02},
-            },
-        ]
-        return {"symbol": symbol, "expiry": expiry, "puts": puts, "calls": []}
+        return {"symbol": symbol, "expiry": expiry or "2024-12-31", "puts": _PUTS, "calls": ()}
+
+
+@pytest.fixture(scope="session")
+def fake_provider():
+    return FakeProvider()
 
 
 @pytest.fixture
-def use_fake_provider():
+def use_fake_provider(fake_provider):
     original = chains._provider
-    fake = FakeProvider()
-    chains.set_provider(fake)
-    yield fake
+    chains.set_provider(fake_provider)
+    yield fake_provider
     chains.set_provider(original)
 
 
 def test_chain_pricing_adapter_uses_provider_mid(use_fake_provider, monkeypatch):
     monkeypatch.setenv("STRATDECK_DATA_MODE", "live")
     adapter = ChainPricingAdapter()
-    legs = [
-        SimpleNamespace(type="put", side="short", strike=100.0),
-        SimpleNamespace(type="put", side="long", strike=95.0),
-    ]
     pricing = adapter.price_structure(
         symbol="SPY",
         strategy_type="short_put_spread",
-        legs=legs,
+        legs=list(_SHORT_PUT_SPREAD),
         dte_target=30,
     )
     assert pricing is not None
@@ -75,3 +89,20 @@ def test_greeks_calc_combines_chain_quotes(use_fake_provider):
     assert totals["theta"] == pytest.approx(0.2)
     assert totals["vega"] == pytest.approx(-0.3)
     assert totals["gamma"] == pytest.approx(-0.01)
+
+
+def test_chain_pricing_adapter_caches_price_structure(use_fake_provider, monkeypatch):
+    monkeypatch.setenv("STRATDECK_DATA_MODE", "live")
+    adapter = ChainPricingAdapter()
+    kwargs = dict(symbol="SPY", strategy_type="short_put_spread", legs=list(_SHORT_PUT_SPREAD), dte_target=30)
+
+    before = use_fake_provider.calls
+    first = adapter.price_structure(**kwargs)
+    first["credit"] = -1.0
+    second = adapter.price_structure(**kwargs)
+    assert use_fake_provider.calls == before + 1
+    assert second["credit"] == pytest.approx(0.70)
+
+    adapter.clear_price_cache()
+    adapter.price_structure(**kwargs)
+    assert use_fake_provider.calls == before + 2
@@ -1,51 +1,124 @@
-from datetime import datetime, timedelta, timezone
+import copy
+import dataclasses
+import threading
+import time
+from datetime import timedelta
 from decimal import Decimal
-from types import SimpleNamespace
+from typing import NamedTuple
 
-from stratdeck.data.live_quotes import LiveMarketDataService, QuoteSnapshot
+import pytest
+
+from stratdeck.data.live_quotes import LiveMarketDataService, QuoteSnapshot, _upper
+
+
+class Quote(NamedTuple):
+    event_symbol: str
+    bid_price: float
+    ask_price: float
+
+
+_SPX_100 = Quote("SPX", 100.0, 101.0)
+
+
+@pytest.fixture(scope="session")
+def _svc_proto():
+    return LiveMarketDataService(session=None, symbols=["SPX"])
+
+
+@pytest.fixture
+def svc(_svc_proto):
+    # Shallow copy of a never-started service: the lock and stop event are
+    # shared but idle, and the per-test quote state is reset.
+    service = copy.copy(_svc_proto)
+    service._quotes = {}
+    service._has_seen_quote = False
+    return service
 
 
 def test_snapshot_freshness():
     recent = QuoteSnapshot(
         symbol="SPX",
-        bid=Decimal("10.0"),
-        ask=Decimal("11.0"),
-        mid=Decimal("10.5"),
-        asof=datetime.now(timezone.utc) - timedelta(seconds=1),
+        bid=10.0,
+        ask=11.0,
+        mid=10.5,
+        asof=time.time() - 1,
     )
     stale = QuoteSnapshot(
         symbol="SPX",
-        bid=Decimal("10.0"),
-        ask=Decimal("11.0"),
-        mid=Decimal("10.5"),
-        asof=datetime.now(timezone.utc) - timedelta(seconds=10),
+        bid=10.0,
+        ask=11.0,
+        mid=10.5,
+        asof=time.time() - 10,
     )
 
     assert recent.is_fresh(timedelta(seconds=3))
     assert not stale.is_fresh(timedelta(seconds=3))
+    assert recent.asof_dt.tzinfo is not None
 
 
-def test_handle_quote_event_updates_cache():
-    svc = LiveMarketDataService(session=None, symbols=["SPX"])
-    quote = SimpleNamespace(event_symbol="SPX", bid_price=4300.5, ask_price=4301.5)
-
-    svc._handle_quote_event(quote)
+def test_handle_quote_event_updates_cache(svc):
+    svc._handle_quote_event(Quote("SPX", 4300.5, 4301.5))
 
     snap = svc.get_snapshot("SPX")
     assert snap is not None
-    assert snap.bid == Decimal("4300.5")
-    assert snap.ask == Decimal("4301.5")
-    assert snap.mid == Decimal("4301.0")
+    assert snap.bid == 4300.5
+    assert snap.ask == 4301.5
+    assert snap.mid == 4301.0
     assert snap.is_fresh(svc.freshness_ttl)
 
 
-def test_stale_snapshot_returns_none():
-    svc = LiveMarketDataService(session=None, symbols=["SPX"])
-    quote = SimpleNamespace(event_symbol="SPX", bid_price=100.0, ask_price=101.0)
-    svc._handle_quote_event(quote)
+def test_handle_quote_event_treats_nan_side_as_missing(svc):
+    svc._handle_quote_event(Quote("SPX", float("nan"), 4301.5))
+
+    snap = svc.get_snapshot("SPX")
+    assert snap.bid is None
+    assert snap.ask == 4301.5
+    assert snap.mid is None
+
+
+def test_stale_snapshot_returns_none(svc):
+    svc._handle_quote_event(_SPX_100)
     snap = svc.get_snapshot("SPX")
     assert snap is not None
 
     # Force staleness and ensure get_snapshot respects TTL
-    snap.asof = datetime.now(timezone.utc) - timedelta(seconds=10)
+    svc._quotes["SPX"] = dataclasses.replace(snap, asof=time.time() - 10)
     assert svc.get_snapshot("SPX") is None
+
+
+def test_wait_for_snapshot_returns_when_available(svc):
+    assert svc.wait_for_snapshot("SPX", timeout=1e-3) is None
+
+    svc._handle_quote_event(_SPX_100)
+    snap = svc.wait_for_snapshot("SPX", timeout=1.0)
+
+    assert snap is not None
+    assert snap.mid == 100.5
+
+
+def test_wait_for_snapshot_wakes_on_incoming_quote(svc):
+    timer = threading.Timer(0.01, svc._handle_quote_event, args=(_SPX_100,))
+    timer.start()
+    try:
+        started = time.monotonic()
+        snap = svc.wait_for_snapshot("spx", timeout=5.0)
+        elapsed = time.monotonic() - started
+    finally:
+        timer.cancel()
+
+    assert snap is not None
+    assert elapsed < 1.0
+
+
+def test_upper_returns_interned_symbol():
+    first = _upper("".join(["s", "p", "x"]))
+    assert first == "SPX"
+    assert _upper("spx") is first
+
+
+def test_handle_quote_event_accepts_decimal_prices(svc):
+    svc._handle_quote_event(Quote("spx", Decimal("100.5"), Decimal("101.5")))
+
+    snap = svc.get_snapshot("SPX")
+    assert snap.symbol == "SPX"
+    assert snap.bid.__class__ is float and snap.mid == 101.0
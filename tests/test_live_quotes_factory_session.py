@@ -5,17 +5,20 @@ import stratdeck.data.factory as factory
 from stratdeck.data import live_quotes
 
 
-def test_make_tasty_streaming_session_from_env(monkeypatch):
-    class DummySession:
-        def __init__(self, client_secret, refresh_token, is_test=False):
-            self.client_secret = client_secret
-            self.refresh_token = refresh_token
-            self.is_test = is_test
-
-    monkeypatch.setenv("TASTY_CLIENT_SECRET", "secret")
-    monkeypatch.setenv("TASTY_REFRESH_TOKEN", "refresh")
-    monkeypatch.setenv("TASTY_IS_TEST", "1")
-    monkeypatch.setitem(sys.modules, "tastytrade", SimpleNamespace(Session=DummySession))
+class DummySession:
+    def __init__(self, client_secret, refresh_token, is_test=False):
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self.is_test = is_test
+
+
+# Stand-in for the tastytrade package, installed into sys.modules per test.
+_FAKE_TASTY = SimpleNamespace(Session=DummySession)
+
+
+def test_make_tasty_streaming_session_from_env(monkeypatch, setenvs):
+    setenvs(TASTY_CLIENT_SECRET="secret", TASTY_REFRESH_TOKEN="refresh", TASTY_IS_TEST="1")
+    monkeypatch.setitem(sys.modules, "tastytrade", _FAKE_TASTY)
 
     session = live_quotes.make_tasty_streaming_session_from_env()
 
@@ -25,7 +28,7 @@ def test_make_tasty_streaming_session_from_env(monkeypatch):
     assert session.is_test is True
 
 
-def test_build_live_quotes_uses_streaming_helper(monkeypatch):
+def test_build_live_quotes_uses_streaming_helper(monkeypatch, patch_factory):
     sentinel_session = object()
     created = {}
     sentinel_symbols = ["SPX", "XSP", "AAPL"]
@@ -40,11 +43,11 @@ def test_build_live_quotes_uses_streaming_helper(monkeypatch):
             self.started = True
             created["started"] = True
 
-    monkeypatch.setattr(factory, "LiveMarketDataService", DummyService)
-    monkeypatch.setattr(
-        factory, "make_tasty_streaming_session_from_env", lambda: sentinel_session
+    patch_factory(
+        LiveMarketDataService=DummyService,
+        make_tasty_streaming_session_from_env=lambda: sentinel_session,
+        _resolve_live_symbols=lambda: sentinel_symbols,
     )
-    monkeypatch.setattr(factory, "_resolve_live_symbols", lambda: sentinel_symbols)
     monkeypatch.setattr(factory.atexit, "register", lambda func: None)
 
     factory._live_quotes_instance = None
@@ -1,16 +1,20 @@
-import json
 from datetime import datetime, timezone
 
-from click.testing import CliRunner
+import pytest
 
-from stratdeck import cli
-from stratdeck.agents.trade_planner import TradeIdea, TradeLeg
-from stratdeck.orchestrator import OpenCycleResult, OpenedPositionSummary
-from stratdeck.tools.positions import PaperPosition
-from stratdeck.vetting import IdeaVetting, VetVerdict
+# stratdeck imports are deferred to the fixtures/tests that need them: the CLI
+# pulls in pandas, the TA engine and the planner, which would otherwise be
+# paid at collection even when these tests are deselected.
 
+pytestmark = pytest.mark.xdist_group("cli")
+
+
+def _sample_result():
+    from stratdeck.agents.trade_planner import TradeIdea, TradeLeg
+    from stratdeck.orchestrator import OpenCycleResult, OpenedPositionSummary
+    from stratdeck.tools.positions import PaperPosition
+    from stratdeck.vetting import IdeaVetting, VetVerdict
 
-def _sample_result() -> OpenCycleResult:
     leg = TradeLeg(side="short", type="put", strike=100.0, expiry="2024-01-19", quantity=1)
     idea = TradeIdea(
         symbol="SPX",
@@ -55,13 +59,18 @@ def _sample_result() -> OpenCycleResult:
     )
 
 
-def test_open_cycle_cli_human(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    sample = _sample_result()
-    monkeypatch.setattr(cli, "run_open_cycle", lambda **kwargs: sample)
+@pytest.fixture(scope="module")
+def sample_result():
+    # The CLI only renders the result, so one instance serves every test.
+    return _sample_result()
+
 
-    runner = CliRunner()
-    result = runner.invoke(
+def test_open_cycle_cli_human(monkeypatch, sample_result, cli_runner):
+    from stratdeck import cli
+
+    monkeypatch.setattr(cli, "run_open_cycle", lambda **kwargs: sample_result)
+
+    result = cli_runner.invoke(
         cli.cli,
         [
             "open-cycle",
@@ -82,13 +91,12 @@ def test_open_cycle_cli_human(monkeypatch):
     assert "SPX" in result.output
 
 
-def test_open_cycle_cli_json(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    sample = _sample_result()
-    monkeypatch.setattr(cli, "run_open_cycle", lambda **kwargs: sample)
+def test_open_cycle_cli_json(monkeypatch, sample_result, cli_runner, decode):
+    from stratdeck import cli
+
+    monkeypatch.setattr(cli, "run_open_cycle", lambda **kwargs: sample_result)
 
-    runner = CliRunner()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         cli.cli,
         [
             "open-cycle",
@@ -105,7 +113,7 @@ def test_open_cycle_cli_json(monkeypatch):
     )
 
     assert result.exit_code == 0, result.output
-    data = json.loads(result.output)
+    data = decode(result.output)
     assert isinstance(data, list)
     assert data, "expected payload to include at least one entry"
     item = data[0]
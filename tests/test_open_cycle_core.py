@@ -1,5 +1,8 @@
+import dataclasses
 import datetime
-from typing import List
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pytest
 
 from stratdeck.agents.trade_planner import TradeIdea, TradeLeg
 from stratdeck.orchestrator import run_open_cycle
@@ -7,20 +10,24 @@ from stratdeck.tools.positions import PaperPosition
 from stratdeck.vetting import IdeaVetting, VetVerdict
 
 
-def _make_idea(symbol: str, strategy_id: str = "short_put_spread_index_45d") -> TradeIdea:
-    leg = TradeLeg(side="short", type="put", strike=100.0, expiry="2024-01-19", quantity=1)
-    return TradeIdea(
-        symbol=symbol,
-        data_symbol=symbol,
-        trade_symbol=symbol,
-        strategy="short_put_spread",
-        direction="bullish",
-        vol_context="normal",
-        rationale="test idea",
-        legs=[leg],
-        strategy_id=strategy_id,
-        universe_id="index_core",
-    )
+_TEMPLATE_IDEA = TradeIdea(
+    symbol="_",
+    data_symbol="_",
+    trade_symbol="_",
+    strategy="short_put_spread",
+    direction="bullish",
+    vol_context="normal",
+    rationale="test idea",
+    legs=[TradeLeg(side="short", type="put", strike=100.0, expiry="2024-01-19", quantity=1)],
+    strategy_id="short_put_spread_index_45d",
+    universe_id="index_core",
+)
+
+
+def _make_idea(symbol: str, strategy_id: Optional[str] = None) -> TradeIdea:
+    # Ideas share the template's (read-only) legs list.
+    overrides = {"strategy_id": strategy_id} if strategy_id else {}
+    return dataclasses.replace(_TEMPLATE_IDEA, symbol=symbol, data_symbol=symbol, trade_symbol=symbol, **overrides)
 
 
 def _dummy_position(idea: TradeIdea, qty: int) -> PaperPosition:
@@ -36,69 +43,59 @@ def _dummy_position(idea: TradeIdea, qty: int) -> PaperPosition:
     )
 
 
-def test_open_cycle_filters_by_verdict_and_score():
-    idea_a = _make_idea("AAA")
-    idea_b = _make_idea("BBB")
-    idea_c = _make_idea("CCC")
-    ideas = [idea_a, idea_b, idea_c]
-
-    def fake_ideas(universe: str, strategy: str) -> List[TradeIdea]:
-        return ideas
-
-    def fake_vet(idea, rules):
-        if idea is idea_a:
-            return IdeaVetting(score=90, verdict=VetVerdict.ACCEPT, rationale="", reasons=[])
-        if idea is idea_b:
-            return IdeaVetting(score=95, verdict=VetVerdict.BORDERLINE, rationale="", reasons=[])
-        return IdeaVetting(score=70, verdict=VetVerdict.ACCEPT, rationale="", reasons=[])
-
-    opened = []
-
-    def fake_open(idea, qty):
-        opened.append(idea)
-        return _dummy_position(idea, qty)
-
-    result = run_open_cycle(
-        universe="U",
-        strategy="short_put_spread_index_45d",
-        max_trades=5,
-        min_score=80,
-        idea_generator=fake_ideas,
-        vet_one=fake_vet,
-        open_from_idea=fake_open,
-    )
-
-    assert result.generated_count == 3
-    assert result.eligible_count == 1
-    assert len(result.opened) == 1
-    assert result.opened[0].idea is idea_a
-    assert opened == [idea_a]
-
-
-def test_open_cycle_respects_max_trades_and_sorting():
-    idea_low = _make_idea("AAA")
-    idea_mid = _make_idea("BBB")
-    idea_high = _make_idea("CCC")
-    ideas = [idea_low, idea_mid, idea_high]
-
-    scores = {
-        "AAA": 70,
-        "BBB": 85,
-        "CCC": 95,
-    }
+class Case(NamedTuple):
+    vets: Dict[str, Tuple[int, VetVerdict]]  # symbol -> (score, verdict), in generation order
+    min_score: int
+    max_trades: int
+    eligible: int
+    expected: List[str]  # symbols opened, in open order
+
+
+_CASES = [
+    pytest.param(
+        Case(
+            vets={"AAA": (90, VetVerdict.ACCEPT), "BBB": (95, VetVerdict.BORDERLINE), "CCC": (70, VetVerdict.ACCEPT)},
+            min_score=80,
+            max_trades=5,
+            eligible=1,
+            expected=["AAA"],
+        ),
+        id="filters_by_verdict_and_score",
+    ),
+    pytest.param(
+        Case(
+            vets={"AAA": (70, VetVerdict.ACCEPT), "BBB": (85, VetVerdict.ACCEPT), "CCC": (95, VetVerdict.ACCEPT)},
+            min_score=0,
+            max_trades=2,
+            eligible=3,
+            expected=["CCC", "BBB"],
+        ),
+        id="respects_max_trades_and_sorting",
+    ),
+    pytest.param(
+        Case(
+            vets={"AAA": (10, VetVerdict.REJECT), "BBB": (10, VetVerdict.REJECT)},
+            min_score=50,
+            max_trades=3,
+            eligible=0,
+            expected=[],
+        ),
+        id="no_eligible_trades_skips_open",
+    ),
+]
+
+
+def _run_cycle(case: Case):
+    ideas = [_make_idea(symbol) for symbol in case.vets]
+    opened: List[TradeIdea] = []
 
     def fake_ideas(universe: str, strategy: str) -> List[TradeIdea]:
         return ideas
 
     def fake_vet(idea, rules):
-        return IdeaVetting(
-            score=scores[idea.symbol],
-            verdict=VetVerdict.ACCEPT,
-            rationale="",
-            reasons=[],
-        )
-
-    opened = []
+        score, verdict = case.vets[idea.symbol]
+        reasons = ["reject"] if verdict is VetVerdict.REJECT else []
+        return IdeaVetting(score=score, verdict=verdict, rationale="", reasons=reasons)
 
     def fake_open(idea, qty):
         opened.append(idea)
@@ -107,43 +104,20 @@ def test_open_cycle_respects_max_trades_and_sorting():
     result = run_open_cycle(
         universe="U",
         strategy="short_put_spread_index_45d",
-        max_trades=2,
-        min_score=0,
+        max_trades=case.max_trades,
+        min_score=case.min_score,
         idea_generator=fake_ideas,
         vet_one=fake_vet,
         open_from_idea=fake_open,
     )
+    return result, opened
 
-    assert len(result.opened) == 2
-    assert opened == [idea_high, idea_mid]
-
-
-def test_open_cycle_no_eligible_trades_skips_open():
-    ideas = [_make_idea("AAA"), _make_idea("BBB")]
-
-    def fake_ideas(universe: str, strategy: str) -> List[TradeIdea]:
-        return ideas
-
-    def fake_vet(idea, rules):
-        return IdeaVetting(score=10, verdict=VetVerdict.REJECT, rationale="", reasons=["reject"])
-
-    opened = []
 
-    def fake_open(idea, qty):
-        opened.append(idea)
-        return _dummy_position(idea, qty)
-
-    result = run_open_cycle(
-        universe="U",
-        strategy="short_put_spread_index_45d",
-        max_trades=3,
-        min_score=50,
-        idea_generator=fake_ideas,
-        vet_one=fake_vet,
-        open_from_idea=fake_open,
-    )
+@pytest.mark.parametrize("case", _CASES)
+def test_open_cycle(case):
+    result, opened = _run_cycle(case)
 
-    assert result.generated_count == 2
-    assert result.eligible_count == 0
-    assert len(result.opened) == 0
-    assert opened == []
+    assert result.generated_count == len(case.vets)
+    assert result.eligible_count == case.eligible
+    assert [idea.symbol for idea in opened] == case.expected
+    assert [o.idea for o in result.opened] == opened
@@ -1,17 +1,14 @@
 import os
 from pathlib import Path
 
+import pytest
+
 from stratdeck.orchestrator import run_open_cycle
 from stratdeck.tools.positions import PaperPosition
 
 
-def test_open_cycle_mock_mode_runs(monkeypatch, tmp_path):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-
-    temp_pos_path = tmp_path / "positions.json"
-    monkeypatch.setattr("stratdeck.tools.positions.POS_PATH", temp_pos_path)
-    monkeypatch.setattr("stratdeck.orchestrator.POS_PATH", temp_pos_path)
-
+@pytest.mark.integration
+def test_open_cycle_mock_mode_runs(isolated_positions):
     result = run_open_cycle(
         universe="index_core",
         strategy="short_put_spread_index_45d",
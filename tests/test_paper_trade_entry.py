@@ -3,40 +3,13 @@ import pytest
 from stratdeck.agents.trade_planner import TradeIdea, TradeLeg
 from stratdeck.tools import orders, positions
 
+from .fakes import FakePricingAdapter
 
-class FakePricingAdapter:
-    def __init__(self):
-        self.calls = []
 
-    def price_structure(self, symbol, strategy_type, legs, dte_target, target_delta_hint=None):
-        self.calls.append(
-            {
-                "symbol": symbol,
-                "strategy": strategy_type,
-                "dte_target": dte_target,
-                "target_delta": target_delta_hint,
-                "legs": legs,
-            }
-        )
-        return {
-            "credit": 0.70,
-            "credit_per_width": 0.14,
-            "pop": 0.76,
-            "width": 5.0,
-            "legs": {
-                "short": {"mid": 1.10, "strike": 100.0, "type": "put", "side": "short"},
-                "long": {"mid": 0.40, "strike": 95.0, "type": "put", "side": "long"},
-            },
-            "expiry": "2099-01-01",
-        }
-
-
-def test_enter_paper_trade_logs_position(tmp_path, monkeypatch):
+def test_enter_paper_trade_logs_position(isolated_positions, monkeypatch):
     monkeypatch.setenv("STRATDECK_TRADING_MODE", "paper")
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    monkeypatch.setattr(positions, "POS_PATH", tmp_path / ".stratdeck" / "positions.json")
 
-    fake_pricing = FakePricingAdapter()
+    fake_pricing = FakePricingAdapter(short_mid=1.10, long_mid=0.40, pop=0.76)
     idea = TradeIdea(
         symbol="SPY",
         data_symbol="SPY",
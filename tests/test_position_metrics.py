@@ -2,29 +2,10 @@ from datetime import datetime, timezone
 
 import pytest
 
-from stratdeck.tools.position_monitor import compute_position_metrics, load_exit_rules
+from stratdeck.tools.position_monitor import compute_position_metrics
 from stratdeck.tools.positions import PaperPosition, PaperPositionLeg
 
-
-class StubProvider:
-    def __init__(self, chain_mid: float = 1.0, ivr: float = 42.0):
-        self.chain_mid = chain_mid
-        self._ivr = ivr
-
-    def get_option_chain(self, symbol: str, expiry: str = None):
-        # Two-leg put spread with deterministic mids.
-        return {
-            "puts": [
-                {"strike": 100.0, "mid": self.chain_mid + 0.1},
-                {"strike": 95.0, "mid": 0.1},
-            ]
-        }
-
-    def get_quote(self, symbol: str):
-        return {"mark": 410.0}
-
-    def get_ivr(self, symbol: str):
-        return self._ivr
+from .fakes import ChainProvider
 
 
 class StrangleProvider:
@@ -50,7 +31,7 @@ class StrangleProvider:
         return self._ivr
 
 
-def test_compute_position_metrics_credit_spread():
+def test_compute_position_metrics_credit_spread(exit_rules):
     position = PaperPosition(
         symbol="XSP",
         trade_symbol="XSP",
@@ -65,15 +46,14 @@ def test_compute_position_metrics_credit_spread():
         entry_mid=1.5,
         spread_width=5.0,
     )
-    provider = StubProvider(chain_mid=1.0, ivr=35.0)
+    provider = ChainProvider(chain_mid=1.0, ivr=35.0, mark=410.0)
     now = datetime(2099, 12, 1, tzinfo=timezone.utc)
-    rules = load_exit_rules("short_put_spread_index_45d")
     metrics = compute_position_metrics(
         position,
         now=now,
         provider=provider,
         vol_snapshot={"XSP": 0.25},
-        exit_rules=rules,
+        exit_rules=exit_rules["short_put_spread_index_45d"],
     )
 
     assert metrics.current_mid == pytest.approx(1.0)
@@ -86,7 +66,7 @@ def test_compute_position_metrics_credit_spread():
     assert metrics.strategy_family == "credit_spread"
 
 
-def test_compute_position_metrics_widthless_credit_uses_entry_credit():
+def test_compute_position_metrics_widthless_credit_uses_entry_credit(exit_rules):
     position = PaperPosition(
         symbol="SPY",
         trade_symbol="SPY",
@@ -102,13 +82,12 @@ def test_compute_position_metrics_widthless_credit_uses_entry_credit():
     )
     provider = StrangleProvider(call_mid=0.25, put_mid=0.25, ivr=30.0)
     now = datetime(2099, 12, 1, tzinfo=timezone.utc)
-    rules = load_exit_rules("short_strangle")
     metrics = compute_position_metrics(
         position,
         now=now,
         provider=provider,
         vol_snapshot={"SPY": 0.3},
-        exit_rules=rules,
+        exit_rules=exit_rules["short_strangle"],
     )
 
     assert metrics.current_mid == pytest.approx(0.5)
@@ -121,7 +100,7 @@ def test_compute_position_metrics_widthless_credit_uses_entry_credit():
     assert metrics.strategy_family == "short_strangle"
 
 
-def test_compute_position_metrics_prefers_position_expiry():
+def test_compute_position_metrics_prefers_position_expiry(exit_rules):
     expiry = datetime(2100, 1, 10, tzinfo=timezone.utc)
     position = PaperPosition(
         symbol="XSP",
@@ -138,15 +117,14 @@ def test_compute_position_metrics_prefers_position_expiry():
         spread_width=5.0,
         expiry=expiry,
     )
-    provider = StubProvider(chain_mid=1.0, ivr=35.0)
+    provider = ChainProvider(chain_mid=1.0, ivr=35.0, mark=410.0)
     now = datetime(2100, 1, 1, tzinfo=timezone.utc)
-    rules = load_exit_rules("short_put_spread_index_45d")
     metrics = compute_position_metrics(
         position,
         now=now,
         provider=provider,
         vol_snapshot={"XSP": 0.25},
-        exit_rules=rules,
+        exit_rules=exit_rules["short_put_spread_index_45d"],
     )
 
     expected_dte = (expiry - now).total_seconds() / 86400.0
@@ -0,0 +1,112 @@
+from datetime import timedelta
+from typing import Callable, List, NamedTuple
+
+import pytest
+
+from stratdeck import cli
+from stratdeck.tools.positions import PaperPosition, PaperPositionLeg
+
+from .fakes import ChainProvider
+
+# Net spread mids per symbol against a 1.00 entry credit: WIN is past the 50%
+# profit target, DTE expires inside the 21-day backstop, HOLD triggers nothing.
+_MIDS = {"WIN": 0.2, "DTE": 1.0, "HOLD": 0.9}
+
+
+def _position(symbol: str, expiry: str, opened_at) -> PaperPosition:
+    return PaperPosition(
+        symbol=symbol,
+        trade_symbol=symbol,
+        strategy_id="short_put_spread_index_45d",
+        universe_id="index_core",
+        direction="bullish",
+        legs=[
+            PaperPositionLeg(side="short", type="put", strike=100.0, expiry=expiry, quantity=1),
+            PaperPositionLeg(side="long", type="put", strike=95.0, expiry=expiry, quantity=1),
+        ],
+        qty=1,
+        entry_mid=1.0,
+        spread_width=5.0,
+        opened_at=opened_at,
+    )
+
+
+@pytest.fixture
+def positioned_store(isolated_positions, memory_store, frozen_now, patch_cli_provider):
+    """Seed WIN/DTE/HOLD paper positions and a matching provider; return the store."""
+    opened_at = frozen_now - timedelta(days=5)
+    store = memory_store(isolated_positions)
+    store.bulk_add(
+        [
+            _position("WIN", "2100-01-01", opened_at),
+            _position("DTE", (frozen_now + timedelta(days=10)).date().isoformat(), opened_at),
+            _position("HOLD", "2100-01-01", opened_at),
+        ]
+    )
+    patch_cli_provider(ChainProvider(_MIDS, ivr=35.0), {symbol: 0.3 for symbol in _MIDS})
+    return store
+
+
+def _by_symbol(store):
+    return {p.symbol: p for p in store.list_positions()}
+
+
+def _check_monitor(payload, store, stratdeck_dir):
+    assert isinstance(payload, list) and len(payload) == 3
+    for item in payload:
+        assert "metrics" in item and "decision" in item
+        assert item["position"]["status"] == "open"
+    assert (stratdeck_dir / "last_position_monitoring.json").exists()
+
+
+def _check_close_auto_dry_run(payload, store, stratdeck_dir):
+    assert {item["position_before"]["symbol"] for item in payload} == {"WIN", "DTE"}
+    assert all(p.status == "open" for p in store.list_positions())
+
+
+def _check_close_auto(payload, store, stratdeck_dir):
+    assert len(payload) == 2
+    positions = _by_symbol(store)
+    assert positions["WIN"].exit_reason == "TARGET_PROFIT_HIT"
+    assert positions["DTE"].exit_reason == "DTE_BELOW_THRESHOLD"
+    assert [p.symbol for p in store.list_positions(status="open")] == ["HOLD"]
+
+
+def _check_close_dry_run(payload, store, stratdeck_dir):
+    assert payload["dry_run"] is True
+    assert _by_symbol(store)["HOLD"].status == "open"
+
+
+def _check_close(payload, store, stratdeck_dir):
+    assert payload["dry_run"] is False
+    hold = _by_symbol(store)["HOLD"]
+    assert hold.status == "closed"
+    assert hold.exit_mid == pytest.approx(_MIDS["HOLD"])
+    assert hold.exit_reason == "tester"
+    assert hold.realized_pl_total is not None
+
+
+class Case(NamedTuple):
+    args: List[str]  # "{id}" is replaced with the HOLD position id
+    check: Callable
+
+
+_CASES = [
+    pytest.param(Case(["positions", "monitor"], _check_monitor), id="monitor"),
+    pytest.param(Case(["positions", "close-auto", "--dry-run"], _check_close_auto_dry_run), id="close_auto_dry_run"),
+    pytest.param(Case(["positions", "close-auto"], _check_close_auto), id="close_auto"),
+    pytest.param(Case(["positions", "close", "--id", "{id}", "--dry-run"], _check_close_dry_run), id="close_dry_run"),
+    pytest.param(Case(["positions", "close", "--id", "{id}", "--reason", "tester"], _check_close), id="close"),
+]
+
+
+@pytest.mark.parametrize("case", _CASES)
+def test_positions_exit_commands(case, cli_runner, positioned_store, isolated_positions, decode):
+    hold_id = str(_by_symbol(positioned_store)["HOLD"].id)
+    args = [hold_id if arg == "{id}" else arg for arg in case.args]
+    env = {"STRATDECK_TRADING_MODE": "paper", "STRATDECK_DATA_MODE": "mock"}
+
+    result = cli_runner.invoke(cli.cli, args + ["--json-output"], env=env)
+
+    assert result.exit_code == 0, result.output
+    case.check(decode(result.output), positioned_store, isolated_positions.parent)
@@ -3,8 +3,8 @@ import pytest
 from stratdeck.tools.positions import PaperPosition, PaperPositionLeg, PositionsStore
 
 
-def test_positions_store_roundtrip(tmp_path):
-    store_path = tmp_path / ".stratdeck" / "positions.json"
+def test_positions_store_roundtrip(stratdeck_dir):
+    store_path = stratdeck_dir / "positions.json"
     store = PositionsStore(store_path)
     assert store.list_positions() == []
 
@@ -42,15 +42,15 @@ def test_positions_store_roundtrip(tmp_path):
     assert loaded[0].status == "open"
 
 
-def test_positions_store_filters_by_status(tmp_path):
-    store_path = tmp_path / ".stratdeck" / "positions.json"
+def test_positions_store_filters_by_status(stratdeck_dir):
+    store_path = stratdeck_dir / "positions.json"
     store = PositionsStore(store_path)
 
     open_pos = PaperPosition(symbol="SPY", trade_symbol="SPY", strategy="short_put", qty=1, entry_mid=0.5)
     closed_pos = PaperPosition(symbol="QQQ", trade_symbol="QQQ", strategy="short_call", qty=1, entry_mid=0.75, status="closed")
 
-    store.add_position(open_pos)
-    store.add_position(closed_pos)
+    store.bulk_add([open_pos, closed_pos])
+    assert len(PositionsStore(store_path).list_positions()) == 2
 
     open_only = store.list_positions(status="open")
     closed_only = store.list_positions(status="closed")
@@ -59,3 +59,33 @@ def test_positions_store_filters_by_status(tmp_path):
     assert open_only[0].symbol == "SPY"
     assert len(closed_only) == 1
     assert closed_only[0].symbol == "QQQ"
+
+
+def test_calc_dte_counts_whole_days_until_expiry():
+    from datetime import datetime, timedelta, timezone
+
+    from stratdeck.tools.positions import _calc_dte
+
+    now = datetime.now(timezone.utc)
+    expiry = (now + timedelta(days=10, hours=1)).isoformat()
+    assert _calc_dte(expiry) == 10
+    assert _calc_dte(expiry) == 10  # cached path
+    assert _calc_dte(now + timedelta(days=10, hours=1)) == 10
+    # A midnight expiry ten calendar days out is still only nine whole days away.
+    midnight = (now.date() + timedelta(days=10)).isoformat()
+    assert _calc_dte(midnight) == (9 if now.time() != datetime.min.time() else 10)
+    assert _calc_dte((now - timedelta(days=3)).isoformat()) == 0
+    assert _calc_dte("not-a-date") is None
+    assert _calc_dte(None) is None
+
+
+def test_legacy_dict_does_not_alias_model_provenance():
+    from stratdeck.tools.positions import _legacy_dict
+
+    pos = PaperPosition(symbol="XSP", entry_mid=1.1, provenance={"source": "scan", "tags": ["a"]})
+
+    data = _legacy_dict(pos)
+    data["provenance"]["source"] = "edited"
+    data["provenance"]["tags"].append("b")
+
+    assert pos.provenance == {"source": "scan", "tags": ["a"]}
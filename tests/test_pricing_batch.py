@@ -0,0 +1,28 @@
+import pytest
+
+from stratdeck.tools.pricing import batch_credit_and_pop, credit_for_vertical, pop_estimate
+
+
+def _vert(short_mid, long_mid, delta, width):
+    return {"short": {"mid": short_mid, "delta": delta}, "long": {"mid": long_mid}, "width": width}
+
+
+@pytest.mark.parametrize("target_delta", [None, 0.30, -0.16])
+def test_batch_credit_and_pop_matches_scalar_helpers(target_delta):
+    verts = [
+        _vert(1.25, 0.55, 0.22, 5.0),
+        _vert(0.40, 0.45, 0.0, 1.0),
+        _vert(2.10, 1.00, "bad", 20.0),
+        _vert(0.90, 0.30, 0.70, 0.0),
+    ]
+
+    credits, pops = batch_credit_and_pop(verts, target_delta)
+
+    assert list(credits) == pytest.approx([credit_for_vertical(v) for v in verts])
+    assert list(pops) == pytest.approx([pop_estimate(v, target_delta) for v in verts])
+
+
+def test_batch_credit_and_pop_empty():
+    credits, pops = batch_credit_and_pop([])
+    assert credits.shape == (0,)
+    assert pops.shape == (0,)
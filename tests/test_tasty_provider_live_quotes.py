@@ -1,10 +1,15 @@
 # tests/test_tasty_provider_live_quotes.py
 
-from datetime import datetime, timedelta, timezone
-from decimal import Decimal
+import copy
+import json
+import pickle
+import time
 
+import pytest
+
+from stratdeck.data import tasty_provider
 from stratdeck.data.live_quotes import QuoteSnapshot
-from stratdeck.data.tasty_provider import TastyProvider
+from stratdeck.data.tasty_provider import SnapshotQuote, TastyProvider
 
 
 class DummyLiveQuotes:
@@ -18,13 +23,12 @@ class DummyLiveQuotes:
 
 
 def test_quote_from_snapshot_happy_path(monkeypatch):
-    now = datetime.now(timezone.utc)
     snapshot = QuoteSnapshot(
         symbol="SPX",
-        bid=Decimal("4999.0"),
-        ask=Decimal("5001.0"),
-        mid=Decimal("5000.0"),
-        asof=now,
+        bid=4999.0,
+        ask=5001.0,
+        mid=5000.0,
+        asof=time.time(),
     )
 
     live = DummyLiveQuotes(snapshot)
@@ -34,12 +38,6 @@ def test_quote_from_snapshot_happy_path(monkeypatch):
     provider = TastyProvider.__new__(TastyProvider)
     provider._live_quotes = live
 
-    # Provide the helpers used inside _quote_from_snapshot
-    provider._safe_float = lambda v: float(v) if v is not None else None
-    provider._mid = lambda bid, ask, mark, last: (
-        (bid + ask) / 2 if bid is not None and ask is not None else None
-    )
-
     quote = provider._quote_from_snapshot("SPX")
 
     assert quote is not None
@@ -52,6 +50,36 @@ def test_quote_from_snapshot_happy_path(monkeypatch):
     assert live.requested_symbols == ["SPX"]
 
 
+def test_snapshot_quote_reads_like_a_quote_dict():
+    quote = SnapshotQuote("SPX", 4999.0, 5001.0, 5000.0, 5000.0, 5000.0)
+
+    assert dict(quote) == {
+        "symbol": "SPX",
+        "bid": 4999.0,
+        "ask": 5001.0,
+        "last": 5000.0,
+        "mark": 5000.0,
+        "mid": 5000.0,
+        "source": "dxlink",
+    }
+    assert quote.get("mark") == 5000.0
+    assert quote.get("greeks", {}) == {}
+    assert "source" in quote and "delta" not in quote
+    with pytest.raises(KeyError):
+        quote["delta"]
+    with pytest.raises(AttributeError):
+        quote.mid = 1.0
+
+
+def test_snapshot_quote_copies_pickles_and_serialises():
+    quote = SnapshotQuote("SPX", 4999.0, 5001.0, 5000.0, 5000.0, 5000.0)
+
+    assert copy.copy(quote) == quote
+    assert copy.deepcopy(quote) == quote
+    assert pickle.loads(pickle.dumps(quote)) == quote
+    assert json.loads(json.dumps(quote._asdict())) == dict(quote)
+
+
 def test_quote_from_snapshot_no_live_service():
     provider = TastyProvider.__new__(TastyProvider)
     provider._live_quotes = None
@@ -77,10 +105,10 @@ def test_get_quote_prefers_dxlink_over_rest(monkeypatch):
 
     snap = QuoteSnapshot(
         symbol="SPX",
-        bid=Decimal("4999.0"),
-        ask=Decimal("5001.0"),
-        mid=Decimal("5000.0"),
-        asof=datetime.now(timezone.utc),
+        bid=4999.0,
+        ask=5001.0,
+        mid=5000.0,
+        asof=time.time(),
     )
 
     class FakeLiveQuotes:
@@ -91,10 +119,6 @@ def test_get_quote_prefers_dxlink_over_rest(monkeypatch):
 
     provider = TastyProvider.__new__(TastyProvider)
     provider._live_quotes = FakeLiveQuotes(snap)
-    provider._safe_float = lambda v: float(v) if v is not None else None
-    provider._mid = lambda bid, ask, mark, last: (
-        (bid + ask) / 2 if bid is not None and ask is not None else None
-    )
 
     # If this gets called, the test should fail
     def fake_rest(_symbol: str):
@@ -117,6 +141,7 @@ def test_get_quote_uses_rest_when_no_snapshot(monkeypatch):
 
     provider = TastyProvider.__new__(TastyProvider)
     provider._live_quotes = FakeLiveQuotes()
+    provider._quote_cache = {}
 
     called = {"symbol": None}
 
@@ -168,7 +193,7 @@ def test_get_quote_rest_maps_fields_correctly(monkeypatch):
     provider.INDEX_SYMBOLS = {"SPX"}  # make sure this branch is hit
 
     # Fake _get_json to avoid real HTTP
-    def fake_get_json(path: str):
+    def fake_get_json(path: str, timeout=None):
         assert path == "/market-data/Index/SPX"
         return {
             "data": {
@@ -180,9 +205,6 @@ def test_get_quote_rest_maps_fields_correctly(monkeypatch):
         }
 
     provider._get_json = fake_get_json
-    provider._mid = lambda bid, ask, mark, last: (
-        mark if mark is not None else ((bid + ask) / 2 if bid and ask else last)
-    )
 
     quote = provider._get_quote_rest("SPX")
 
@@ -200,15 +222,300 @@ def test_get_quote_rest_uses_equity_path_for_non_index(monkeypatch):
 
     paths = []
 
-    def fake_get_json(path: str):
+    def fake_get_json(path: str, timeout=None):
         paths.append(path)
         return {"data": {"bid": "10.0", "ask": "11.0"}}
 
     provider._get_json = fake_get_json
-    provider._mid = lambda bid, ask, mark, last: (bid + ask) / 2
 
     quote = provider._get_quote_rest("MSFT")
 
     assert paths == ["/market-data/Equity/MSFT"]
     assert quote["symbol"] == "MSFT"
     assert quote["mid"] == 10.5
+
+
+def test_get_quotes_batches_rest_and_prefers_dxlink():
+    snap = QuoteSnapshot(
+        symbol="SPX",
+        bid=4999.0,
+        ask=5001.0,
+        mid=5000.0,
+        asof=time.time(),
+    )
+
+    class FakeLiveQuotes:
+        def get_snapshot(self, symbol):
+            return snap if symbol == "SPX" else None
+
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._live_quotes = FakeLiveQuotes()
+    provider._quote_cache = {}
+
+    calls = []
+
+    def fake_get_json(path: str, params=None):
+        calls.append((path, params))
+        return {
+            "data": {
+                "items": [
+                    {"symbol": "MSFT", "bid": "10.0", "ask": "11.0"},
+                    {"symbol": "RUT", "bid": "2000.0", "ask": "2002.0"},
+                ]
+            }
+        }
+
+    provider._get_json = fake_get_json
+
+    quotes = provider.get_quotes(["spx", "MSFT", "rut", "msft"])
+
+    assert calls == [("/market-data/by-type", [("equity", "MSFT"), ("index", "RUT")])]
+    assert quotes["SPX"]["source"] == "dxlink"
+    assert quotes["MSFT"]["mid"] == 10.5
+    assert quotes["RUT"]["mid"] == 2001.0
+    assert "source" not in quotes["RUT"]
+
+
+def test_get_quotes_fans_out_symbols_missing_from_batch():
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._live_quotes = None
+    provider._quote_cache = {}
+    provider._get_json = lambda path, params=None: {"data": {"items": []}}
+
+    requested = []
+
+    def fake_rest(symbol: str):
+        requested.append(symbol)
+        return {"symbol": symbol, "mid": float(len(symbol))}
+
+    provider._get_quote_rest = fake_rest
+
+    quotes = provider.get_quotes(["AAPL", "QQQ", "SPX"])
+
+    assert sorted(requested) == ["AAPL", "QQQ", "SPX"]
+    assert list(quotes) == ["AAPL", "QQQ", "SPX"]
+    assert quotes["QQQ"]["mid"] == 3.0
+
+
+def test_get_quote_reuses_rest_quote_within_ttl():
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._live_quotes = None
+    provider._quote_cache = {}
+    clock = {"t": 100.0}
+    provider._now = lambda: clock["t"]
+
+    calls = []
+
+    def fake_rest(symbol: str):
+        calls.append(symbol)
+        return {"symbol": symbol, "mid": 1.5}
+
+    provider._get_quote_rest = fake_rest
+
+    first = provider.get_quote("MSFT")
+    first["mid"] = 99.0  # callers mutating their copy must not poison the cache
+    clock["t"] += provider._quote_cache_ttl / 2
+    assert provider.get_quote("msft")["mid"] == 1.5
+    assert provider.get_quotes(["MSFT"])["MSFT"]["mid"] == 1.5
+    assert calls == ["MSFT"]
+
+    clock["t"] += provider._quote_cache_ttl
+    provider.get_quote("MSFT")
+    assert calls == ["MSFT", "MSFT"]
+
+
+def test_get_quote_serves_last_good_quote_when_rest_fails():
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._live_quotes = None
+    provider._quote_cache = {}
+    clock = {"t": 100.0}
+    provider._now = lambda: clock["t"]
+
+    def timed_out(symbol: str):
+        raise TimeoutError("read timed out")
+
+    provider._get_quote_rest = timed_out
+    with pytest.raises(TimeoutError):
+        provider.get_quote("MSFT")
+
+    provider._get_quote_rest = lambda symbol: {"symbol": symbol, "mid": 1.5}
+    assert provider.get_quote("MSFT")["mid"] == 1.5
+
+    clock["t"] += provider._quote_cache_ttl * 4
+    provider._get_quote_rest = timed_out
+    quote = provider.get_quote("MSFT")
+
+    assert quote["mid"] == 1.5
+    assert quote["source"] == "rest-stale"
+    assert quote["stale"] is True
+    assert quote["asof"] == pytest.approx(time.time() - provider._quote_cache_ttl * 4, abs=1.0)
+
+    # Past the stale limit the failure surfaces instead of an old price.
+    clock["t"] += provider.STALE_QUOTE_MAX_AGE
+    with pytest.raises(TimeoutError):
+        provider.get_quote("MSFT")
+
+
+def test_get_quote_does_not_mask_http_errors_with_stale_quote():
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._live_quotes = None
+    provider._quote_cache = {}
+    clock = {"t": 100.0}
+    provider._now = lambda: clock["t"]
+
+    provider._get_quote_rest = lambda symbol: {"symbol": symbol, "mid": 1.5}
+    provider.get_quote("MSFT")
+    clock["t"] += provider._quote_cache_ttl
+
+    def http_error(symbol: str):
+        raise RuntimeError("Tastytrade error 500: boom")
+
+    provider._get_quote_rest = http_error
+    with pytest.raises(RuntimeError):
+        provider.get_quote("MSFT")
+
+
+@pytest.mark.parametrize(
+    "bid, ask, mark, last, expected",
+    [
+        (1.0, 2.0, 9.0, 8.0, 1.5),
+        (0.0, 2.0, 9.0, 8.0, 9.0),
+        (None, 2.0, None, 8.0, 8.0),
+        (None, None, None, None, None),
+    ],
+    ids=["two_sided", "zero_bid_uses_mark", "one_sided_uses_last", "nothing"],
+)
+def test_mid_prefers_two_sided_then_mark_then_last(bid, ask, mark, last, expected):
+    assert TastyProvider._mid(bid, ask, mark, last) == expected
+
+
+def test_concurrent_401s_trigger_a_single_login():
+    import threading
+    from types import SimpleNamespace
+
+    workers = 6
+    barrier = threading.Barrier(workers)
+
+    class Session:
+        def __init__(self):
+            self.headers = {"Authorization": "expired"}
+            self.logins = 0
+
+        def request(self, method, url, **kwargs):
+            if self.headers["Authorization"] == "expired":
+                barrier.wait(timeout=5)  # every worker sees the 401 together
+                return SimpleNamespace(status_code=401)
+            return SimpleNamespace(status_code=200)
+
+        def post(self, url, **kwargs):
+            self.logins += 1
+            time.sleep(0.01)
+            return SimpleNamespace(status_code=201, json=lambda: {"data": {"session-token": f"fresh-{self.logins}"}})
+
+    provider = TastyProvider.__new__(TastyProvider)
+    provider.session = Session()
+    provider.username = provider.password = "x"
+
+    threads = [threading.Thread(target=provider._request, args=("GET", "/q")) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.session.logins == 1
+    assert provider.session.headers["Authorization"] == "fresh-1"
+
+
+def test_http_session_falls_back_to_pooled_requests(monkeypatch):
+    monkeypatch.setattr(tasty_provider, "HAVE_HTTPX", False)
+
+    session = tasty_provider._new_http_session()
+
+    adapter = session.get_adapter("https://api.tastyworks.com")
+    assert adapter._pool_maxsize == tasty_provider.HTTP_MAX_CONNECTIONS
+
+
+def test_get_quotes_batches_by_max_quote_batch(monkeypatch):
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._live_quotes = None
+    provider._quote_cache = {}
+    monkeypatch.setattr(TastyProvider, "MAX_QUOTE_BATCH", 2)
+    monkeypatch.setattr(TastyProvider, "MAX_OPTION_QUOTES", 1)
+    batches = []
+
+    def fake_get_json(path: str, params=None):
+        batches.append([sym for _, sym in params])
+        return {"data": {"items": [{"symbol": sym, "bid": "1.0", "ask": "2.0"} for _, sym in params]}}
+
+    provider._get_json = fake_get_json
+    provider.get_quotes(["A", "B", "C"])
+
+    assert batches == [["A", "B"], ["C"]]
+
+
+def test_httpx_session_follows_redirects_like_requests():
+    if not tasty_provider.HAVE_HTTPX:
+        pytest.skip("httpx not installed")
+
+    session = tasty_provider._new_http_session()
+
+    assert session.follow_redirects is True
+
+
+def test_get_quote_rest_replays_from_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(tasty_provider.QUOTE_CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(tasty_provider.time, "time", lambda: 1_000_000.0)  # pin the bucket
+    paths = []
+
+    def fake_get_json(path: str, timeout=None):
+        paths.append(path)
+        return {"data": {"bid": "10.0", "ask": "11.0"}}
+
+    first = TastyProvider.__new__(TastyProvider)
+    first._get_json = fake_get_json
+    assert first._get_quote_rest("MSFT")["mid"] == 10.5
+
+    second = TastyProvider.__new__(TastyProvider)
+    second._get_json = fake_get_json
+    assert second._get_quote_rest("MSFT")["mid"] == 10.5
+
+    assert paths == ["/market-data/Equity/MSFT"]
+    assert len(list(tmp_path.glob("MSFT/*.json"))) == 1
+
+
+def test_quote_disk_cache_keeps_similar_symbols_apart(monkeypatch, tmp_path):
+    monkeypatch.setenv(tasty_provider.QUOTE_CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(tasty_provider.time, "time", lambda: 1_000_000.0)
+
+    def fake_get_json(path: str, timeout=None):
+        return {"data": {"bid": "10.0", "ask": "11.0"}}
+
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._get_json = fake_get_json
+    for symbol in ("X.1", "X_1", "X"):
+        provider._get_quote_rest(symbol)
+
+    assert sorted(p.parent.name for p in tmp_path.glob("*/*.json")) == ["X", "X.1", "X_1"]
+
+
+def test_get_quotes_batch_goes_through_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv(tasty_provider.QUOTE_CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(tasty_provider.time, "time", lambda: 1_000_000.0)
+    calls = []
+
+    def fake_get_json(path: str, params=None):
+        calls.append(params)
+        return {"data": {"items": [{"symbol": sym, "bid": "10.0", "ask": "11.0"} for _, sym in params]}}
+
+    def make_provider():
+        provider = TastyProvider.__new__(TastyProvider)
+        provider._live_quotes = None
+        provider._quote_cache = {}
+        provider._get_json = fake_get_json
+        return provider
+
+    assert make_provider().get_quotes(["MSFT", "AAPL"])["AAPL"]["mid"] == 10.5
+    replayed = make_provider().get_quotes(["MSFT", "AAPL"])
+
+    assert replayed["MSFT"]["mid"] == 10.5
+    assert calls == [[("equity", "MSFT"), ("equity", "AAPL")]]
@@ -1,53 +1,90 @@
-from stratdeck.data import tasty_watchlists
+import pytest
 
+from stratdeck.data import tasty_watchlists
 
-def test_get_watchlist_symbols_normalizes_and_sorts(monkeypatch):
-    payload = {
-        "data": {
-            "items": [
-                {
-                    "name": "StratDeckUniverse",
-                    "items": [
-                        {"symbol": "aapl", "instrument-type": "Equity"},
-                        {"symbol": "MSFT", "instrument-type": "Equity"},
-                        {
-                            "symbol": "SPX  231215P03500000",
-                            "instrument-type": "Equity Option",
-                            "underlying-symbol": "SPX",
-                        },
-                        {"symbol": "GLD", "instrument-type": "ETF"},
-                        {"symbol": "AAPL", "instrument-type": "Equity"},
-                    ],
-                }
-            ]
-        }
+_PAYLOAD = {
+    "data": {
+        "items": [
+            {
+                "name": "StratDeckUniverse",
+                "items": [
+                    {"symbol": "aapl", "instrument-type": "Equity"},
+                    {"symbol": "MSFT", "instrument-type": "Equity"},
+                    {
+                        "symbol": "SPX  231215P03500000",
+                        "instrument-type": "Equity Option",
+                        "underlying-symbol": "SPX",
+                    },
+                    {"symbol": "GLD", "instrument-type": "ETF"},
+                    {"symbol": "AAPL", "instrument-type": "Equity"},
+                ],
+            }
+        ]
     }
+}
+
+
+class DummyResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = "json"
+
+    def json(self):
+        return self._payload
+
+
+class DummySession:
+    def __init__(self, payload, captured_urls, status_code=200):
+        self.payload = payload
+        self.captured_urls = captured_urls
+        self.status_code = status_code
+
+    def get(self, url, timeout=30):
+        self.captured_urls.append(url)
+        return DummyResponse(self.payload, self.status_code)
+
 
-    captured_urls = []
+class Logins:
+    """Records DummySessions handed out by the patched login helper."""
 
-    class DummyResponse:
-        def __init__(self, payload):
-            self.status_code = 200
-            self._payload = payload
-            self.text = "json"
+    def __init__(self):
+        self.sessions = []
+        self.statuses = []  # status codes for successive logins; 200 once exhausted
+        self.captured_urls = []
 
-        def json(self):
-            return self._payload
+    def __call__(self):
+        status = self.statuses.pop(0) if self.statuses else 200
+        self.sessions.append(DummySession(_PAYLOAD, self.captured_urls, status))
+        return self.sessions[-1]
 
-    class DummySession:
-        def __init__(self, payload):
-            self.payload = payload
 
-        def get(self, url, timeout=30):
-            captured_urls.append(url)
-            return DummyResponse(self.payload)
+@pytest.fixture
+def logins(monkeypatch):
+    monkeypatch.setattr(tasty_watchlists, "_SESSION", None)
+    logins = Logins()
+    monkeypatch.setattr(tasty_watchlists, "make_tasty_session_from_env", logins)
+    return logins
 
-    monkeypatch.setattr(
-        tasty_watchlists, "make_tasty_session_from_env", lambda: DummySession(payload)
-    )
 
+def test_get_watchlist_symbols_normalizes_and_sorts(logins):
     symbols = tasty_watchlists.get_watchlist_symbols("StratDeckUniverse")
 
     assert symbols == ["AAPL", "GLD", "MSFT", "SPX"]
-    assert captured_urls == [f"{tasty_watchlists.API_BASE}/watchlists"]
+    assert logins.captured_urls == [f"{tasty_watchlists.API_BASE}/watchlists"]
 
+
+def test_get_watchlist_symbols_reuses_session(logins):
+    tasty_watchlists.get_watchlist_symbols("StratDeckUniverse")
+    tasty_watchlists.get_watchlist_symbols("StratDeckUniverse")
+
+    assert len(logins.sessions) == 1
+
+
+def test_get_watchlist_symbols_relogs_in_after_401(logins):
+    logins.statuses.append(401)
+
+    symbols = tasty_watchlists.get_watchlist_symbols("StratDeckUniverse")
+
+    assert symbols == ["AAPL", "GLD", "MSFT", "SPX"]
+    assert [s.status_code for s in logins.sessions] == [401, 200]
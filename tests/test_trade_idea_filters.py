@@ -12,40 +12,15 @@ from stratdeck.strategies import (
 )
 
 
-def _scan_row(symbol: str, low: float, high: float, ivr: float):
-    return {
-        "symbol": symbol,
-        "ivr": ivr,
-        "ta_directional_bias": "bullish",
-        "ta_vol_bias": "normal",
-        "strategy_hint": "short_premium_range",
-        "ta": {
-            "scores": {
-                "directional_bias": "bullish",
-                "vol_bias": "normal",
-                "ta_bias": 0.0,
-            },
-            "structure": {
-                "support": [low],
-                "resistance": [high],
-                "range": {
-                    "low": low,
-                    "high": high,
-                    "in_range": True,
-                    "position_in_range": 0.5,
-                },
-            },
-            "trend_regime": {"state": "uptrend"},
-            "vol_regime": {"state": "normal"},
-        },
-    }
-
-
 class StubChains:
+    def __init__(self):
+        self.priced = []
+
     def get_available_dtes(self, symbol: str):
         return []
 
     def price_structure(self, **kwargs):
+        self.priced.append(kwargs["symbol"])
         # Provide credit_per_width so filters can evaluate.
         return {"pop": 0.6, "credit_per_width": 0.3, "credit": 0.6}
 
@@ -65,13 +40,12 @@ def _task():
     return SymbolStrategyTask(symbol="SPX", strategy=strategy, universe=universe)
 
 
-def test_strategy_filters_gate_and_annotate(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
+def test_strategy_filters_gate_and_annotate(make_scan_row):
     planner = TradePlanner(chains_client=StubChains())
     task = _task()
 
-    failing = _scan_row("SPX", 100.0, 110.0, ivr=0.1)
-    passing = _scan_row("SPX", 100.0, 110.0, ivr=0.35)
+    failing = make_scan_row("SPX", 100.0, 110.0, ivr=0.1)
+    passing = make_scan_row("SPX", 100.0, 110.0, ivr=0.35)
 
     ideas = planner.generate_from_scan_results_with_strategies(
         scan_rows=[failing, passing],
@@ -88,3 +62,87 @@ def test_strategy_filters_gate_and_annotate(monkeypatch):
     assert idea.filter_reasons == []
     assert idea.strategy_id == "short_put_spread_index_45d"
     assert idea.universe_id == "index_core"
+
+
+def test_ivr_gate_skips_pricing_for_rows_outside_band(make_scan_row):
+    chains = StubChains()
+    planner = TradePlanner(chains_client=chains)
+
+    rows = [
+        make_scan_row("SPX", 100.0, 110.0, ivr=0.1),
+        {**make_scan_row("SPX", 100.0, 110.0, ivr=0.0), "ivr": None},
+        make_scan_row("SPX", 100.0, 110.0, ivr=0.35),
+    ]
+    masks = planner._ivr_gate_masks(rows, [_task()])
+    assert [list(mask) for mask in masks.values()] == [[False, False, True]]
+
+    ideas = planner.generate_from_scan_results_with_strategies(
+        scan_rows=rows,
+        tasks=[_task()],
+        dte_target=30,
+        max_per_symbol=3,
+    )
+
+    assert len(ideas) == 1
+    assert chains.priced == ["SPX"]
+
+
+def test_ivr_gate_leaves_nan_ivr_rows_to_the_filters(make_scan_row):
+    chains = StubChains()
+    planner = TradePlanner(chains_client=chains)
+
+    rows = [
+        make_scan_row("SPX", 100.0, 110.0, ivr=float("nan")),
+        {**make_scan_row("SPX", 100.0, 110.0, ivr=0.0), "ivr": None},
+    ]
+    masks = planner._ivr_gate_masks(rows, [_task()])
+    assert [list(mask) for mask in masks.values()] == [[True, False]]
+
+    ideas = planner.generate_from_scan_results_with_strategies(
+        scan_rows=rows[:1],
+        tasks=[_task()],
+        dte_target=30,
+        max_per_symbol=3,
+    )
+
+    # NaN compares False to both bounds, so the filters let the row through.
+    assert len(ideas) == 1
+    assert chains.priced == ["SPX"]
+
+
+def test_stops_pricing_once_symbol_has_max_ideas(make_scan_row):
+    chains = StubChains()
+    planner = TradePlanner(chains_client=chains)
+
+    ideas = planner.generate_from_scan_results_with_strategies(
+        scan_rows=[make_scan_row("SPX", 100.0, 110.0, ivr=0.35)],
+        tasks=[_task(), _task()],
+        dte_target=30,
+        max_per_symbol=1,
+    )
+
+    assert len(ideas) == 1
+    assert chains.priced == ["SPX"]
+
+
+def test_ivr_gate_masks_cover_each_band_shape():
+    base = _task()
+    strategies = {
+        "min_only": base.strategy,
+        "max_only": base.strategy.model_copy(update={"filters": StrategyFilters(max_ivr=0.3)}),
+        "unbounded": base.strategy.model_copy(update={"filters": None}),
+    }
+    tasks = [
+        SymbolStrategyTask(symbol="SPX", strategy=strategy, universe=base.universe)
+        for strategy in strategies.values()
+    ]
+    rows = [{"symbol": "SPX", "ivr": ivr} for ivr in (0.1, 0.35, None)]
+
+    masks = TradePlanner(chains_client=StubChains())._ivr_gate_masks(rows, tasks)
+
+    got = {name: list(masks[id(strategy)]) for name, strategy in strategies.items()}
+    assert got == {
+        "min_only": [False, True, False],
+        "max_only": [True, False, False],
+        "unbounded": [True, True, True],
+    }
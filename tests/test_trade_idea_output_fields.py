@@ -1,12 +1,9 @@
-import json
-import os
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
 
 import pytest
-from click.testing import CliRunner
 
 from stratdeck.agents.trade_planner import TradePlanner
-from stratdeck import cli as cli_module
 from stratdeck.strategy_engine import SymbolStrategyTask
 from stratdeck.strategies import (
     DTERule,
@@ -21,14 +18,21 @@ from stratdeck.strategies import (
     WidthRule,
     WidthRuleType,
 )
-from stratdeck.tools.dates import compute_dte
+from stratdeck.tools.dates import compute_dte as _compute_dte
 import stratdeck.tools.chain_pricing_adapter as chains_adapter
 import stratdeck.tools.chains as chains_module
 
+# Pure over the expiry string for the length of a run; the equity tests ask for
+# the same expiry's DTE from the stubs and the assertions.
+compute_dte = lru_cache(maxsize=None)(_compute_dte)
+
 
 class StubChainsWithDeltas:
     expiry = "2025-01-17"
     dte_val = 30
+    # The quote only depends on (option_type, width); the planner reads it
+    # without mutating, so one dict per key is shared across calls.
+    _vert_cache: dict = {}
 
     def get_expiration_candidates(self, symbol: str):
         return [
@@ -49,9 +53,13 @@ class StubChainsWithDeltas:
         expiry=None,
         dte_target=None,
     ):
+        key = (option_type, width)
+        cached = self._vert_cache.get(key)
+        if cached is not None:
+            return cached
         short_delta = 0.26 if option_type == "put" else 0.28
         long_delta = 0.05
-        return {
+        result = {
             "credit": 1.5,
             "credit_per_width": 0.3,
             "pop": 0.65,
@@ -80,6 +88,8 @@ class StubChainsWithDeltas:
             "dte": self.dte_val,
             "short_delta": short_delta,
         }
+        self._vert_cache[key] = result
+        return result
 
     def build_iron_condor_by_delta(
         self,
@@ -122,35 +132,8 @@ class StubChainsWithDeltas:
         }
 
 
-def _scan_row(symbol: str, low: float, high: float, ivr: float):
-    return {
-        "symbol": symbol,
-        "ivr": ivr,
-        "ta_directional_bias": "bullish",
-        "ta_vol_bias": "normal",
-        "strategy_hint": "short_premium_range",
-        "ta": {
-            "scores": {
-                "directional_bias": "bullish",
-                "vol_bias": "normal",
-                "ta_bias": 0.0,
-            },
-            "structure": {
-                "support": [low],
-                "resistance": [high],
-                "range": {
-                    "low": low,
-                    "high": high,
-                    "in_range": True,
-                    "position_in_range": 0.5,
-                },
-            },
-            "trend_regime": {"state": "uptrend"},
-            "vol_regime": {"state": "normal"},
-        },
-    }
-
-
+# Tasks are only read by the planner, so each validated task is built once.
+@lru_cache(maxsize=None)
 def _task(option_type: str) -> SymbolStrategyTask:
     source = UniverseSource(type=UniverseSourceType.STATIC, tickers=["SPX"])
     universe = UniverseConfig(
@@ -171,6 +154,7 @@ def _task(option_type: str) -> SymbolStrategyTask:
     return SymbolStrategyTask(symbol="SPX", strategy=strategy, universe=universe)
 
 
+@lru_cache(maxsize=None)
 def _equity_task(symbol: str) -> SymbolStrategyTask:
     source = UniverseSource(type=UniverseSourceType.STATIC, tickers=[symbol])
     universe = UniverseConfig(
@@ -203,48 +187,61 @@ def _equity_chain_fixture(expiry: str) -> dict:
     }
 
 
+@pytest.fixture(scope="module")
+def equity_expiry_and_chain(today_date):
+    expiry = (today_date + timedelta(days=45)).isoformat()
+    return expiry, _equity_chain_fixture(expiry)
+
+
 @pytest.fixture
+def patched_equity_chain(monkeypatch, equity_expiry_and_chain):
+    """Serve the equity chain fixture from both chain lookups the planner uses."""
+    _, chain = equity_expiry_and_chain
+    monkeypatch.setattr(chains_adapter, "get_chain", lambda sym, expiry=None: chain)
+    monkeypatch.setattr(chains_module, "get_chain", lambda sym, expiry=None: chain)
+    return chain
+
+
+@pytest.fixture(scope="module")
 def planner():
+    # StubChainsWithDeltas is stateless and the tests only read the ideas, so
+    # one planner serves the whole module.
     return TradePlanner(chains_client=StubChainsWithDeltas())
 
 
-def test_trade_idea_carries_dte_and_leg_delta(monkeypatch, planner):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    task = _task(option_type="put")
+@pytest.fixture(scope="module")
+def spx_idea(planner, make_scan_row):
+    """Generate the single SPX idea once per option type for the whole module."""
 
-    ideas = planner.generate_from_scan_results_with_strategies(
-        scan_rows=[_scan_row("SPX", 100.0, 110.0, ivr=0.4)],
-        tasks=[task],
-        dte_target=45,
-        max_per_symbol=1,
-    )
+    @lru_cache(maxsize=None)
+    def _generate(option_type: str):
+        ideas = planner.generate_from_scan_results_with_strategies(
+            scan_rows=[make_scan_row("SPX", 100.0, 110.0, ivr=0.4)],
+            tasks=[_task(option_type=option_type)],
+            dte_target=45,
+            max_per_symbol=1,
+        )
+        assert ideas and len(ideas) == 1
+        return ideas[0]
 
-    assert ideas and len(ideas) == 1
-    idea = ideas[0]
+    return _generate
+
+
+def test_trade_idea_carries_dte_and_leg_delta(spx_idea):
+    idea = spx_idea("put")
     assert idea.dte == StubChainsWithDeltas.dte_val
     assert idea.expiry == StubChainsWithDeltas.expiry
-    assert idea.spread_width == pytest.approx(5.0)
+    assert idea.spread_width == 5.0
 
     short_legs = [leg for leg in idea.legs if leg.side == "short"]
     assert short_legs, "expected at least one short leg"
     assert all(leg.delta is not None for leg in short_legs)
     assert all(leg.dte == StubChainsWithDeltas.dte_val for leg in idea.legs)
-    assert idea.short_put_delta == pytest.approx(0.26)
-
-
-def test_short_and_long_leg_views_share_canonical_legs(monkeypatch, planner):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    task = _task(option_type="put")
+    assert idea.short_put_delta == 0.26
 
-    ideas = planner.generate_from_scan_results_with_strategies(
-        scan_rows=[_scan_row("SPX", 100.0, 110.0, ivr=0.4)],
-        tasks=[task],
-        dte_target=45,
-        max_per_symbol=1,
-    )
 
-    assert ideas and len(ideas) == 1
-    idea = ideas[0]
+def test_short_and_long_leg_views_share_canonical_legs(spx_idea):
+    idea = spx_idea("put")
 
     assert idea.short_legs and idea.long_legs
 
@@ -261,35 +258,23 @@ def test_short_and_long_leg_views_share_canonical_legs(monkeypatch, planner):
     assert long_leg.dte == canonical_long.dte == StubChainsWithDeltas.dte_val
 
 
-def test_iron_condor_carries_both_short_leg_deltas(monkeypatch, planner):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    task = _task(option_type="both")
-
-    ideas = planner.generate_from_scan_results_with_strategies(
-        scan_rows=[_scan_row("SPX", 100.0, 110.0, ivr=0.4)],
-        tasks=[task],
-        dte_target=45,
-        max_per_symbol=1,
-    )
-
-    assert ideas and len(ideas) == 1
-    idea = ideas[0]
+def test_iron_condor_carries_both_short_leg_deltas(spx_idea):
+    idea = spx_idea("both")
     short_put = next((leg for leg in idea.legs if leg.side == "short" and leg.type == "put"), None)
     short_call = next((leg for leg in idea.legs if leg.side == "short" and leg.type == "call"), None)
 
     assert short_put is not None and short_call is not None
     assert short_put.delta is not None
     assert short_call.delta is not None
-    assert idea.short_put_delta == pytest.approx(0.26)
-    assert idea.short_call_delta == pytest.approx(0.28)
+    assert idea.short_put_delta == 0.26
+    assert idea.short_call_delta == 0.28
     assert idea.dte == StubChainsWithDeltas.dte_val
-    assert idea.spread_width == pytest.approx(5.0)
+    assert idea.spread_width == 5.0
 
 
-def test_pricing_backfills_leg_deltas_from_live_chain(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
+def test_pricing_backfills_leg_deltas_from_live_chain(monkeypatch, make_scan_row, today_date):
     symbol = "AMZN"
-    expiry = (datetime.utcnow().date() + timedelta(days=30)).isoformat()
+    expiry = (today_date + timedelta(days=30)).isoformat()
     chain = {
         "symbol": symbol,
         "expiry": expiry,
@@ -317,7 +302,7 @@ def test_pricing_backfills_leg_deltas_from_live_chain(monkeypatch):
     task = _equity_task(symbol)
 
     ideas = planner.generate_from_scan_results_with_strategies(
-        scan_rows=[_scan_row(symbol, 100.0, 120.0, ivr=0.35)],
+        scan_rows=[make_scan_row(symbol, 100.0, 120.0, ivr=0.35)],
         tasks=[task],
         dte_target=30,
         max_per_symbol=1,
@@ -331,19 +316,15 @@ def test_pricing_backfills_leg_deltas_from_live_chain(monkeypatch):
     assert short_put is not None and long_put is not None
     assert short_put.delta is not None
     assert long_put.delta is not None
-    assert short_put.delta == pytest.approx(0.24)
-    assert long_put.delta == pytest.approx(0.08)
+    assert short_put.delta == 0.24
+    assert long_put.delta == 0.08
     assert idea.dte == 30
-    assert idea.spread_width == pytest.approx(5.0)
+    assert idea.spread_width == 5.0
 
 
-def test_equity_leg_delta_backfilled_from_chain(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    expiry = (datetime.utcnow().date() + timedelta(days=45)).isoformat()
-    chain = _equity_chain_fixture(expiry)
-
-    monkeypatch.setattr(chains_adapter, "get_chain", lambda sym, expiry=None: chain)
-    monkeypatch.setattr(chains_module, "get_chain", lambda sym, expiry=None: chain)
+def test_equity_leg_delta_backfilled_from_chain(monkeypatch, equity_expiry_and_chain, patched_equity_chain, make_scan_row):
+    expiry, _ = equity_expiry_and_chain
+    chain = patched_equity_chain
 
     planner = TradePlanner()
     monkeypatch.setattr(
@@ -386,7 +367,7 @@ def test_equity_leg_delta_backfilled_from_chain(monkeypatch):
     task = _equity_task("AMZN")
 
     ideas = planner.generate_from_scan_results_with_strategies(
-        scan_rows=[_scan_row("AMZN", 100.0, 120.0, ivr=0.35)],
+        scan_rows=[make_scan_row("AMZN", 100.0, 120.0, ivr=0.35)],
         tasks=[task],
         dte_target=45,
         max_per_symbol=1,
@@ -396,19 +377,25 @@ def test_equity_leg_delta_backfilled_from_chain(monkeypatch):
     idea = ideas[0]
     short_put = next((leg for leg in idea.legs if leg.side == "short" and leg.type == "put"), None)
     assert short_put is not None
-    assert short_put.delta == pytest.approx(0.28)
-    assert idea.short_put_delta == pytest.approx(0.28)
+    assert short_put.delta == 0.28
+    assert idea.short_put_delta == 0.28
     assert idea.dte == compute_dte(expiry)
-    assert idea.spread_width == pytest.approx(5.0)
-
-
-def test_trade_ideas_cli_equity_includes_delta(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    expiry = (datetime.utcnow().date() + timedelta(days=45)).isoformat()
-    chain = _equity_chain_fixture(expiry)
-
-    monkeypatch.setattr(chains_adapter, "get_chain", lambda sym, expiry=None: chain)
-    monkeypatch.setattr(chains_module, "get_chain", lambda sym, expiry=None: chain)
+    assert idea.spread_width == 5.0
+
+
+def test_trade_ideas_cli_equity_includes_delta(
+    monkeypatch,
+    equity_expiry_and_chain,
+    patched_equity_chain,
+    make_scan_row,
+    cli_module,
+    cli_runner,
+    json_array,
+    tmp_path,
+):
+    monkeypatch.chdir(tmp_path)  # keep the CLI's last-ideas write off the tracked copy
+    expiry, _ = equity_expiry_and_chain
+    chain = patched_equity_chain
     monkeypatch.setattr("stratdeck.cli.get_watchlist_symbols", lambda name: ["AMZN"])
     monkeypatch.setattr(
         chains_adapter.ChainPricingAdapter,
@@ -448,7 +435,7 @@ def test_trade_ideas_cli_equity_includes_delta(monkeypatch):
     def _fake_build_trade_ideas_for_tasks(tasks, strategy_hint, dte_target, max_per_symbol):
         planner = TradePlanner()
         return planner.generate_from_scan_results_with_strategies(
-            scan_rows=[_scan_row("AMZN", 100.0, 120.0, ivr=0.35)],
+            scan_rows=[make_scan_row("AMZN", 100.0, 120.0, ivr=0.35)],
             tasks=tasks,
             dte_target=dte_target,
             max_per_symbol=max_per_symbol,
@@ -456,11 +443,7 @@ def test_trade_ideas_cli_equity_includes_delta(monkeypatch):
 
     monkeypatch.setattr(cli_module, "_build_trade_ideas_for_tasks", _fake_build_trade_ideas_for_tasks)
 
-    runner = CliRunner()
-    env = os.environ.copy()
-    env["STRATDECK_DATA_MODE"] = "mock"
-
-    result = runner.invoke(
+    result = cli_runner.invoke(
         cli_module.cli,
         [
             "trade-ideas",
@@ -472,22 +455,14 @@ def test_trade_ideas_cli_equity_includes_delta(monkeypatch):
             "1",
             "--json-output",
         ],
-        env=env,
     )
 
     assert result.exit_code == 0, result.output
 
-    lines = result.output.splitlines()
-    try:
-        start_idx = next(i for i, line in enumerate(lines) if line.strip() == "[")
-        end_idx = len(lines) - 1 - next(i for i, line in enumerate(reversed(lines)) if line.strip() == "]")
-    except StopIteration:
-        assert False, result.output
-
-    payload = json.loads("\n".join(lines[start_idx : end_idx + 1]))
+    payload = json_array(result.output)
     assert isinstance(payload, list) and payload
     idea = payload[0]
     assert idea.get("dte") is not None
-    assert idea.get("spread_width") == pytest.approx(5.0)
+    assert idea.get("spread_width") == 5.0
     short_legs = [leg for leg in idea.get("legs", []) if leg.get("side") == "short"]
     assert short_legs and short_legs[0].get("delta") is not None
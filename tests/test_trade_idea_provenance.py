@@ -0,0 +1,38 @@
+import pytest
+
+from stratdeck.agents.trade_planner import TradePlanner
+from stratdeck.strategies import load_strategy_config
+from stratdeck.strategy_engine import (
+    build_strategy_universe_assignments,
+    build_symbol_strategy_tasks,
+)
+
+
+@pytest.fixture(scope="module")
+def spx_index_core_tasks():
+    """SPX tasks for short_put_spread_index_45d on index_core, parsed from YAML once."""
+    cfg = load_strategy_config()
+    assignments = [
+        a
+        for a in build_strategy_universe_assignments(
+            cfg=cfg, tasty_watchlist_resolver=lambda name, max_symbols: []
+        )
+        if a.universe.name == "index_core" and a.strategy.name == "short_put_spread_index_45d"
+    ]
+    return [t for t in build_symbol_strategy_tasks(assignments) if t.symbol == "SPX"]
+
+
+def test_trade_idea_provenance_includes_strategy_context(spx_index_core_tasks, make_scan_row):
+    assert spx_index_core_tasks
+
+    planner = TradePlanner()
+    ideas = planner.generate_from_scan_results_with_strategies(
+        scan_rows=[make_scan_row("SPX", 5800.0, 6000.0, ivr=0.4)],
+        tasks=spx_index_core_tasks,
+    )
+
+    assert ideas and len(ideas) == 1
+    idea = ideas[0]
+    assert idea.strategy_id == "short_put_spread_index_45d"
+    assert idea.universe_id == "index_core"
+    assert "[provenance] template=short_put_spread_index_45d universe=index_core" in idea.notes
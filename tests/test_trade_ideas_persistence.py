@@ -1,19 +1,15 @@
 import json
-import os
+import math
 from pathlib import Path
 
-from click.testing import CliRunner
+from stratdeck.tools.ideas import DISABLE_PERSIST_ENV, load_last_ideas, persist_last_ideas
 
-from stratdeck import cli
 
-
-def test_trade_ideas_writes_last_file():
-    runner = CliRunner()
-    env = os.environ.copy()
-    env["STRATDECK_DATA_MODE"] = "mock"
-
-    result = runner.invoke(
-        cli.cli,
+def test_trade_ideas_writes_last_file(cli_module, cli_runner, json_array, tmp_path, monkeypatch):
+    # The CLI writes to a cwd-relative path; keep it off the tracked copy.
+    monkeypatch.chdir(tmp_path)
+    result = cli_runner.invoke(
+        cli_module.cli,
         [
             "trade-ideas",
             "--universe",
@@ -22,34 +18,51 @@ def test_trade_ideas_writes_last_file():
             "short_put_spread_index_45d",
             "--json-output",
         ],
-        env=env,
     )
 
     assert result.exit_code == 0, result.output
 
-    lines = result.output.splitlines()
-    try:
-        start_idx = next(i for i, line in enumerate(lines) if line.strip() == "[")
-        end_idx = len(lines) - 1 - next(
-            i for i, line in enumerate(reversed(lines)) if line.strip() == "]"
-        )
-    except StopIteration:
-        assert False, result.output
-
-    payload_text = "\n".join(lines[start_idx : end_idx + 1])
-    ideas_stdout = json.loads(payload_text)
+    ideas_stdout = json_array(result.output)
     assert isinstance(ideas_stdout, list)
 
     last_path = Path(".stratdeck/last_trade_ideas.json")
     assert last_path.exists()
 
-    ideas_file = json.loads(last_path.read_text())
-
-    assert ideas_file == ideas_stdout
+    # persist_last_ideas writes with the same json.dumps settings the CLI
+    # echoes, so the file text is compared rather than decoded a second time.
+    assert last_path.read_text(encoding="utf-8") == json.dumps(ideas_stdout, indent=2, default=str)
     if ideas_stdout:
         sample = ideas_stdout[0]
         assert "ivr" in sample
-        assert ideas_file[0].get("ivr") == sample.get("ivr")
         assert "strategy_id" in sample
         assert "universe_id" in sample
         assert "filters_passed" in sample
+
+
+def test_persist_last_ideas_round_trips(tmp_path):
+    ideas = [
+        {"symbol": "SPX", "strategy_id": "short_put_spread_index_45d", "ivr": 0.35, "filters_passed": True},
+        {"symbol": "XSP", "strategy_id": "short_put_spread_index_45d", "ivr": 0.31, "filters_passed": True},
+    ]
+    path = tmp_path / ".stratdeck" / "last_trade_ideas.json"
+
+    assert persist_last_ideas(ideas, path=path) is True
+    assert load_last_ideas(path) == ideas
+
+
+def test_persist_last_ideas_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv(DISABLE_PERSIST_ENV, "1")
+    path = tmp_path / "last_trade_ideas.json"
+
+    assert persist_last_ideas([{"symbol": "SPX"}], path=path) is False
+    assert not path.exists()
+
+
+def test_load_last_ideas_accepts_non_finite_floats(tmp_path):
+    path = tmp_path / "last_trade_ideas.json"
+    persist_last_ideas([{"symbol": "SPX", "ivr": float("nan")}], path=path)
+
+    ideas = load_last_ideas(path)
+
+    assert ideas[0]["symbol"] == "SPX"
+    assert math.isnan(ideas[0]["ivr"])
@@ -21,30 +21,6 @@ class StubChains:
         return {"pop": 0.7, "credit_per_width": 0.35, "credit": 0.7}
 
 
-def _scan_row(symbol: str, low: float, high: float, ivr, trend: str = "uptrend"):
-    return {
-        "symbol": symbol,
-        "ivr": ivr,
-        "ta_directional_bias": "bullish",
-        "ta_vol_bias": "normal",
-        "strategy_hint": "short_premium_range",
-        "ta": {
-            "scores": {
-                "directional_bias": "bullish",
-                "vol_bias": "normal",
-                "ta_bias": 0.0,
-            },
-            "structure": {
-                "support": [low],
-                "resistance": [high],
-                "range": {"low": low, "high": high, "in_range": True},
-            },
-            "trend_regime": {"state": trend},
-            "vol_regime": {"state": "normal"},
-        },
-    }
-
-
 def _task():
     source = UniverseSource(type=UniverseSourceType.STATIC, tickers=["SPX"])
     universe = UniverseConfig(
@@ -63,12 +39,11 @@ def _task():
     return SymbolStrategyTask(symbol="SPX", strategy=strategy, universe=universe)
 
 
-def test_trade_planner_filters_pass(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
+def test_trade_planner_filters_pass(make_scan_row):
     planner = TradePlanner(chains_client=StubChains())
     task = _task()
 
-    passing = _scan_row("SPX", 100.0, 110.0, ivr=0.35)
+    passing = make_scan_row("SPX", 100.0, 110.0, ivr=0.35)
 
     ideas = planner.generate_from_scan_results_with_strategies(
         scan_rows=[passing],
@@ -85,12 +60,11 @@ def test_trade_planner_filters_pass(monkeypatch):
     assert idea.filters_applied["min_pop"] == pytest.approx(0.55)
 
 
-def test_trade_planner_filters_fail(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
+def test_trade_planner_filters_fail(make_scan_row):
     planner = TradePlanner(chains_client=StubChains())
     task = _task()
 
-    failing = _scan_row("SPX", 100.0, 110.0, ivr=0.1)
+    failing = make_scan_row("SPX", 100.0, 110.0, ivr=0.1)
 
     ideas = planner.generate_from_scan_results_with_strategies(
         scan_rows=[failing],
@@ -102,12 +76,11 @@ def test_trade_planner_filters_fail(monkeypatch):
     assert ideas == []
 
 
-def test_trade_planner_regime_filters_fail(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
+def test_trade_planner_regime_filters_fail(make_scan_row):
     planner = TradePlanner(chains_client=StubChains())
     task = _task()
 
-    failing = _scan_row("SPX", 100.0, 110.0, ivr=0.35, trend="downtrend")
+    failing = make_scan_row("SPX", 100.0, 110.0, ivr=0.35, trend="downtrend")
 
     ideas = planner.generate_from_scan_results_with_strategies(
         scan_rows=[failing],
@@ -1,100 +1,70 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
 
 import pytest
 
-from stratdeck.agents.trade_planner import (
-    TradePlanner,
-    resolve_underlying_price_hint,
-)
-
-
-def _scan_row(symbol: str, low: float, high: float) -> Dict:
-    support: List[float] = [low]
-    resistance: List[float] = [high]
-    return {
-        "symbol": symbol,
-        "ta_directional_bias": "bullish",
-        "ta_vol_bias": "normal",
-        "strategy_hint": "short_premium_range",
-        "ta": {
-            "scores": {
-                "directional_bias": "bullish",
-                "vol_bias": "normal",
-                "ta_bias": 0.0,
-            },
-            "structure": {
-                "support": support,
-                "resistance": resistance,
-                "range": {
-                    "low": low,
-                    "high": high,
-                    "in_range": True,
-                    "position_in_range": 0.5,
-                },
-            },
-            "trend_regime": {"state": "uptrend"},
-            "vol_regime": {"state": "normal"},
-        },
-    }
-
-
-def test_underlying_hint_uses_ta_in_mock_mode(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "mock")
-    planner = TradePlanner()
-    ideas = planner.generate_from_scan_results([_scan_row("SPY", 100.0, 110.0)])
-    assert len(ideas) == 1
-    assert ideas[0].underlying_price_hint == pytest.approx(105.0)
+from stratdeck.agents.trade_planner import resolve_underlying_price_hint
+from stratdeck.data import factory
+from stratdeck.data.live_quotes import QuoteSnapshot
+from stratdeck.data.tasty_provider import TastyProvider
 
 
-def test_underlying_hint_live_prefers_mid_quote(monkeypatch):
-    monkeypatch.setenv("STRATDECK_DATA_MODE", "live")
-    calls: List[str] = []
+@pytest.fixture(scope="session")
+def make_provider():
+    """Build a quote provider returning one fixed quote; ``raise_for`` symbols raise ``error``."""
+
+    class QuoteProvider:
+        def __init__(self, quote: Dict, raise_for: Optional[Set[str]] = None, error: str = "boom"):
+            self.quote = quote
+            self.raise_for = raise_for or set()
+            self.error = error
+            self.calls: List[str] = []
 
-    class FakeProvider:
         def get_quote(self, symbol: str):
-            calls.append(symbol)
-            return {"mid": 4321.0, "last": 4300.0}
+            self.calls.append(symbol)
+            if symbol in self.raise_for:
+                raise RuntimeError(self.error)
+            return self.quote
+
+    return QuoteProvider
 
-    monkeypatch.setattr("stratdeck.data.factory.get_provider", lambda: FakeProvider())
 
-    planner = TradePlanner()
-    ideas = planner.generate_from_scan_results([_scan_row("SPX", 4300.0, 4400.0)])
+def test_underlying_hint_uses_ta_in_mock_mode(planner, make_scan_row):
+    ideas = planner.generate_from_scan_results([make_scan_row("SPY", 100.0, 110.0)])
     assert len(ideas) == 1
-    idea = ideas[0]
-    assert idea.underlying_price_hint == pytest.approx(4321.0)
-    assert calls == ["SPX"]
+    assert ideas[0].underlying_price_hint == pytest.approx(105.0)
 
 
-def test_underlying_hint_live_falls_back_to_last(monkeypatch):
+def test_underlying_hint_live_prefers_mid_quote(planner, monkeypatch, make_scan_row, make_provider):
     monkeypatch.setenv("STRATDECK_DATA_MODE", "live")
-    calls: List[str] = []
+    provider = make_provider({"mid": 4321.0, "last": 4300.0})
+    monkeypatch.setattr(factory, "get_provider", lambda: provider)
+
+    ideas = planner.generate_from_scan_results([make_scan_row("SPX", 4300.0, 4400.0)])
+    assert len(ideas) == 1
+    idea = ideas[0]
+    assert idea.underlying_price_hint == pytest.approx(4321.0)
+    assert provider.calls == ["SPX"]
 
-    class FakeProvider:
-        def get_quote(self, symbol: str):  # pragma: no cover - used via planner
-            calls.append(symbol)
-            return {"mid": None, "last": 640.0}
 
-    monkeypatch.setattr("stratdeck.data.factory.get_provider", lambda: FakeProvider())
+def test_underlying_hint_live_falls_back_to_last(planner, monkeypatch, make_scan_row, make_provider):
+    monkeypatch.setenv("STRATDECK_DATA_MODE", "live")
+    provider = make_provider({"mid": None, "last": 640.0})
+    monkeypatch.setattr(factory, "get_provider", lambda: provider)
 
-    planner = TradePlanner()
-    ideas = planner.generate_from_scan_results([_scan_row("XSP", 630.0, 670.0)])
+    ideas = planner.generate_from_scan_results([make_scan_row("XSP", 630.0, 670.0)])
     assert len(ideas) == 1
     idea = ideas[0]
     assert idea.underlying_price_hint == pytest.approx(640.0)
-    assert calls == ["XSP"]
+    assert provider.calls == ["XSP"]
 
 
-def test_resolve_underlying_price_hint_prefers_live_over_ta(caplog):
+def test_resolve_underlying_price_hint_prefers_live_over_ta(caplog, make_provider):
     caplog.set_level("INFO")
 
-    class FakeProvider:
-        def get_quote(self, symbol: str):
-            return {"mid": 123.45, "mark": 120.0, "last": 119.0}
-
     price = resolve_underlying_price_hint(
         symbol="SPX",
         data_symbol="^GSPC",
-        provider=FakeProvider(),
+        provider=make_provider({"mid": 123.45, "mark": 120.0, "last": 119.0}),
         ta_price_hint=111.0,
     )
 
@@ -102,6 +72,27 @@ def test_resolve_underlying_price_hint_prefers_live_over_ta(caplog):
     assert any("live quote used" in rec.message for rec in caplog.records)
 
 
+def test_resolve_underlying_price_hint_uses_dxlink_snapshot_quote(caplog):
+    caplog.set_level("INFO")
+
+    class LiveQuotes:
+        def get_snapshot(self, symbol: str):
+            return QuoteSnapshot(symbol=symbol, bid=499.0, ask=501.0, mid=500.0, asof=0.0)
+
+    provider = TastyProvider.__new__(TastyProvider)
+    provider._live_quotes = LiveQuotes()
+
+    price = resolve_underlying_price_hint(
+        symbol="SPY",
+        data_symbol="SPY",
+        provider=provider,
+        ta_price_hint=111.0,
+    )
+
+    assert price == pytest.approx(500.0)
+    assert any("live quote used" in rec.message for rec in caplog.records)
+
+
 def test_resolve_underlying_price_hint_uses_ta_when_provider_missing():
     price = resolve_underlying_price_hint(
         symbol="AAPL",
@@ -112,64 +103,46 @@ def test_resolve_underlying_price_hint_uses_ta_when_provider_missing():
     assert price == pytest.approx(150.5)
 
 
-def test_resolve_underlying_price_hint_falls_back_to_ta_on_error():
-    class FailingProvider:
-        def get_quote(self, symbol: str):
-            raise RuntimeError("boom")
-
+def test_resolve_underlying_price_hint_falls_back_to_ta_on_error(make_provider):
     price = resolve_underlying_price_hint(
         symbol="AAPL",
         data_symbol="AAPL",
-        provider=FailingProvider(),
+        provider=make_provider({}, raise_for={"AAPL"}),
         ta_price_hint=151.5,
     )
     assert price == pytest.approx(151.5)
 
 
-def test_resolve_underlying_price_hint_handles_mark_and_last():
-    class MarkOnlyProvider:
-        def get_quote(self, symbol: str):
-            return {"mid": None, "mark": 55.0, "last": 50.0}
-
+def test_resolve_underlying_price_hint_handles_mark_and_last(make_provider):
     price_mark = resolve_underlying_price_hint(
         symbol="MSFT",
         data_symbol="MSFT",
-        provider=MarkOnlyProvider(),
+        provider=make_provider({"mid": None, "mark": 55.0, "last": 50.0}),
         ta_price_hint=None,
     )
     assert price_mark == pytest.approx(55.0)
 
-    class LastOnlyProvider:
-        def get_quote(self, symbol: str):
-            return {"mid": None, "mark": None, "last": 44.0}
-
     price_last = resolve_underlying_price_hint(
         symbol="MSFT",
         data_symbol="MSFT",
-        provider=LastOnlyProvider(),
+        provider=make_provider({"mid": None, "mark": None, "last": 44.0}),
         ta_price_hint=None,
     )
     assert price_last == pytest.approx(44.0)
 
 
-def test_resolve_underlying_price_hint_spx_fallback_to_xsp(caplog):
+def test_resolve_underlying_price_hint_spx_fallback_to_xsp(caplog, make_provider):
     caplog.set_level("INFO")
-    calls: List[str] = []
-
-    class FakeProvider:
-        def get_quote(self, symbol: str):
-            calls.append(symbol)
-            if symbol == "SPX":
-                raise RuntimeError("rate limit")
-            return {"mid": 42.0}
+    provider = make_provider({"mid": 42.0}, raise_for={"SPX"}, error="rate limit")
 
     price = resolve_underlying_price_hint(
         symbol="SPX",
         data_symbol="SPX",
-        provider=FakeProvider(),
+        provider=provider,
         ta_price_hint=None,
     )
 
+    calls = provider.calls
     assert price == pytest.approx(420.0)
     assert calls[0] == "SPX"
     assert calls[-1] == "XSP"
@@ -178,17 +151,13 @@ def test_resolve_underlying_price_hint_spx_fallback_to_xsp(caplog):
     assert any("spx fallback via xsp" in rec.message for rec in caplog.records)
 
 
-def test_resolve_underlying_price_hint_warns_when_live_and_ta_missing(caplog):
+def test_resolve_underlying_price_hint_warns_when_live_and_ta_missing(caplog, make_provider):
     caplog.set_level("WARNING")
 
-    class EmptyProvider:
-        def get_quote(self, symbol: str):
-            return {"mid": None, "mark": None, "last": None}
-
     price = resolve_underlying_price_hint(
         symbol="QQQ",
         data_symbol="QQQ",
-        provider=EmptyProvider(),
+        provider=make_provider({"mid": None, "mark": None, "last": None}),
         ta_price_hint=None,
     )
 
@@ -1,41 +1,61 @@
+import random
+
 import pytest
 
-from stratdeck.vetting import VetVerdict, VettingInputs, vet_from_inputs
+from stratdeck.agents.trade_planner import TradeIdea, TradeLeg
+from stratdeck.filters.human_rules import StrategyRuleSnapshot
+from stratdeck.vetting import (
+    _extract_short_delta,
+    VetVerdict,
+    VettingInputs,
+    vet_batch,
+    vet_batch_parallel,
+    vet_batch_vectorized,
+    vet_from_inputs,
+    vet_single_idea,
+)
+
+
+_BASE_VETTING_KWARGS = dict(
+    symbol="SPX",
+    strategy_id="short_put_spread_index_45d",
+    strategy_type="short_put_spread",
+    direction="bullish",
+    dte=45,
+    spread_width=5.0,
+    short_delta=0.30,
+    ivr=0.45,
+    pop=0.62,
+    credit_per_width=0.30,
+    dte_target=45,
+    dte_min=40,
+    dte_max=50,
+    expected_spread_width=5.0,
+    target_short_delta=0.30,
+    short_delta_min=0.25,
+    short_delta_max=0.35,
+    ivr_floor=0.25,
+    pop_floor=0.55,
+    credit_per_width_floor=0.25,
+    allowed_trend_regimes=["uptrend", "range"],
+    trend_regime="uptrend",
+    vol_regime="normal",
+)
 
 
 def _base_inputs(**overrides):
-    data = dict(
-        symbol="SPX",
-        strategy_id="short_put_spread_index_45d",
-        strategy_type="short_put_spread",
-        direction="bullish",
-        dte=45,
-        spread_width=5.0,
-        short_delta=0.30,
-        ivr=0.45,
-        pop=0.62,
-        credit_per_width=0.30,
-        dte_target=45,
-        dte_min=40,
-        dte_max=50,
-        expected_spread_width=5.0,
-        target_short_delta=0.30,
-        short_delta_min=0.25,
-        short_delta_max=0.35,
-        ivr_floor=0.25,
-        pop_floor=0.55,
-        credit_per_width_floor=0.25,
-        allowed_trend_regimes=["uptrend", "range"],
-        trend_regime="uptrend",
-        vol_regime="normal",
-    )
-    data.update(overrides)
-    return VettingInputs(**data)
+    # Vetting only reads its inputs, so the template's lists can be shared.
+    return VettingInputs(**{**_BASE_VETTING_KWARGS, **overrides})
 
 
-def test_vetting_accept_strong_candidate():
-    inputs = _base_inputs()
-    vetting = vet_from_inputs(inputs)
+@pytest.fixture(scope="module")
+def strong_candidate_vetting():
+    """Vetting of the unmodified baseline inputs; tests only read it."""
+    return vet_from_inputs(_base_inputs())
+
+
+def test_vetting_accept_strong_candidate(strong_candidate_vetting):
+    vetting = strong_candidate_vetting
 
     assert vetting.verdict == VetVerdict.ACCEPT
     assert vetting.score > 70
@@ -61,11 +81,194 @@ def test_vetting_reject_on_rule_violation():
     assert any("IVR" in r for r in vetting.reasons)
 
 
-def test_vetting_borderline_case():
+def test_vetting_borderline_case(strong_candidate_vetting):
     inputs = _base_inputs(credit_per_width=0.251, pop=0.61)
     vetting = vet_from_inputs(inputs)
 
     assert vetting.verdict == VetVerdict.BORDERLINE
     assert any("borderline" in r.lower() for r in vetting.reasons)
     assert any("credit/width" in r for r in vetting.reasons)
-    assert vetting.score < vet_from_inputs(_base_inputs()).score
+    assert vetting.score < strong_candidate_vetting.score
+
+
+def test_vet_batch_vectorized_matches_scalar():
+    rules = {
+        "tight": StrategyRuleSnapshot(
+            strategy_key="tight",
+            dte_target=45,
+            dte_min=40,
+            dte_max=50,
+            expected_spread_width=5.0,
+            target_short_delta=0.30,
+            short_delta_min=0.25,
+            short_delta_max=0.35,
+            ivr_floor=0.25,
+            pop_floor=0.55,
+            credit_per_width_floor=0.25,
+            allowed_trend_regimes=["uptrend"],
+        ),
+        "loose": StrategyRuleSnapshot(strategy_key="loose", ivr_floor=0.20),
+    }
+    rng = random.Random(7)
+    ideas = []
+    for _ in range(60):
+        ideas.append(
+            {
+                "symbol": rng.choice(["SPX", "XSP", "QQQ"]),
+                "strategy_id": rng.choice(["tight", "loose", "unknown"]),
+                "dte": rng.choice([None, 38, 40, 41, 45, 47, 52]),
+                "spread_width": rng.choice([None, 5.0, 10.0]),
+                "short_delta": rng.choice([None, 0.24, 0.26, 0.30, 0.33, 0.36]),
+                "ivr": rng.choice([None, 0.10, 0.26, 0.29, 0.5]),
+                "pop": rng.choice([None, 0.50, 0.56, 0.58, 0.7]),
+                "credit_per_width": rng.choice([None, 0.2, 0.255, 0.28, 0.4]),
+                "trend_regime": rng.choice([None, "uptrend", "downtrend"]),
+            }
+        )
+
+    def lookup(key):
+        return rules[key]
+
+    expected = vet_batch(ideas, rules_lookup=lookup)
+    actual = vet_batch_vectorized(ideas, rules_lookup=lookup)
+
+    assert [id(i) for i, _ in actual] == [id(i) for i, _ in expected]
+    assert [v for _, v in actual] == [v for _, v in expected]
+
+
+def test_vet_batch_looks_up_each_strategy_once():
+    calls = []
+
+    def lookup(key):
+        calls.append(key)
+        if key == "broken":
+            raise KeyError(key)
+        return StrategyRuleSnapshot(strategy_key=key, ivr_floor=0.2)
+
+    ideas = [
+        {"symbol": "SPX", "strategy_id": "a", "ivr": 0.3},
+        {"symbol": "XSP", "strategy_id": "broken", "ivr": 0.3},
+        {"symbol": "QQQ", "strategy_id": "a", "ivr": 0.1},
+        {"symbol": "IWM", "ivr": 0.3},
+    ]
+    vetted = vet_batch(ideas, rules_lookup=lookup)
+
+    assert sorted(calls) == ["a", "broken"]
+    assert [idea["symbol"] for idea, _ in vetted] == ["SPX", "QQQ"]
+    assert [v.verdict for _, v in vetted] == [VetVerdict.ACCEPT, VetVerdict.REJECT]
+
+
+def test_vet_batch_parallel_matches_sequential():
+    rules = StrategyRuleSnapshot(
+        strategy_key="s", dte_min=40, dte_max=50, ivr_floor=0.25, pop_floor=0.55
+    )
+    rng = random.Random(3)
+    ideas = [
+        {
+            "symbol": f"SYM{i}",
+            "strategy_id": "s" if i % 7 else None,
+            "dte": rng.randint(35, 55),
+            "ivr": rng.uniform(0.1, 0.6),
+            "pop": rng.uniform(0.4, 0.8),
+        }
+        for i in range(300)
+    ]
+
+    def lookup(key):
+        return rules
+
+    expected = vet_batch(ideas, rules_lookup=lookup)
+    actual = vet_batch_parallel(ideas, rules_lookup=lookup, workers=2)
+
+    assert [i["symbol"] for i, _ in actual] == [i["symbol"] for i, _ in expected]
+    assert [v for _, v in actual] == [v for _, v in expected]
+
+
+def test_extract_short_delta_falls_back_to_short_legs():
+    leg = TradeLeg(side="short", type="put", strike=100.0, expiry="2025-01-17", quantity=1, delta=0.28)
+    idea = TradeIdea(
+        symbol="SPX",
+        data_symbol="SPX",
+        trade_symbol="SPX",
+        strategy="short_put_spread",
+        direction="bullish",
+        vol_context="normal",
+        rationale="",
+        legs=[leg],
+        short_legs=[leg],
+    )
+
+    assert _extract_short_delta(idea) == 0.28
+    assert _extract_short_delta({"short_legs": [{"delta": None}, {"delta": 0.31}]}) == 0.31
+    assert _extract_short_delta({"short_put_delta": 0.2, "short_legs": [{"delta": 0.31}]}) == 0.2
+    assert _extract_short_delta({}) is None
+
+
+def test_vet_single_idea_reuses_cached_result_for_duplicate_ideas():
+    rules = StrategyRuleSnapshot(strategy_key="s", dte_min=40, dte_max=50, ivr_floor=0.25)
+    idea = {"symbol": "SPX", "strategy_id": "s", "dte": 45, "ivr": 0.4}
+
+    first = vet_single_idea(idea, rules)
+    second = vet_single_idea(dict(idea), rules)
+    assert first == second
+    assert first is not second
+    first.reasons.append("mutated")
+    assert "mutated" not in second.reasons
+
+    as_float = vet_single_idea(dict(idea, dte=45.0), rules)
+    assert as_float == second
+    assert "DTE 45," in first.rationale
+
+
+@pytest.mark.parametrize(
+    "idea",
+    [
+        pytest.param({"dte": 45, "spread_width": 5, "short_delta": 0.1}, id="int"),
+        pytest.param({"dte": 45.0, "spread_width": 5.0, "short_delta": 0.1}, id="float"),
+        pytest.param({"dte": "45", "spread_width": "5", "short_delta": "0.1"}, id="str"),
+    ],
+)
+def test_vet_single_idea_coerces_numeric_dict_fields(idea):
+    rules = StrategyRuleSnapshot.model_construct(
+        strategy_key="s", dte_min=40.0, dte_max=50.0, expected_spread_width=10, short_delta_min=1
+    )
+
+    vetting = vet_single_idea({"symbol": "SPX", "strategy_id": "s", **idea}, rules)
+
+    assert "DTE 45 within [40, 50]" in vetting.reasons
+    assert "Width 5.0 matches expected 10.0" in vetting.reasons
+    assert "Short leg delta 0.10 below min 1.0" in vetting.reasons
+
+
+def test_regime_reasons_keep_configured_allowlist_order():
+    vetting = vet_from_inputs(
+        _base_inputs(
+            trend_regime="downtrend",
+            allowed_trend_regimes=["uptrend", "range"],
+            vol_regime="low",
+            allowed_vol_regimes=["normal", "high"],
+        )
+    )
+
+    assert "trend_regime 'downtrend' not allowed ['uptrend', 'range']" in vetting.reasons
+    assert "vol_regime 'low' not allowed ['normal', 'high']" in vetting.reasons
+
+
+def test_vetting_inputs_rejects_fractional_dte():
+    with pytest.raises(ValueError):
+        VettingInputs(dte=45.5)
+
+
+def test_vet_batch_return_stats_counts_verdicts():
+    rules = StrategyRuleSnapshot(strategy_key="s", ivr_floor=0.25)
+    ideas = [
+        {"symbol": "SPX", "strategy_id": "s", "ivr": 0.5},
+        {"symbol": "XSP", "strategy_id": "s", "ivr": 0.26},
+        {"symbol": "QQQ", "strategy_id": "s", "ivr": 0.1},
+        {"symbol": "IWM", "strategy_id": "s", "ivr": 0.6},
+    ]
+
+    vetted, counts = vet_batch(ideas, rules_lookup=lambda key: rules, return_stats=True)
+
+    assert len(vetted) == 4
+    assert counts == {VetVerdict.ACCEPT: 2, VetVerdict.BORDERLINE: 1, VetVerdict.REJECT: 1}
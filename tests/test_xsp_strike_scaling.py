@@ -1,7 +1,5 @@
 import pytest
 
-from stratdeck.agents.trade_planner import TradePlanner
-
 
 def _short_and_long(legs):
     short = next(l for l in legs if l.side == "short")
@@ -9,8 +7,7 @@ def _short_and_long(legs):
     return short, long
 
 
-def test_spx_strikes_follow_support_levels():
-    planner = TradePlanner()
+def test_spx_strikes_follow_support_levels(planner):
     underlying = 6500.0
     support_levels = [6400.0, 6450.0]
     resistance_levels = [6600.0]
@@ -31,8 +28,7 @@ def test_spx_strikes_follow_support_levels():
     assert 0.9 < short_leg.strike / underlying < 1.0
 
 
-def test_xsp_strikes_respect_underlying_scale_when_levels_off():
-    planner = TradePlanner()
+def test_xsp_strikes_respect_underlying_scale_when_levels_off(planner):
     underlying = 650.0
     # TA levels on SPX scale (10×) should not drive XSP strikes.
     support_levels = [6400.0, 6420.0]
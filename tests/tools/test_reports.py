@@ -0,0 +1,31 @@
+import json
+import math
+
+import pytest
+
+from stratdeck.tools.reports import _parse_metrics
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        pytest.param(json.dumps({"pnl": 12.5, "credit": 1.2}), id="json"),
+        pytest.param(repr({"pnl": 12.5, "credit": 1.2}), id="legacy-repr"),
+    ],
+)
+def test_parse_metrics_reads_json_and_legacy_rows(raw):
+    assert _parse_metrics(raw) == {"pnl": 12.5, "credit": 1.2}
+
+
+def test_parse_metrics_accepts_nan_written_by_json_dumps():
+    raw = json.dumps({"pnl": float("nan"), "credit": 1.2})
+
+    metrics = _parse_metrics(raw)
+
+    assert math.isnan(metrics["pnl"])
+    assert metrics["credit"] == 1.2
+
+
+def test_parse_metrics_returns_empty_for_garbage():
+    assert _parse_metrics("") == {}
+    assert _parse_metrics("not metrics") == {}
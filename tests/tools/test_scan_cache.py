@@ -1,19 +1,35 @@
-from stratdeck.tools.scan_cache import attach_ivr_to_scan_rows
-
-
-def test_attach_ivr_to_scan_rows_accepts_nested_snapshot():
-    rows = [{"symbol": "SPX"}]
-    iv_snapshot = {"SPX": {"ivr": 0.32}}
+import pytest
+
+from stratdeck.tools.scan_cache import (
+    attach_ivr_to_scan_rows,
+    load_last_scan,
+    store_scan_rows,
+    store_trade_ideas,
+)
+
+
+@pytest.mark.parametrize(
+    "iv_snapshot, expected",
+    [
+        pytest.param({"SPX": {"ivr": 0.32}}, 0.32, id="nested"),
+        pytest.param({"IWM": 0.41}, 0.41, id="flat"),
+    ],
+)
+def test_attach_ivr_to_scan_rows(iv_snapshot, expected):
+    rows = [{"symbol": next(iter(iv_snapshot))}]
 
     result = attach_ivr_to_scan_rows(rows, iv_snapshot)
 
-    assert result[0]["ivr"] == 0.32
+    assert result[0]["ivr"] == expected
 
 
-def test_attach_ivr_to_scan_rows_accepts_flat_snapshot():
-    rows = [{"symbol": "IWM"}]
-    iv_snapshot = {"IWM": 0.41}
+def test_load_last_scan_returns_snapshot():
+    store_scan_rows([{"symbol": "SPX"}])
+    store_trade_ideas(["idea-1"])
+    snapshot = load_last_scan()
 
-    result = attach_ivr_to_scan_rows(rows, iv_snapshot)
+    store_scan_rows([{"symbol": "QQQ"}])
 
-    assert result[0]["ivr"] == 0.41
+    assert [r["symbol"] for r in snapshot.rows] == ["SPX"]
+    assert snapshot.ideas == ["idea-1"]
+    assert [r["symbol"] for r in load_last_scan().rows] == ["QQQ"]
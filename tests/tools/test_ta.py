@@ -0,0 +1,258 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stratdeck.tools.ta import _cluster_levels, _find_swing_points, atr, rsi, true_range
+
+
+def _ohlcv(n: int = 120, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + rng.normal(0, 0.5, size=n).cumsum()
+    return pd.DataFrame(
+        {
+            "open": close + rng.uniform(-0.3, 0.3, size=n),
+            "high": close + rng.uniform(0.2, 0.8, size=n),
+            "low": close - rng.uniform(0.2, 0.8, size=n),
+            "close": close,
+            "volume": rng.integers(1_000, 10_000, size=n),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="30min"),
+    )
+
+
+def _swing_points_reference(df, window):
+    highs, lows = df["high"], df["low"]
+    swing_highs, swing_lows = [], []
+    for i in range(window, len(df) - window):
+        if highs.iloc[i] == highs.iloc[i - window : i + window + 1].max():
+            swing_highs.append((df.index[i], highs.iloc[i]))
+        if lows.iloc[i] == lows.iloc[i - window : i + window + 1].min():
+            swing_lows.append((df.index[i], lows.iloc[i]))
+    return swing_lows, swing_highs
+
+
+def test_find_swing_points_matches_reference_loop():
+    df = _ohlcv()
+    df.iloc[10, df.columns.get_loc("high")] = np.nan
+    for window in (3, 5):
+        assert _find_swing_points(df, window) == _swing_points_reference(df, window)
+
+
+def test_find_swing_points_short_frame():
+    assert _find_swing_points(_ohlcv(n=5), window=3) == ([], [])
+
+
+def test_cluster_levels_merges_nearby_levels():
+    assert _cluster_levels([]) == []
+    assert _cluster_levels([100.0]) == [100.0]
+    clustered = _cluster_levels([100.1, 100.0, 105.0, 100.15, 105.1, 110.0])
+    assert clustered == pytest.approx([100.08333333, 105.05, 110.0])
+
+
+def test_true_range_matches_pandas_reference():
+    df = _ohlcv()
+    prev_close = df["close"].shift(1)
+    expected = pd.concat(
+        [df["high"] - df["low"], (df["high"] - prev_close).abs(), (df["low"] - prev_close).abs()],
+        axis=1,
+    ).max(axis=1)
+
+    pd.testing.assert_series_equal(true_range(df), expected, check_names=False)
+
+
+def _wilder_reference(values, period):
+    out = np.full(len(values), np.nan)
+    alpha = 1.0 / period
+    acc = values[0]
+    for i, value in enumerate(values):
+        acc = value if i == 0 else alpha * value + (1 - alpha) * acc
+        if i >= period - 1:
+            out[i] = acc
+    return out
+
+
+def test_atr_uses_wilder_smoothing():
+    df = _ohlcv()
+    expected = _wilder_reference(true_range(df).to_numpy(), 14)
+    np.testing.assert_allclose(atr(df, 14).to_numpy(), expected, equal_nan=True)
+
+
+def test_rsi_uses_wilder_smoothing():
+    close = _ohlcv()["close"]
+    delta = close.diff().fillna(0.0).to_numpy()
+    gain = _wilder_reference(np.where(delta > 0, delta, 0.0)[1:], 14)
+    loss = _wilder_reference(np.where(delta < 0, -delta, 0.0)[1:], 14)
+    expected = 100 - 100 / (1 + gain / (loss + 1e-9))
+
+    result = rsi(close, 14).to_numpy()[1:]
+    np.testing.assert_allclose(result, expected, equal_nan=True)
+
+
+def test_fused_kernel_matches_pandas_indicators():
+    from stratdeck.tools import _ta_kernels
+    from stratdeck.tools.ta import adx, bollinger_bandwidth, ema, macd
+
+    df = _ohlcv(n=200)
+    close = df["close"]
+    # Exercise the pure-Python body too when numba is installed.
+    kernel = getattr(_ta_kernels._compute_all, "py_func", _ta_kernels._compute_all)
+    arrays = _ta_kernels.IndicatorArrays(
+        *kernel(df["high"].to_numpy(), df["low"].to_numpy(), close.to_numpy())
+    )
+
+    expected = {
+        "tr": true_range(df),
+        "atr": atr(df, 14),
+        "adx": adx(df, 14),
+        "ema20": ema(close, 20),
+        "ema50": ema(close, 50),
+        "rsi": rsi(close, 14),
+        "macd_hist": macd(close, 12, 26, 9)[2],
+        "bbw": bollinger_bandwidth(close, 20, 2.0),
+    }
+    for name, series in expected.items():
+        np.testing.assert_allclose(
+            getattr(arrays, name), series.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name
+        )
+
+
+def test_cached_download_reuses_memory_and_disk(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from stratdeck.tools import ta
+
+    calls = []
+
+    def fake_download(symbol, **kwargs):
+        calls.append((symbol, kwargs["interval"], kwargs["period"]))
+        return _ohlcv(n=10)
+
+    monkeypatch.setattr(ta, "yf", SimpleNamespace(download=fake_download))
+    monkeypatch.setattr(ta, "_OHLCV_CACHE", {})
+    monkeypatch.setenv(ta.OHLCV_CACHE_DIR_ENV, str(tmp_path))
+
+    first = ta._cached_download("^GSPC", "30m", "60d")
+    second = ta._cached_download("^GSPC", "30m", "60d")
+    assert second is first
+    assert calls == [("^GSPC", "30m", "60d")]
+    assert len(list(tmp_path.glob("%5EGSPC/30m_60d/*.pkl"))) == 1
+
+    # A fresh process (empty memory cache) is served from disk.
+    monkeypatch.setattr(ta, "_OHLCV_CACHE", {})
+    from_disk = ta._cached_download("^GSPC", "30m", "60d")
+    pd.testing.assert_frame_equal(from_disk, first, check_freq=False)
+    assert len(calls) == 1
+
+
+def test_cached_download_replaces_previous_bucket(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from stratdeck.tools import ta
+
+    calls = []
+
+    def fake_download(symbol, **kwargs):
+        calls.append(symbol)
+        return _ohlcv(n=10)
+
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(ta, "yf", SimpleNamespace(download=fake_download))
+    monkeypatch.setattr(ta, "_OHLCV_CACHE", {})
+    monkeypatch.setattr(ta, "_ohlcv_ttl", lambda now=None: 60)
+    monkeypatch.setattr(ta.time, "time", lambda: clock["now"])
+    monkeypatch.setenv(ta.OHLCV_CACHE_DIR_ENV, str(tmp_path))
+
+    ta._cached_download("^GSPC", "30m", "60d")
+    clock["now"] += 60
+    ta._cached_download("^GSPC", "30m", "60d")
+
+    assert len(calls) == 2
+    assert list(ta._OHLCV_CACHE) == [("^GSPC", "30m", "60d")]
+    assert len(list(tmp_path.glob("%5EGSPC/30m_60d/*.pkl"))) == 1
+
+
+def test_cached_download_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from stratdeck.tools import ta
+
+    monkeypatch.setattr(ta, "yf", SimpleNamespace(download=lambda symbol, **kwargs: _ohlcv(n=10)))
+    monkeypatch.setattr(ta, "_OHLCV_CACHE", {})
+    monkeypatch.delenv(ta.OHLCV_CACHE_DIR_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    assert ta._cached_download("^GSPC", "30m", "60d") is not None
+    assert list(tmp_path.rglob("*")) == []
+
+
+def test_cached_download_keeps_similar_symbols_apart(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from stratdeck.tools import ta
+
+    monkeypatch.setattr(ta, "yf", SimpleNamespace(download=lambda symbol, **kwargs: _ohlcv(n=10)))
+    monkeypatch.setattr(ta, "_OHLCV_CACHE", {})
+    monkeypatch.setenv(ta.OHLCV_CACHE_DIR_ENV, str(tmp_path))
+
+    for symbol in ("BRK.B", "BRK_B", "BRK"):
+        ta._cached_download(symbol, "30m", "60d")
+
+    assert sorted(p.parent.parent.name for p in tmp_path.glob("*/*/*.pkl")) == ["BRK", "BRK.B", "BRK_B"]
+
+
+def test_analyze_many_matches_serial_analyze():
+    import threading
+
+    from stratdeck.tools.ta import ChartistEngine
+
+    class Client:
+        def __init__(self):
+            self.fetch_threads = set()
+
+        def get_ohlcv(self, symbol, timeframe, lookback_bars):
+            self.fetch_threads.add(threading.get_ident())
+            return _ohlcv(n=lookback_bars, seed=sum(map(ord, symbol)))
+
+    client = Client()
+    engine = ChartistEngine(data_client=client)
+    symbols = ["SPY", "QQQ", "IWM", "SPY"]
+
+    results = engine.analyze_many(symbols, max_workers=4)
+
+    assert list(results) == ["SPY", "QQQ", "IWM"]
+    # OHLCV is fetched on the calling thread; only the TA step is pooled.
+    assert client.fetch_threads == {threading.get_ident()}
+    for sym, result in results.items():
+        assert result.to_dict() == engine.analyze(sym).to_dict()
+
+
+def test_analyze_reports_structure_levels_at_full_precision():
+    from stratdeck.tools.ta import ChartistEngine, detect_structure
+
+    df = _ohlcv(n=200, seed=3)
+
+    class Client:
+        def get_ohlcv(self, symbol, timeframe, lookback_bars):
+            return df
+
+    result = ChartistEngine(data_client=Client()).analyze("SPY")
+
+    assert result.structure.to_dict() == detect_structure(df).to_dict()
+
+
+def test_talib_backend_is_opt_in(monkeypatch):
+    from types import SimpleNamespace
+
+    from stratdeck.tools import ta
+
+    close = _ohlcv()["close"]
+    fake = SimpleNamespace(RSI=lambda values, timeperiod: np.full(values.size, 50.0))
+    monkeypatch.setattr(ta, "talib", fake)
+
+    monkeypatch.delenv(ta.TA_BACKEND_ENV, raising=False)
+    assert not np.allclose(ta.rsi(close, 14).to_numpy()[20:], 50.0)
+
+    monkeypatch.setenv(ta.TA_BACKEND_ENV, "talib")
+    result = ta.rsi(close, 14)
+    assert (result == 50.0).all()
+    assert result.index.equals(close.index)